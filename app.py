@@ -12,6 +12,11 @@ import config
 from utils.youtube_api import YouTubeAPI
 from utils.text_processor import TextProcessor
 from utils.visualizer import Visualizer
+from utils.figure_cache import figure_cache
+from utils.wordcloud_cache import render_cache
+from utils.channel_stats import COUNT_COLUMNS, build_channel_stats
+from utils.channel_leaderboard import LEADERBOARD_ORDERS, ChannelLeaderboard
+from utils.keyword_scoring import RANKING_MODES
 
 # 페이지 설정
 st.set_page_config(
@@ -320,7 +325,7 @@ def setup_sidebar():
         # 분석 모드 선택
         analysis_mode = st.radio(
             "📊 분석 모드",
-            ["전체 트렌딩", "카테고리별 분석", "키워드 검색"],
+            ["전체 트렌딩", "카테고리별 분석", "키워드 검색", "로컬 검색"],
             help="분석하고 싶은 데이터의 종류를 선택하세요"
         )
         
@@ -331,6 +336,8 @@ def setup_sidebar():
             st.info("ℹ️ **YouTube API 제한**: 카테고리별 동영상은 최대 **50개**까지만 제공됩니다")
         elif analysis_mode == "키워드 검색":
             st.success("✅ **확장 가능**: 키워드 검색은 최대 **200개**까지 수집 가능합니다")
+        elif analysis_mode == "로컬 검색":
+            st.success("✅ **할당량 0**: 지금까지 수집한 동영상에서 검색합니다 (API 호출 없음)")
         
         st.divider()
         
@@ -352,6 +359,31 @@ def setup_sidebar():
             )
             st.session_state.search_query = search_query
         
+        elif analysis_mode == "로컬 검색":
+            local_query = st.text_input(
+                "검색 키워드",
+                placeholder="예: 뉴진스 컴백, 손흥민...",
+                help="수집해 둔 동영상의 제목·설명·태그에서 검색합니다 (모든 키워드 포함)"
+            )
+            st.session_state.local_query = local_query
+            
+            local_categories = st.multiselect(
+                "카테고리 조건",
+                options=list(config.CATEGORY_MAPPING.keys()),
+                format_func=lambda x: config.CATEGORY_MAPPING[x],
+                placeholder="전체 카테고리"
+            )
+            st.session_state.local_categories = local_categories
+            
+            use_date_range = st.checkbox("게시일 조건 사용")
+            local_date_range = None
+            if use_date_range:
+                today = datetime.now().date()
+                selected_dates = st.date_input("게시일 범위", value=(today - timedelta(days=30), today))
+                if isinstance(selected_dates, (list, tuple)) and len(selected_dates) == 2:
+                    local_date_range = tuple(selected_dates)
+            st.session_state.local_date_range = local_date_range
+        
         st.session_state.analysis_mode = analysis_mode
         
         # 데이터 수집 설정
@@ -361,6 +393,9 @@ def setup_sidebar():
         if analysis_mode == "키워드 검색":
             max_limit = 200
             default_value = min(config.MAX_RESULTS, 200)
+        elif analysis_mode == "로컬 검색":
+            max_limit = config.LOCAL_SEARCH_MAX_RESULTS
+            default_value = min(config.SEARCH_RESULTS_LIMIT, max_limit)
         else:  # 전체 트렌딩, 카테고리별 분석
             max_limit = 50
             default_value = min(config.MAX_RESULTS, 50)
@@ -396,6 +431,16 @@ def setup_sidebar():
         )
         st.session_state.min_word_length = min_word_length
         
+        dedup_labels = list(config.KEYWORD_DEDUP_OPTIONS.keys())
+        dedup_values = list(config.KEYWORD_DEDUP_OPTIONS.values())
+        dedup_label = st.selectbox(
+            "🔁 키워드 중복 처리",
+            dedup_labels,
+            index=dedup_values.index(config.KEYWORD_DEDUP_MODE) if config.KEYWORD_DEDUP_MODE in dedup_values else 0,
+            help="태그 도배나 설명 속 반복 키워드가 빈도를 과대 집계하지 않도록 동영상별 중복 등장을 제한합니다"
+        )
+        st.session_state.keyword_dedup = config.KEYWORD_DEDUP_OPTIONS[dedup_label]
+        
         # 현재 설정값 표시
         st.info(f"📋 현재 설정: 동영상 {max_results}개, 키워드 {max_keywords}개, 최소길이 {min_word_length}글자")
         
@@ -413,7 +458,19 @@ def setup_sidebar():
         # 캐시 클리어 버튼
         if st.button("🗑️ 캐시 클리어", use_container_width=True):
             st.cache_data.clear()
+            # 키워드 행렬·색인·채널 통계 등 공유 리소스와 그림·워드클라우드 캐시도 함께 비움
+            st.cache_resource.clear()
+            figure_cache.clear()
+            render_cache.clear()
             st.success("캐시가 클리어되었습니다!")
+        
+        # 차트 캐시 통계 (프로세스 공용)
+        figure_stats = figure_cache.stats()
+        st.caption(
+            f"📈 차트 캐시: {figure_stats['entries']}/{figure_stats['max_entries']}개, "
+            f"적중률 {figure_stats['hit_rate']:.0%} (적중 {figure_stats['hits']:,} · 미스 {figure_stats['misses']:,} · "
+            f"제거 {figure_stats['evictions']:,})"
+        )
 
 def main_content():
     """메인 콘텐츠 영역"""
@@ -479,6 +536,22 @@ def main_content():
                 st.session_state.df = df
                 st.session_state.collect_data = False
                 
+                # 새로 수집한 데이터만 누적 TF-IDF·로컬 검색 색인·채널 리더보드에 반영 (로컬 검색 결과는 이미 반영됨)
+                if st.session_state.analysis_mode != "로컬 검색":
+                    # 누적 TF-IDF 갱신 (최근 30일 대비 두드러진 키워드)
+                    st.session_state.distinctive_keywords = st.session_state.text_processor.update_tfidf_history(
+                        df,
+                        min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH),
+                        max_keywords=st.session_state.get('max_keywords', config.MAX_KEYWORDS)
+                    )
+                    st.session_state.text_processor.update_search_index(
+                        df,
+                        min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH)
+                    )
+                    # 누적 채널 리더보드 갱신 (새 스냅샷 행만 반영) - 검색 결과는 트렌드가 아니므로 제외
+                    if st.session_state.analysis_mode in config.CHANNEL_LEADERBOARD_MODES:
+                        update_channel_leaderboard(df)
+                
                 # 성공 메시지와 풍선 효과
                 status_placeholder.success(f"✅ {len(df)}개의 동영상 데이터를 성공적으로 수집했습니다!")
                 st.balloons()  # 축하 풍선 효과
@@ -562,6 +635,22 @@ def collect_youtube_data():
                 return None
             df = youtube_api.search_videos(search_query, max_results=max_results)
         
+        elif analysis_mode == "로컬 검색":
+            local_query = str(st.session_state.get('local_query', ''))
+            if not local_query.strip():
+                st.error("검색 키워드를 입력하세요.")
+                return None
+            df = st.session_state.text_processor.search_local_videos(
+                local_query,
+                categories=st.session_state.get('local_categories'),
+                date_range=st.session_state.get('local_date_range'),
+                limit=max_results,
+                min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH)
+            )
+            if df.empty:
+                st.warning("로컬 색인에서 검색 결과가 없습니다. 먼저 다른 모드로 데이터를 수집해 보세요.")
+                return None
+        
         return df
         
     except Exception as e:
@@ -579,23 +668,45 @@ def dashboard_tab(df):
     
     # 키워드 분석 및 필터링 시스템
     with st.spinner("키워드를 분석하고 있습니다..."):
-        keywords = st.session_state.text_processor.extract_keywords_from_dataframe(
-            df, 
-            min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH)
+        # 동영상 × 키워드 빈도 행렬은 데이터셋당 한 번만 만들고, 필터·랭킹은 행렬 연산으로 처리
+        scorer = st.session_state.text_processor.build_keyword_scorer(
+            df,
+            min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH),
+            dedup=st.session_state.get('keyword_dedup'),
+            alias_version=st.session_state.text_processor.alias_version
         )
+        total_keywords = int(scorer.matrix.frequency().sum())
         
-        if keywords:
-            keyword_freq = st.session_state.text_processor.get_keyword_frequency(
-                keywords, 
-                max_keywords=st.session_state.max_keywords
-            )
+        if total_keywords:
+            keyword_freq = scorer.score('frequency', max_keywords=st.session_state.max_keywords)
             
             # 키워드 통계 정보 표시
-            st.success(f"🔍 **{len(keywords)}개의 키워드**를 추출했습니다 (상위 {len(keyword_freq)}개 표시)")
+            st.success(f"🔍 **{total_keywords}개의 키워드**를 추출했습니다 (상위 {len(keyword_freq)}개 표시)")
+            
+            # 워드클라우드 탭 이미지는 대시보드를 보는 동안 백그라운드에서 준비
+            prerender_wordclouds(df)
+            
+            # 키워드 랭킹 방식 (가중 방식은 미리 만든 행렬과 통계 벡터의 곱으로 즉시 계산)
+            ranking_label = st.selectbox(
+                "📐 키워드 랭킹 방식",
+                list(RANKING_MODES.keys()),
+                help="출현 빈도 대신 조회수·좋아요·댓글 수로 가중한 키워드 순위를 볼 수 있습니다 (제목/설명/태그 필드별 가중치 적용)"
+            )
+            ranking_mode = RANKING_MODES[ranking_label]
+            if ranking_mode != 'frequency':
+                keyword_freq = scorer.score(ranking_mode, max_keywords=st.session_state.max_keywords)
             
             # ===== 새로운 인터랙티브 필터링 시스템 =====
             st.subheader("🎛️ 인터랙티브 필터링")
             
+            # 카테고리·조회수·키워드 패싯은 데이터셋당 한 번만 계산
+            facets = st.session_state.text_processor.build_facet_index(
+                df,
+                min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH),
+                dedup=st.session_state.get('keyword_dedup'),
+                alias_version=st.session_state.text_processor.alias_version
+            )
+            
             # 필터링 옵션들
             col1, col2, col3 = st.columns([2, 2, 1])
             
@@ -612,8 +723,7 @@ def dashboard_tab(df):
             
             with col2:
                 # 카테고리 필터
-                available_categories = df['category_id'].unique()
-                category_names = [config.CATEGORY_MAPPING.get(cat_id, f"카테고리 {cat_id}") for cat_id in available_categories]
+                category_names = facets.category_names()
                 selected_categories = st.multiselect(
                     "📂 카테고리 필터",
                     category_names,
@@ -629,7 +739,7 @@ def dashboard_tab(df):
                     st.rerun()
             
             # 조회수 범위 슬라이더
-            min_views, max_views = int(df['view_count'].min()), int(df['view_count'].max())
+            min_views, max_views = int(facets.view_min), int(facets.view_max)
             views_range = st.slider(
                 "📈 조회수 범위",
                 min_value=min_views,
@@ -640,21 +750,19 @@ def dashboard_tab(df):
             )
             
             # 필터링 적용
-            filtered_df = apply_filters(df, selected_keywords, selected_categories, views_range)
+            filtered_rows = filter_rows(df, selected_keywords, selected_categories, views_range)
+            filtered_df = df.iloc[filtered_rows]
             
             # 필터링 결과 표시
             if len(filtered_df) != len(df):
                 st.info(f"🎯 **{len(filtered_df)}개의 동영상**이 필터 조건에 맞습니다 (전체 {len(df)}개 중)")
                 
-                # 필터링된 데이터로 키워드 재분석
+                # 필터링된 행의 빈도 행만 합산 (형태소 분석 재실행 없음)
                 if len(filtered_df) > 0:
-                    filtered_keywords = st.session_state.text_processor.extract_keywords_from_dataframe(
-                        filtered_df, 
-                        min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH)
-                    )
-                    filtered_keyword_freq = st.session_state.text_processor.get_keyword_frequency(
-                        filtered_keywords, 
-                        max_keywords=st.session_state.max_keywords
+                    filtered_keyword_freq = scorer.score(
+                        ranking_mode,
+                        max_keywords=st.session_state.max_keywords,
+                        rows=filtered_rows
                     )
                 else:
                     filtered_keyword_freq = {}
@@ -722,69 +830,131 @@ def dashboard_tab(df):
                         'displaylogo': False,
                         'modeBarButtonsToAdd': ['zoom2d', 'pan2d']
                     })
+            
+            # 누적 TF-IDF 기준 두드러진 키워드
+            distinctive_keywords = st.session_state.get('distinctive_keywords')
+            if distinctive_keywords:
+                with st.container():
+                    st.markdown(f"### 🆕 최근 {config.TFIDF_WINDOW_DAYS}일 대비 두드러진 키워드")
+                    distinctive_chart = st.session_state.visualizer.create_keyword_bar_chart(
+                        {keyword: round(score, 4) for keyword, score in distinctive_keywords.items()},
+                        "TF-IDF 점수 (누적 문서 빈도 기준)",
+                        max_keywords=15
+                    )
+                    if distinctive_chart:
+                        st.plotly_chart(distinctive_chart, use_container_width=True)
         
         else:
             st.warning("키워드를 추출할 수 없습니다. 다른 설정을 시도해보세요.")
 
-def apply_filters(df, selected_keywords, selected_categories, views_range):
-    """필터링 조건을 적용하여 DataFrame 반환"""
-    filtered_df = df.copy()
-    
-    # 조회수 범위 필터
-    filtered_df = filtered_df[
-        (filtered_df['view_count'] >= views_range[0]) & 
-        (filtered_df['view_count'] <= views_range[1])
-    ]
-    
-    # 키워드 필터
-    if selected_keywords:
-        keyword_mask = pd.Series([False] * len(filtered_df))
-        for keyword in selected_keywords:
-            # 제목, 설명, 태그에서 키워드 검색
-            title_mask = filtered_df['title'].str.contains(keyword, case=False, na=False)
-            desc_mask = filtered_df['description'].str.contains(keyword, case=False, na=False) if 'description' in filtered_df.columns else pd.Series([False] * len(filtered_df))
-            tags_mask = filtered_df['tags'].str.contains(keyword, case=False, na=False) if 'tags' in filtered_df.columns else pd.Series([False] * len(filtered_df))
-            
-            keyword_mask = keyword_mask | title_mask | desc_mask | tags_mask
-        
-        filtered_df = filtered_df[keyword_mask]
+def filter_rows(df, selected_keywords, selected_categories, views_range):
+    """필터링 조건을 만족하는 행 번호 (데이터셋당 한 번 만든 패싯 색인의 비트맵 AND)"""
+    text_processor = st.session_state.text_processor
+    facets = text_processor.build_facet_index(
+        df,
+        min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH),
+        dedup=st.session_state.get('keyword_dedup'),
+        alias_version=text_processor.alias_version
+    )
     
-    # 카테고리 필터
-    if selected_categories:
-        # 카테고리 이름을 ID로 변환
-        category_ids = []
-        for cat_name in selected_categories:
-            for cat_id, name in config.CATEGORY_MAPPING.items():
-                if name == cat_name:
-                    category_ids.append(cat_id)
-                    break
-        
-        if category_ids:
-            filtered_df = filtered_df[filtered_df['category_id'].isin(category_ids)]
+    # 키워드 필터 (제목, 설명, 태그 중 하나라도 선택 키워드를 포함하면 통과)
+    if not selected_keywords or facets.supports_keywords(selected_keywords):
+        return facets.resolve(selected_keywords, selected_categories, views_range)
     
-    return filtered_df
+    # 역색인에 없는 키워드는 원문 검색으로 처리
+    rows = facets.resolve(None, selected_categories, views_range)
+    presence = text_processor.keyword_presence(df, selected_keywords, columns=('title', 'description', 'tags'))
+    return rows[presence.getnnz(axis=1)[rows] > 0]
+
+def get_wordcloud_background():
+    """현재 테마의 워드클라우드 배경색 (라이트 모드는 config 기본값)"""
+    return get_theme_colors()['bg_primary'] if st.session_state.get('dark_mode', False) else None
+
+def get_wordcloud_format():
+    """워드클라우드 탭 표시 형식 ('svg' 또는 'png')"""
+    return st.session_state.get('wordcloud_format', config.WORDCLOUD_OUTPUT_FORMAT)
+
+def get_wordcloud_frequencies(df, large=False):
+    """워드클라우드용 키워드 빈도 (고해상도는 config.WORDCLOUD_LARGE_MAX_WORDS개까지)"""
+    return st.session_state.text_processor.keyword_frequency_from_matrix(
+        df,
+        min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH),
+        max_keywords=config.WORDCLOUD_LARGE_MAX_WORDS if large else config.WORDCLOUD_MAX_WORDS,
+        dedup=st.session_state.get('keyword_dedup')
+    )
+
+def prerender_wordclouds(df):
+    """워드클라우드 탭에서 쓸 이미지를 백그라운드 스레드에서 미리 렌더링"""
+    text_processor = st.session_state.text_processor
+    keyword_freq = get_wordcloud_frequencies(df)
+    background_color = get_wordcloud_background()
+    if get_wordcloud_format() == 'svg':
+        text_processor.render_wordcloud_svg(keyword_freq, background_color=background_color, wait=False)
+    else:
+        text_processor.render_wordcloud_png(keyword_freq, background_color=background_color, wait=False)
+    text_processor.render_wordcloud_png(
+        get_wordcloud_frequencies(df, large=True),
+        width=config.WORDCLOUD_LARGE_WIDTH,
+        height=config.WORDCLOUD_LARGE_HEIGHT,
+        background_color=background_color,
+        wait=False
+    )
 
 def wordcloud_tab(df):
     """워드클라우드 탭"""
     st.header("☁️ 워드클라우드")
     
+    format_labels = {'svg': "SVG (벡터, 확대해도 선명)", 'png': "PNG (이미지)"}
+    st.radio(
+        "표시 형식",
+        list(format_labels.keys()),
+        index=list(format_labels.keys()).index(config.WORDCLOUD_OUTPUT_FORMAT),
+        format_func=format_labels.get,
+        horizontal=True,
+        key='wordcloud_format',
+        help="SVG는 단어를 텍스트 요소로 보내므로 용량이 작고, 브라우저 글꼴로 그려 PNG와 글자 폭이 조금 다를 수 있습니다"
+    )
+    
     with st.spinner("워드클라우드를 생성하고 있습니다..."):
-        keywords = st.session_state.text_processor.extract_keywords_from_dataframe(
-            df,
-            min_length=st.session_state.get('min_word_length', config.MIN_WORD_LENGTH)
-        )
+        keyword_freq = get_wordcloud_frequencies(df)
         
-        if keywords:
-            keyword_freq = st.session_state.text_processor.get_keyword_frequency(keywords)
+        if keyword_freq:
+            text_processor = st.session_state.text_processor
+            # 테마 배경색에 맞춰 그린 이미지를 그대로 표시 (같은 빈도표·크기·테마·형식이면 캐시 재사용)
+            background_color = get_wordcloud_background()
             
-            # 워드클라우드 생성
-            wordcloud = st.session_state.text_processor.generate_wordcloud(keyword_freq)
+            if get_wordcloud_format() == 'svg':
+                wordcloud_image = text_processor.render_wordcloud_svg(keyword_freq, background_color=background_color)
+            else:
+                wordcloud_image = text_processor.render_wordcloud_png(keyword_freq, background_color=background_color)
             
-            if wordcloud:
-                # 워드클라우드 표시
-                fig = st.session_state.visualizer.create_wordcloud_plot(wordcloud)
-                if fig:
-                    st.pyplot(fig)
+            if wordcloud_image:
+                st.image(wordcloud_image, use_container_width=True)
+                if get_wordcloud_format() == 'svg':
+                    st.download_button(
+                        "💾 SVG 다운로드",
+                        wordcloud_image,
+                        file_name="wordcloud.svg",
+                        mime="image/svg+xml"
+                    )
+                
+                # 보고서용 고해상도 이미지는 백그라운드에서 미리 렌더링
+                large_png = text_processor.render_wordcloud_png(
+                    get_wordcloud_frequencies(df, large=True),
+                    width=config.WORDCLOUD_LARGE_WIDTH,
+                    height=config.WORDCLOUD_LARGE_HEIGHT,
+                    background_color=background_color,
+                    wait=False
+                )
+                if large_png:
+                    st.download_button(
+                        f"💾 고해상도 PNG 다운로드 ({config.WORDCLOUD_LARGE_WIDTH}×{config.WORDCLOUD_LARGE_HEIGHT})",
+                        large_png,
+                        file_name="wordcloud.png",
+                        mime="image/png"
+                    )
+                else:
+                    st.caption("⏳ 고해상도 이미지를 백그라운드에서 준비하고 있습니다. 잠시 후 다시 열면 다운로드할 수 있습니다.")
             
             else:
                 st.error("워드클라우드 생성에 실패했습니다.")
@@ -1048,50 +1218,82 @@ def format_number(num):
     except:
         return str(num)
 
+@st.cache_resource
+def get_channel_leaderboard():
+    """누적 채널 리더보드 (프로세스당 하나, 요청마다 SQLite 연결)"""
+    return ChannelLeaderboard()
+
+def update_channel_leaderboard(df):
+    """수집 스냅샷을 누적 채널 리더보드에 반영"""
+    try:
+        return get_channel_leaderboard().update(df)
+    except Exception as e:
+        print(f"채널 리더보드 갱신 실패: {e}")
+        return 0
+
+def channel_leaderboard_section():
+    """스냅샷 누적 채널 리더보드 (원본 데이터 재그룹화 없이 저장된 누적값만 조회)"""
+    try:
+        leaderboard = get_channel_leaderboard()
+        snapshot_count = leaderboard.snapshot_count()
+        if not snapshot_count:
+            return
+        
+        st.subheader("🏅 누적 채널 리더보드")
+        order_label = st.selectbox(
+            "🏆 순위 기준",
+            list(LEADERBOARD_ORDERS.keys()),
+            help="지금까지 수집한 모든 스냅샷을 합친 채널 순위입니다"
+        )
+        board = leaderboard.leaderboard(LEADERBOARD_ORDERS[order_label])
+        st.caption(f"수집 {snapshot_count:,}회 · 채널 {len(leaderboard):,}개 누적 기준")
+        
+        leader = leaderboard.leaderboard('distinct_videos', limit=1)
+        if not leader.empty:
+            st.metric(
+                "🏅 누적 최다 트렌드 채널",
+                leader.iloc[0]['channel_title'],
+                f"{leader.iloc[0]['distinct_videos']:,.0f}개",
+                help="지금까지 수집한 모든 스냅샷에서 가장 많은 트렌드 동영상을 올린 채널"
+            )
+        st.dataframe(
+            board,
+            column_config={
+                'channel_title': st.column_config.TextColumn('채널명'),
+                'appearances': st.column_config.NumberColumn('트렌드 등장 횟수', format='%d',
+                                                             help='채널이 등장한 수집 스냅샷 수'),
+                'video_appearances': st.column_config.NumberColumn('동영상 등장 수', format='%d',
+                                                                   help='스냅샷별 트렌드 동영상 수의 합'),
+                'distinct_videos': st.column_config.NumberColumn('트렌드 동영상 수', format='%d',
+                                                                 help='트렌드에 오른 서로 다른 동영상 수'),
+                'cumulative_views': st.column_config.NumberColumn('누적 조회수', format='%d',
+                                                                  help='트렌드 동영상별 최신 조회수의 합'),
+                'first_seen': st.column_config.TextColumn('처음 등장'),
+                'last_seen': st.column_config.TextColumn('마지막 등장')
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+    except Exception as e:
+        st.error(f"채널 리더보드를 불러오지 못했습니다: {str(e)}")
+
 def channel_analysis_tab(df):
     """채널 분석 탭 - 채널별 심화 분석"""
     st.header("👥 채널 분석 대시보드")
     st.markdown("**채널별 성과를 분석하고 성공 요인을 발견하세요!**")
     
     try:
-        # 데이터 정제 및 타입 변환
-        df_clean = df.copy()
-        
-        # 수치 컬럼들을 확실히 변환
-        numeric_columns = ['view_count', 'like_count', 'comment_count']
-        for col in numeric_columns:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-        
-        # 결측값을 0으로 처리
-        df_clean[numeric_columns] = df_clean[numeric_columns].fillna(0)
-        
-        # 채널명이 없는 데이터 제거
-        df_clean = df_clean.dropna(subset=['channel_title'])
-        df_clean = df_clean[df_clean['channel_title'].str.strip() != '']
+        # 채널별 기본 통계 (데이터셋당 한 번 집계해 캐시 - 채널 선택·정렬 변경 시 재계산 없음)
+        channel_summary = build_channel_stats(df)
         
-        if df_clean.empty:
+        if channel_summary.empty:
             st.warning("⚠️ 분석할 수 있는 채널 데이터가 없습니다.")
             return
         
-        # 채널별 기본 통계 계산
-        channel_stats = df_clean.groupby('channel_title').agg({
-            'view_count': ['count', 'sum', 'mean'],
-            'like_count': 'sum',
-            'comment_count': 'sum',
-            'published_at': ['min', 'max']
-        }).round(0)
-        
-        # 컬럼명 정리
-        channel_stats.columns = ['동영상_수', '총_조회수', '평균_조회수', '총_좋아요', '총_댓글', '첫_업로드', '최근_업로드']
-        channel_stats = channel_stats.reset_index()
-        
-        # 모든 수치 컬럼을 정수형으로 변환
-        for col in ['동영상_수', '총_조회수', '평균_조회수', '총_좋아요', '총_댓글']:
-            channel_stats[col] = pd.to_numeric(channel_stats[col], errors='coerce').fillna(0).astype(int)
+        channel_stats = channel_summary.stats
         
         # 상위 채널 선별 (동영상 수 기준)
-        top_channels = channel_stats.nlargest(20, '동영상_수')
+        top_channels = channel_summary.top(20, '동영상_수')
         
         # 주요 지표 카드
         col1, col2, col3, col4 = st.columns(4)
@@ -1130,6 +1332,9 @@ def channel_analysis_tab(df):
                 help="가장 많은 트렌드 동영상을 보유한 채널"
             )
         
+        # 스냅샷 누적 리더보드
+        channel_leaderboard_section()
+        
         st.divider()
         
         # 채널 선택 및 필터링
@@ -1156,9 +1361,7 @@ def channel_analysis_tab(df):
         
         if selected_channels:
             # 선택된 채널 데이터 필터링
-            filtered_channel_stats = channel_stats[
-                channel_stats['channel_title'].isin(selected_channels)
-            ].sort_values(sort_by, ascending=False)
+            filtered_channel_stats = channel_summary.select(selected_channels, sort_by)
             
             # 채널 비교 차트
             st.subheader("📈 채널 성과 비교")
@@ -1175,8 +1378,8 @@ def channel_analysis_tab(df):
             # 채널별 상세 분석
             st.subheader("🔍 채널별 상세 분석")
             
-            # 선택된 채널의 동영상 데이터 (정제된 데이터 사용)
-            channel_videos = df_clean[df_clean['channel_title'].isin(selected_channels)]
+            # 선택된 채널의 동영상 데이터 (집계 때 수치로 변환한 사본에서 채널 코드로 행 선택)
+            channel_videos = channel_summary.channel_videos(selected_channels)
             
             col1, col2 = st.columns(2)
             
@@ -1204,22 +1407,16 @@ def channel_analysis_tab(df):
             # 채널 상세 테이블
             st.subheader("📋 채널 상세 정보")
             
-            # 테이블 표시용 데이터 준비
-            display_stats = filtered_channel_stats.copy()
-            display_stats['총_조회수'] = display_stats['총_조회수'].apply(lambda x: f"{x:,.0f}")
-            display_stats['평균_조회수'] = display_stats['평균_조회수'].apply(lambda x: f"{x:,.0f}")
-            display_stats['총_좋아요'] = display_stats['총_좋아요'].apply(lambda x: f"{x:,.0f}")
-            display_stats['총_댓글'] = display_stats['총_댓글'].apply(lambda x: f"{x:,.0f}")
-            
+            # 숫자 서식은 표시 단계에서 column_config로 지정 (값은 정수 그대로 전달)
             st.dataframe(
-                display_stats[['channel_title', '동영상_수', '총_조회수', '평균_조회수', '총_좋아요', '총_댓글']],
+                filtered_channel_stats[['channel_title'] + COUNT_COLUMNS],
                 column_config={
                     'channel_title': st.column_config.TextColumn('채널명'),
-                    '동영상_수': st.column_config.NumberColumn('동영상 수'),
-                    '총_조회수': st.column_config.TextColumn('총 조회수'),
-                    '평균_조회수': st.column_config.TextColumn('평균 조회수'),
-                    '총_좋아요': st.column_config.TextColumn('총 좋아요'),
-                    '총_댓글': st.column_config.TextColumn('총 댓글')
+                    '동영상_수': st.column_config.NumberColumn('동영상 수', format='%d'),
+                    '총_조회수': st.column_config.NumberColumn('총 조회수', format='%d'),
+                    '평균_조회수': st.column_config.NumberColumn('평균 조회수', format='%d'),
+                    '총_좋아요': st.column_config.NumberColumn('총 좋아요', format='%d'),
+                    '총_댓글': st.column_config.NumberColumn('총 댓글', format='%d')
                 },
                 use_container_width=True,
                 hide_index=True
@@ -1277,15 +1474,66 @@ def network_analysis_tab(df):
             network_data, keyword_freq = st.session_state.text_processor.create_keyword_network(
                 df, 
                 max_keywords=max_keywords, 
-                min_cooccurrence=min_cooccurrence
+                min_cooccurrence=min_cooccurrence,
+                dedup=st.session_state.get('keyword_dedup')
             )
             
             # 키워드 클러스터 분석
             clusters = st.session_state.text_processor.get_keyword_clusters(
                 df, 
                 max_keywords=max_keywords, 
-                similarity_threshold=similarity_threshold
+                similarity_threshold=similarity_threshold,
+                dedup=st.session_state.get('keyword_dedup')
+            )
+        
+        # 키워드 표기 통합 - 같은 대상이 여러 노드로 나뉘지 않도록 별칭 사전 편집
+        with st.expander("🔀 키워드 표기 통합 (동의어·영문 표기 병합)"):
+            text_processor = st.session_state.text_processor
+            merge_freq = text_processor.keyword_frequency_from_matrix(
+                df,
+                min_length=2,
+                max_keywords=config.KEYWORD_ALIAS_SUGGEST_TOP,
+                dedup=st.session_state.get('keyword_dedup')
             )
+            suggestions = text_processor.suggest_keyword_merges(merge_freq, max_suggestions=30)
+            
+            selected_labels = []
+            suggestion_labels = [
+                f"{s['alias']} → {s['canonical']} ({s['reason']}, {s['score']:.2f})" for s in suggestions
+            ]
+            if suggestions:
+                selected_labels = st.multiselect(
+                    "병합 제안",
+                    suggestion_labels,
+                    default=[],
+                    help="문자 유사도, 한글-영문 발음, 약어(초성)로 찾은 같은 대상 후보입니다",
+                    placeholder="병합할 항목을 선택하세요..."
+                )
+            else:
+                st.info("현재 데이터에서 병합 제안이 없습니다.")
+            
+            alias_col1, alias_col2 = st.columns(2)
+            with alias_col1:
+                manual_alias = st.text_input("별칭", placeholder="예: NewJeans")
+            with alias_col2:
+                manual_canonical = st.text_input("대표 키워드", placeholder="예: 뉴진스")
+            
+            if st.button("💾 별칭 사전에 저장", use_container_width=True):
+                aliases = text_processor.keyword_aliases
+                if aliases is None:
+                    st.error("별칭 사전을 사용할 수 없습니다.")
+                else:
+                    for label in selected_labels:
+                        suggestion = suggestions[suggestion_labels.index(label)]
+                        aliases.add_alias(suggestion['canonical'], suggestion['alias'])
+                    if manual_alias.strip() and manual_canonical.strip():
+                        aliases.add_alias(manual_canonical.strip(), manual_alias.strip())
+                    aliases.save()
+                    
+                    # 키워드 행렬·색인 캐시는 키에 별칭 사전 지문(alias_version)이 있어 자동으로 다시 만들어짐
+                    st.cache_data.clear()
+                    st.success("별칭 사전을 저장했습니다. 키워드를 다시 분석합니다.")
+                    st.rerun()
         
         if network_data and keyword_freq:
             # 분석 결과 요약
@@ -19,15 +19,100 @@ MAX_RESULTS = 200  # 한 번에 가져올 동영상 수 (증가)
 TRENDING_REGION = 'KR'  # 트렌딩 지역 (한국)
 CACHE_TTL = 3600  # 캐시 유효 시간 (초)
 
+# 로컬 저장소 설정
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')  # 누적 데이터 저장 폴더
+
 # 텍스트 처리 설정
 MIN_WORD_LENGTH = 2  # 최소 단어 길이
 MAX_KEYWORDS = 50  # 최대 키워드 수
+KEYWORD_FIELD_WEIGHTS = {  # 가중 랭킹의 필드별 가중치
+    'title': 3.0, 'description': 1.0, 'hashtags': 1.0, 'chapters': 1.0, 'mentions': 1.0, 'tags': 1.0,
+    'phrases': 1.0
+}
+
+# 키워드 중복 처리 설정 (태그 도배·설명 반복 완화)
+KEYWORD_DEDUP_MODE = None  # 사이드바 기본값 - None: 모두 집계, 'video': 동영상당 1회, 'field': 필드당 1회, 정수 N: 동영상당 최대 N회
+KEYWORD_DEDUP_OPTIONS = {
+    '모두 집계': None,
+    '동영상당 1회': 'video',
+    '필드당 1회 (제목/설명/태그)': 'field',
+    '동영상당 최대 3회': 3
+}
+TAG_TOKEN_CACHE_SIZE = 50000  # 태그 토큰화 결과를 보관할 최대 태그 수
+
+# 설명 전처리 설정 (토큰화 전 채널별 상용구 제거 및 필드별 글자 수 예산)
+DESCRIPTION_STRIP_BOILERPLATE = True  # 채널별 반복 설명 줄(구독 안내, 협찬 문구, 링크 목록 등) 제거
+BOILERPLATE_MIN_VIDEOS = 3  # 상용구로 판단할 최소 반복 동영상 수
+BOILERPLATE_MIN_RATIO = 0.5  # 채널 동영상 중 이 비율 이상에 반복되면 상용구
+BOILERPLATE_MIN_LINE_CHARS = 8  # 이보다 짧은 줄은 상용구 학습에서 제외
+KEYWORD_FIELD_MAX_CHARS = {'title': 300, 'description': 1500}  # 필드별 최대 분석 글자 수 (없으면 제한 없음)
+DESCRIPTION_PARSE_STRUCTURED = True  # 설명의 해시태그·챕터 제목·@멘션을 별도 필드로 분리해 직접 집계
+
+# 구(복합명사·n-gram) 추출 설정 - 원문에서 이어진 명사열의 2~3-gram 중 기준을 넘는 것만 채택
+KEYWORD_PHRASES = True  # 단일 키워드와 함께 구도 집계
+PHRASE_MIN_COUNT = 3  # 최소 출현 횟수
+PHRASE_MIN_PMI = 1.0  # 최소 PMI (자연로그)
+PHRASE_MAX_N = 3  # 최대 n-gram 길이 (2 또는 3)
+
+# 키워드 표기 통합 설정 (대표 키워드: [별칭, ...])
+KEYWORD_ALIASES = {
+    '뉴진스': ['newjeans', 'new jeans'],
+    '방탄소년단': ['bts', '방탄'],
+    '블랙핑크': ['blackpink'],
+    '아이브': ['ive'],
+    '세븐틴': ['seventeen'],
+    '손흥민': ['sonny']
+}
+KEYWORD_ALIAS_PATH = os.path.join(DATA_DIR, 'keyword_aliases.json')  # 사용자 편집 별칭 사전
+KEYWORD_ALIAS_SUGGEST_THRESHOLD = 0.8  # 병합 제안 최소 점수
+KEYWORD_ALIAS_SUGGEST_TOP = 200  # 병합 제안 대상 상위 키워드 수
+
+# 키워드 포함 여부 검색 (Aho-Corasick 다중 패턴 매처)
+KEYWORD_MATCHER_CACHE_SIZE = 32  # 재사용할 키워드 목록별 매처 수
+
+# 병렬 키워드 추출 설정
+KEYWORD_WORKERS = None  # 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 처리)
+KEYWORD_SHARD_SIZE = 500  # 워커에 넘기는 샤드당 행 수
+KEYWORD_PARALLEL_MIN_ROWS = 2000  # 이 행 수 이상일 때만 프로세스 풀 사용
+
+# 근사 키워드 집계 설정 (Space-Saving, 빈도 오차 ≤ 전체 키워드 수 / 용량)
+KEYWORD_SKETCH_CAPACITY = 10000  # 추적할 최대 키워드 수
+KEYWORD_SKETCH_CHUNK = 4096  # 키워드 목록을 요약에 넣을 때 한 번에 합치는 토큰 수 (메모리 상한)
+
+# 누적 TF-IDF 설정
+TFIDF_STORE_PATH = os.path.join(DATA_DIR, 'tfidf_document_frequency.npz')  # 문서 빈도 저장 파일
+TFIDF_HASH_FEATURES = 2 ** 20  # 토큰 해시 공간 크기
+TFIDF_WINDOW_DAYS = 30  # IDF 계산에 사용할 최근 일수
+
+# 로컬 검색 설정 (수집한 동영상의 SQLite FTS5 색인)
+SEARCH_INDEX_PATH = os.path.join(DATA_DIR, 'video_search.db')  # 검색 색인 파일
+SEARCH_RESULTS_LIMIT = 200  # 기본 최대 검색 결과 수
+LOCAL_SEARCH_MAX_RESULTS = 500  # 로컬 검색 모드에서 가져올 수 있는 최대 동영상 수
+
+# 누적 채널 리더보드 설정 (수집 스냅샷마다 증분 갱신)
+CHANNEL_LEADERBOARD_PATH = os.path.join(DATA_DIR, 'channel_leaderboard.db')  # 리더보드 파일
+CHANNEL_LEADERBOARD_LIMIT = 50  # 채널 분석 탭에 표시할 최대 채널 수
+CHANNEL_LEADERBOARD_MODES = ('전체 트렌딩', '카테고리별 분석')  # 리더보드에 누적할 수집 모드 (키워드·로컬 검색 결과는 트렌드가 아니므로 제외)
 
 # 시각화 설정
+BUNDLED_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts', 'NanumGothic.ttf')  # 우선 사용할 번들 한글 폰트
 WORDCLOUD_WIDTH = 800
 WORDCLOUD_HEIGHT = 400
 WORDCLOUD_BACKGROUND = 'white'
 WORDCLOUD_COLORMAP = 'viridis'
+WORDCLOUD_LARGE_WIDTH = 1600  # 보고서용 고해상도 캔버스 (백그라운드 렌더링)
+WORDCLOUD_LARGE_HEIGHT = 800
+WORDCLOUD_CACHE_SIZE = 32  # 캐시할 렌더링 이미지 수
+WORDCLOUD_OUTPUT_FORMAT = 'svg'  # 워드클라우드 탭 기본 표시 형식 ('svg': 벡터 텍스트, 'png': 래스터 이미지)
+WORDCLOUD_MAX_WORDS = 100  # 기본 캔버스에 배치할 최대 단어 수
+WORDCLOUD_LARGE_MAX_WORDS = 500  # 고해상도 캔버스에 배치할 최대 단어 수
+WORDCLOUD_LAYOUT_CELL = 2  # 빠른 배치 엔진의 점유 격자 셀 크기 (픽셀, 클수록 빠르지만 덜 촘촘함)
+WORDCLOUD_GLYPH_CACHE_SIZE = 4096  # (단어, 글꼴 크기, 방향)별 글리프 마스크 캐시 크기
+FIGURE_CACHE_SIZE = 64  # 캐시할 Plotly 그림 수 (JSON으로 보관, 프로세스 공용)
+CHART_MAX_POINTS = 5000  # 산점도에 보낼 최대 점 수 (넘으면 카테고리별 층화 표본)
+CHART_3D_MAX_POINTS = 2000  # 3D 산점도에 보낼 최대 점 수
+HISTOGRAM_BINS = 30  # 서버에서 미리 집계하는 히스토그램 구간 수
+WEBGL_POINT_THRESHOLD = 1000  # 점·엣지 수가 이보다 많으면 WebGL(Scattergl)로 렌더링
 
 # 카테고리 매핑 (YouTube API 카테고리 ID)
 CATEGORY_MAPPING = {
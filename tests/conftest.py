@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# 저장소 루트를 import 경로에 추가 (config, utils 패키지)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def processor():
+    """Kiwi 초기화 비용이 크므로 테스트 세션 전체에서 하나만 사용"""
+    from utils.text_processor import TextProcessor
+    return TextProcessor()
+
+
+@pytest.fixture
+def videos():
+    """키워드 추출용 작은 동영상 데이터"""
+    rows = []
+    topics = ['아이브 컴백 무대', '손흥민 토트넘 골 하이라이트', '뉴진스 신곡 뮤직비디오', '아이폰 갤럭시 리뷰']
+    for i in range(24):
+        topic = topics[i % len(topics)]
+        rows.append({
+            'video_id': f'v{i}',
+            'title': f'{topic} 영상 {i}',
+            'description': f'오늘은 {topic} 소식을 전해드립니다\n#{topic.split()[0]}',
+            'channel_title': f'채널{i % 5}',
+            'tags': ', '.join(topic.split()),
+            'view_count': 1000 * (i + 1),
+            'like_count': 10 * i,
+            'comment_count': i
+        })
+    return pd.DataFrame(rows)
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import pandas as pd
+
+from utils.channel_leaderboard import ChannelLeaderboard
+
+
+def _snapshot(rows):
+    """(채널, 동영상 ID, 조회수) 목록으로 만든 수집 스냅샷"""
+    return pd.DataFrame(rows, columns=['channel_title', 'video_id', 'view_count'])
+
+
+def _by_channel(board):
+    """채널 이름 -> 누적 행"""
+    return board.leaderboard(limit=100).set_index('channel_title').to_dict('index')
+
+
+def test_same_snapshot_twice_does_not_double_count_videos(tmp_path):
+    """같은 스냅샷을 다시 반영해도 동영상 수·누적 조회수는 그대로이고 등장 횟수만 늘어남"""
+    board = ChannelLeaderboard(str(tmp_path / 'leaderboard.db'))
+    snapshot = _snapshot([('A', 'v1', 100), ('A', 'v2', 50), ('B', 'v3', 10), ('A', 'v1', 120)])
+
+    assert board.update(snapshot, recorded_at=datetime(2026, 10, 1, 9)) == 2
+    first = _by_channel(board)
+    assert board.update(snapshot, recorded_at=datetime(2026, 10, 1, 10)) == 2
+    second = _by_channel(board)
+
+    # 스냅샷 안의 중복 동영상(v1)은 마지막 행만 사용
+    assert first['A']['distinct_videos'] == second['A']['distinct_videos'] == 2
+    assert first['A']['cumulative_views'] == second['A']['cumulative_views'] == 170
+    assert (first['A']['appearances'], second['A']['appearances']) == (1, 2)
+    assert (first['A']['video_appearances'], second['A']['video_appearances']) == (2, 4)
+    assert second['A']['first_seen'] == '2026-10-01T09:00:00'
+    assert second['A']['last_seen'] == '2026-10-01T10:00:00'
+    assert board.snapshot_count() == 2 and len(board) == 2
+
+
+def test_overlapping_snapshots_add_only_view_increase(tmp_path):
+    """다시 등장한 동영상은 조회수 증가분만, 새 동영상은 전체 조회수와 동영상 수를 더함"""
+    board = ChannelLeaderboard(str(tmp_path / 'leaderboard.db'))
+    board.update(_snapshot([('A', 'v1', 100), ('B', 'v3', 10)]))
+    board.update(_snapshot([('A', 'v1', 180), ('A', 'v4', 5), ('C', 'v5', 7)]))
+
+    channels = _by_channel(board)
+    assert channels['A']['cumulative_views'] == 185
+    assert channels['A']['distinct_videos'] == 2
+    assert channels['B']['appearances'] == 1
+    assert channels['C']['cumulative_views'] == 7
+    assert board.leaderboard(order_by='cumulative_views')['channel_title'].tolist() == ['A', 'B', 'C']
+    assert board.update(_snapshot([])) == 0
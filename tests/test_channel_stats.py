@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from utils.channel_stats import ChannelStats
+
+
+def test_channel_videos_use_coerced_counts():
+    """선택한 채널의 동영상은 수치로 변환된 사본에서 가져옴 (문자열·결측 조회수는 숫자/0)"""
+    df = pd.DataFrame({
+        'channel_title': ['가', '나', '가', ' ', None],
+        'view_count': ['1,000', '200', np.nan, '5', '7'],
+        'like_count': [1, 'x', 3, 4, 5],
+        'comment_count': [0, 1, 2, 3, 4]
+    })
+    stats = ChannelStats(df)
+
+    videos = stats.channel_videos(['가'])
+
+    assert list(videos.index) == [0, 2]
+    assert videos['view_count'].tolist() == [0.0, 0.0]
+    assert videos['like_count'].tolist() == [1.0, 3.0]
+    assert pd.api.types.is_float_dtype(videos['view_count'])
+    # 원본 DataFrame은 바뀌지 않음
+    assert df['view_count'].iloc[0] == '1,000'
+    assert stats.select(['나'])['총_조회수'].tolist() == [200]
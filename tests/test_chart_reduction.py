@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from utils.chart_reduction import histogram_bins, sample_points
+
+
+def _frame(n_rows, n_groups, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'category_id': rng.integers(0, n_groups, n_rows).astype(str),
+        'view_count': rng.integers(0, 1_000_000, n_rows)
+    })
+
+
+def test_sample_respects_budget_and_keeps_top():
+    """예산 이하로 줄이고 조회수 상위 행은 항상 포함, 원래 행 순서 유지"""
+    df = _frame(5000, 8)
+    sample = sample_points(df, max_points=400, keep_top=20)
+
+    # 비례 배분의 내림 오차만큼(그룹 수 이하) 모자랄 수 있음
+    assert 400 - 8 <= len(sample) <= 400
+    assert set(df['view_count'].nlargest(20).index) <= set(sample.index)
+    assert sample.index.is_monotonic_increasing
+    assert sample['category_id'].nunique() == 8
+
+
+def test_more_groups_than_budget_stays_within_budget():
+    """그룹 수가 max_points보다 많아도 결과는 max_points행 이하"""
+    df = _frame(3000, 1000)
+    assert df['category_id'].nunique() > 50
+
+    sample = sample_points(df, max_points=50)
+
+    assert len(sample) == 50
+    assert sample_points(df, max_points=50).index.equals(sample.index)
+
+
+def test_budget_taken_by_top_rows():
+    """상위 행만으로 예산을 채우면 그 행만 반환"""
+    df = _frame(500, 600)
+    sample = sample_points(df, max_points=10, keep_top=10)
+    assert set(sample.index) == set(df['view_count'].nlargest(10).index)
+
+
+def test_histogram_bins_counts_all_values():
+    starts, ends, counts = histogram_bins([1, 2, 2, 3, None, 'x'], nbins=2)
+    assert counts.sum() == 4
+    assert len(starts) == len(ends) == 2
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from utils.facet_index import FacetIndex
+from utils.keyword_index import KeywordIndex
+
+
+def _dataset(n_videos=80, seed=0):
+    """카테고리·조회수·키워드 출현이 섞인 데이터와 같은 행 순서의 키워드 역색인"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'category_id': rng.choice(['10', '17', '24', '99'], size=n_videos),
+        'view_count': rng.integers(0, 1000, size=n_videos),
+    })
+    presence = sparse.csc_matrix(rng.random((n_videos, 5)) < 0.25)
+    presence.sort_indices()
+    vocabulary = [f'k{i}' for i in range(5)]
+    keyword_index = KeywordIndex(vocabulary, presence.indptr, presence.indices.astype(np.int32), n_videos)
+    return df, pd.DataFrame(presence.toarray(), columns=vocabulary), keyword_index
+
+
+def test_resolve_matches_pandas_masks():
+    """필터 조합 결과가 같은 조건의 pandas 마스크와 같은 행 번호"""
+    df, presence, keyword_index = _dataset()
+    facets = FacetIndex(df, keyword_index)
+    names = dict(zip(facets.categories, facets.category_names()))
+    ids_by_name = {name: category for category, name in names.items()}
+
+    queries = [
+        ([], [], None),
+        (['k0'], [], None),
+        (['k1', 'k2'], [names['10']], (200, 800)),
+        ([], [names['17'], names['99']], (0, 500)),
+        (['k3'], [names['24']], (facets.view_min, facets.view_max)),
+    ]
+    for keywords, category_names, views_range in queries:
+        expected = np.ones(len(df), dtype=bool)
+        if views_range is not None:
+            expected &= df['view_count'].between(*views_range).to_numpy()
+        if category_names:
+            expected &= df['category_id'].isin([ids_by_name[name] for name in category_names]).to_numpy()
+        if keywords:
+            expected &= presence[keywords].any(axis=1).to_numpy()
+
+        rows = facets.resolve(keywords=keywords, category_names=category_names, views_range=views_range)
+        assert rows.tolist() == np.flatnonzero(expected).tolist()
+
+
+def test_unmapped_category_names_and_keyword_support():
+    """매핑에 없는 카테고리 ID도 "카테고리 N" 이름으로 필터되고, 색인에 없는 키워드는 미지원으로 표시"""
+    df, _, keyword_index = _dataset(seed=1)
+    facets = FacetIndex(df, keyword_index)
+
+    assert facets.category_mask(['카테고리 99']).tolist() == (df['category_id'] == '99').tolist()
+    assert facets.view_min == df['view_count'].min() and facets.view_max == df['view_count'].max()
+    assert facets.supports_keywords(['k0', 'k4'])
+    assert not facets.supports_keywords(['k0', '없는키워드'])
+    assert not FacetIndex(df).supports_keywords(['k0'])
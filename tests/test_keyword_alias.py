@@ -0,0 +1,59 @@
+import streamlit as st
+
+import config
+from utils.keyword_alias import KeywordAliasIndex
+
+
+def test_multi_word_alias_is_canonicalized(processor):
+    """여러 단어 별칭('new jeans')도 토큰화 전에 합쳐져 대표 키워드로 통합"""
+    assert 'new jeans' in config.KEYWORD_ALIASES['뉴진스']
+
+    tokens = processor.extract_keywords_from_text('New  Jeans 신곡 뮤직비디오 공개')
+    tokens = processor.keyword_aliases.canonicalize_fields({'title': tokens})['title']
+
+    assert '뉴진스' in tokens
+    assert 'jeans' not in tokens
+
+
+def test_replace_phrases_respects_word_boundaries(tmp_path):
+    """단어 중간에 걸친 문자열은 바꾸지 않음"""
+    aliases = KeywordAliasIndex(str(tmp_path / 'aliases.json'))
+    assert aliases.replace_phrases('New Jeans 무대') == 'newjeans 무대'
+    assert aliases.replace_phrases('renew jeansy') == 'renew jeansy'
+    assert aliases.canonicalize('newjeans') == '뉴진스'
+
+
+def test_version_is_content_fingerprint(tmp_path):
+    """같은 사전이면 인스턴스가 달라도 같은 지문, 별칭을 추가하면 바뀜"""
+    path = str(tmp_path / 'aliases.json')
+    first, second = KeywordAliasIndex(path), KeywordAliasIndex(path)
+    assert first.version == second.version
+
+    first.add_alias('아이유', 'iu')
+    assert first.version != second.version
+
+
+def test_builders_are_keyed_by_alias_version(processor, videos):
+    """별칭 사전 지문이 다르면 키워드 행렬을 다시 생성"""
+    st.cache_resource.clear()
+    current = processor.build_keyword_matrix(videos, alias_version=processor.alias_version)
+
+    assert processor.build_keyword_matrix(videos, alias_version=processor.alias_version) is current
+    assert processor.build_keyword_matrix(videos, alias_version='edited') is not current
+
+
+def test_user_alias_overrides_builtin_canonical(tmp_path):
+    """사용자 사전이 기본 사전의 대표 키워드를 다른 키워드로 합치면 그 별칭들도 따라감"""
+    aliases = KeywordAliasIndex(str(tmp_path / 'aliases.json'))
+    assert aliases.canonicalize('뉴진스') == '뉴진스'
+
+    aliases.add_alias('NJZ', '뉴진스')
+
+    assert aliases.canonicalize('뉴진스') == 'NJZ'
+    assert aliases.canonicalize('newjeans') == 'NJZ'
+    assert aliases.canonicalize('new jeans') == 'NJZ'
+    assert aliases.canonicalize(aliases.replace_phrases('New Jeans')) == 'NJZ'
+
+    # 저장 후 다시 불러와도 유지
+    aliases.save()
+    assert KeywordAliasIndex(aliases.alias_path).canonicalize('뉴진스') == 'NJZ'
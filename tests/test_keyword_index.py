@@ -0,0 +1,49 @@
+import numpy as np
+from scipy import sparse
+
+from utils.keyword_index import KeywordIndex
+
+
+def _random_index(n_videos=60, n_keywords=8, seed=0):
+    """무작위 출현 행렬로 만든 역색인과 키워드별 행 집합"""
+    rng = np.random.default_rng(seed)
+    presence = sparse.csc_matrix(rng.random((n_videos, n_keywords)) < 0.3)
+    presence.sort_indices()
+    vocabulary = [f'k{i}' for i in range(n_keywords)]
+    index = KeywordIndex(vocabulary, presence.indptr, presence.indices.astype(np.int32), n_videos)
+    rows = {keyword: set(presence[:, i].nonzero()[0].tolist()) for i, keyword in enumerate(vocabulary)}
+    return index, rows
+
+
+def test_set_operations_match_python_sets():
+    """합집합·교집합·Jaccard가 파이썬 집합 연산과 같고 결과는 정렬된 행 번호"""
+    index, rows = _random_index()
+    queries = [['k0'], ['k0', 'k1'], ['k2', 'k3', 'k4'], ['k5', '없는키워드'], []]
+
+    for keywords in queries:
+        sets = [rows.get(keyword, set()) for keyword in keywords]
+        union = index.union(keywords)
+        intersection = index.intersection(keywords)
+        assert union.tolist() == sorted(set().union(*sets))
+        assert intersection.tolist() == (sorted(set.intersection(*sets)) if sets else [])
+
+    for first in rows:
+        assert index.document_frequency(first) == len(rows[first])
+        for second in rows:
+            expected = len(rows[first] & rows[second]) / len(rows[first] | rows[second])
+            assert index.jaccard(first, second) == expected
+
+
+def test_presence_and_mask():
+    """presence 행렬과 mask가 역색인 행 번호와 일치"""
+    index, rows = _random_index(seed=1)
+    keywords = ['k3', '없는키워드', 'k1']
+
+    presence = index.presence(keywords).toarray()
+    assert presence.shape == (index.n_videos, 3)
+    for column, keyword in enumerate(keywords):
+        assert set(np.flatnonzero(presence[:, column]).tolist()) == rows.get(keyword, set())
+
+    assert '없는키워드' not in index and 'k1' in index
+    assert index.document_frequency('없는키워드') == 0
+    assert np.flatnonzero(index.mask(index.rows('k1'))).tolist() == sorted(rows['k1'])
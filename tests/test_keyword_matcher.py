@@ -0,0 +1,40 @@
+import random
+
+from utils.keyword_matcher import KeywordMatcher
+
+
+def _naive_find(keywords, text):
+    """키워드마다 부분 문자열 검색 (대소문자 무시)"""
+    text = text.lower()
+    return {index for index, keyword in enumerate(keywords) if keyword.lower() in text}
+
+
+def test_matches_naive_substring_search():
+    """겹치거나 서로 포함되는 패턴이 섞여도 단순 부분 문자열 검색과 결과가 같음"""
+    keywords = ['he', 'she', 'his', 'hers', 'ushers', 'a', 'ab', 'bab', 'abab', '아이브', '아이', '브이로그', 'BTS']
+    rng = random.Random(0)
+    alphabet = list('abehirsu') + ['아', '이', '브', '로', '그', ' ', 'T', 'S', 'b']
+    texts = [''.join(rng.choices(alphabet, k=rng.randint(0, 30))) for _ in range(500)]
+    texts += ['ushers', 'ahishers', '아이브 브이로그', 'bts 컴백', 'ababab']
+
+    matcher = KeywordMatcher(keywords)
+    for text in texts:
+        assert matcher.find(text) == _naive_find(keywords, text), text
+
+
+def test_surface_forms_and_presence():
+    """별칭 표기도 원래 키워드 번호로 잡히고 presence 행렬이 find 결과와 일치"""
+    forms = {'아이브': ['아이브', 'IVE'], '뉴진스': ['뉴진스', 'NewJeans']}
+    matcher = KeywordMatcher(['아이브', '뉴진스'], surface_forms=lambda keyword: forms[keyword])
+    texts = ['IVE 무대', 'newjeans 직캠', '뉴진스와 아이브', '관련 없음']
+
+    presence = matcher.presence(texts).toarray()
+    assert presence.tolist() == [[1, 0], [0, 1], [1, 1], [0, 0]]
+
+
+def test_transitions_only_cover_pattern_characters():
+    """상태마다 루트 전이표를 복사하지 않음 - 전이 수가 트라이 간선 수와 같음"""
+    keywords = [f'키워드{i}' for i in range(50)]
+    matcher = KeywordMatcher(keywords)
+    n_edges = sum(len(edges) for edges in matcher._goto)
+    assert n_edges == len(matcher._goto) - 1
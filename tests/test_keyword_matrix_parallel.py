@@ -0,0 +1,50 @@
+import streamlit as st
+
+import config
+from utils import text_processor
+
+
+def test_keyword_matrix_uses_process_pool(processor, videos, monkeypatch):
+    """임계값 이상의 데이터는 키워드 행렬도 프로세스 풀 샤드에서 추출"""
+    created = []
+    pool_class = text_processor.ProcessPoolExecutor
+
+    def spy_pool(*args, **kwargs):
+        created.append(kwargs.get('max_workers'))
+        return pool_class(*args, **kwargs)
+
+    monkeypatch.setattr(text_processor, 'ProcessPoolExecutor', spy_pool)
+    monkeypatch.setattr(config, 'KEYWORD_PARALLEL_MIN_ROWS', 10)
+    monkeypatch.setattr(config, 'KEYWORD_WORKERS', 2)
+    monkeypatch.setattr(config, 'KEYWORD_SHARD_SIZE', 8)
+    st.cache_resource.clear()
+
+    matrix = processor.build_keyword_matrix(videos)
+
+    assert created == [2]
+    assert matrix.n_videos == len(videos)
+
+
+def test_parallel_field_keywords_match_sequential(processor, videos, monkeypatch, capsys):
+    """샤드 병렬 추출 결과가 순차 추출과 행·필드 단위로 같음"""
+    monkeypatch.setattr(config, 'KEYWORD_PARALLEL_MIN_ROWS', 10)
+
+    sequential = processor.extract_field_keywords(videos, n_workers=1)
+    parallel = processor.extract_field_keywords(videos, n_workers=2, shard_size=8)
+
+    assert parallel == sequential
+    # 병렬 경로가 실패해 순차 처리로 전환된 것이 아님
+    assert '순차 처리로 전환' not in capsys.readouterr().out
+
+
+def test_small_data_skips_process_pool(processor, videos, monkeypatch):
+    """임계값 미만이면 프로세스를 띄우지 않고 순차 처리"""
+    def fail_pool(*args, **kwargs):
+        raise AssertionError('프로세스 풀을 사용하면 안 됩니다')
+
+    monkeypatch.setattr(text_processor, 'ProcessPoolExecutor', fail_pool)
+    monkeypatch.setattr(config, 'KEYWORD_PARALLEL_MIN_ROWS', len(videos) + 1)
+
+    field_tokens = processor.extract_field_keywords(videos, n_workers=2)
+
+    assert all(len(tokens) == len(videos) for tokens in field_tokens.values())
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from utils.keyword_matrix import KeywordMatrix
+from utils.keyword_scoring import KeywordScorer
+
+
+def _scorer(views):
+    """동영상마다 키워드 하나씩 가진 작은 점수 계산기"""
+    field_tokens = {'title': [['아이브'], ['뉴진스'], ['토트넘']]}
+    df = pd.DataFrame({'view_count': views, 'like_count': [0, 0, 0], 'comment_count': [0, 0, 0]})
+    return KeywordScorer(KeywordMatrix.from_field_tokens(field_tokens), df, field_weights={'title': 1.0})
+
+
+def test_weighted_scores_are_not_rounded():
+    """0.5 미만 점수도 0이 되지 않고, 가까운 점수도 동점으로 뭉개지지 않음"""
+    scores = _scorer([0.2, 0.4, 0.3]).score('views')
+
+    assert list(scores) == ['뉴진스', '토트넘', '아이브']
+    assert scores['아이브'] == 0.2
+
+
+def test_frequency_scores_stay_integers():
+    """출현 빈도는 그대로 정수"""
+    scores = _scorer([1, 2, 3]).score('frequency')
+    assert all(isinstance(score, int) for score in scores.values())
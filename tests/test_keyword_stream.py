@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+
+import config
+from utils import keyword_stream
+from utils.keyword_stream import SpaceSavingCounter
+
+
+def _zipf_tokens(n_tokens, n_keywords, seed=0):
+    """상위 키워드에 빈도가 몰린 토큰 목록"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(n_keywords)]
+    return rng.choices([f'k{rank}' for rank in range(n_keywords)], weights=weights, k=n_tokens)
+
+
+def test_error_bound_holds():
+    """추정 빈도는 실제 이상이고 초과분은 error 이하, error는 N / capacity 이하"""
+    tokens = _zipf_tokens(20000, 2000)
+    exact = Counter(tokens)
+    sketch = SpaceSavingCounter(capacity=100)
+    sketch.update(tokens)
+
+    assert len(sketch) <= 100
+    assert sketch.total == len(tokens)
+    assert sketch.max_error() <= len(tokens) / 100
+    for keyword, count in sketch.counts.items():
+        assert exact[keyword] <= count <= exact[keyword] + sketch.errors[keyword]
+    # 실제 빈도가 N / capacity를 넘는 키워드는 반드시 포함
+    assert all(keyword in sketch for keyword, count in exact.items() if count > len(tokens) / 100)
+
+
+def test_merge_keeps_bound():
+    """두 요약을 병합해도 추정 빈도가 실제 이상이고 빈도 높은 키워드가 남음"""
+    first_tokens, second_tokens = _zipf_tokens(8000, 500, seed=1), _zipf_tokens(8000, 500, seed=2)
+    exact = Counter(first_tokens) + Counter(second_tokens)
+    first, second = SpaceSavingCounter(capacity=50), SpaceSavingCounter(capacity=50)
+    first.update(first_tokens)
+    second.update(second_tokens)
+
+    merged = first.merge(second)
+
+    assert len(merged) <= 50
+    assert merged.total == len(first_tokens) + len(second_tokens)
+    for keyword, count in merged.counts.items():
+        assert count >= exact[keyword]
+    top_exact = [keyword for keyword, _ in exact.most_common(5)]
+    assert set(top_exact) <= set(merged.counts)
+
+
+def test_update_does_not_count_whole_input(monkeypatch):
+    """목록 입력은 고정 크기 묶음으로만 합쳐져 입력 전체의 빈도표를 만들지 않음"""
+    largest = []
+
+    class TrackingCounter(Counter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            largest.append(len(self))
+
+    monkeypatch.setattr(keyword_stream, 'Counter', TrackingCounter)
+    monkeypatch.setattr(config, 'KEYWORD_SKETCH_CHUNK', 64)
+    sketch = SpaceSavingCounter(capacity=10)
+    sketch.update(f'k{i}' for i in range(10000))
+
+    assert sketch.total == 10000
+    assert max(largest) <= 64
+    assert len(sketch) == 10
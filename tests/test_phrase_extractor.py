@@ -0,0 +1,42 @@
+from utils.phrase_extractor import JOINED_MARK, PhraseExtractor
+
+
+def test_pmi_and_count_thresholds():
+    """출현 횟수와 PMI가 모두 기준 이상인 2-gram만 구로 채택"""
+    run_docs = [[['아이브', '컴백']] for _ in range(5)]
+    run_docs += [[['영상', f'x{i % 3}']] for i in range(9)]
+    run_docs += [[['영상', '리뷰']], [['영상', '리뷰']], [['리뷰', '영상']]]
+
+    extractor = PhraseExtractor(min_count=2, min_pmi=1.0, max_n=2)
+    doc_phrases = extractor.fit_transform(run_docs)
+
+    # PMI: 아이브 컴백 ≈ 1.92, 영상 x* ≈ 1.33, 영상 리뷰 ≈ 0.48 (흔한 "영상"과 우연히 붙은 쌍)
+    assert extractor.phrases == {'아이브 컴백': 5, '영상 x0': 3, '영상 x1': 3, '영상 x2': 3}
+    assert doc_phrases[0] == ['아이브 컴백']
+    assert doc_phrases[-1] == []
+
+    # 같은 데이터라도 PMI 기준을 낮추면 채택되고, 횟수 1인 "리뷰 영상"은 여전히 제외
+    relaxed = PhraseExtractor(min_count=2, min_pmi=0.0, max_n=2)
+    relaxed.fit_transform(run_docs)
+    assert relaxed.phrases['영상 리뷰'] == 2
+    assert '리뷰 영상' not in relaxed.phrases
+
+
+def test_joined_compounds_are_not_split():
+    """붙여 쓴 복합명사("브이" + "+로그") 중간에서 끊기는 n-gram은 만들지 않음"""
+    run_docs = [[['먹방', '브이', f'{JOINED_MARK}로그', '리뷰']] for _ in range(4)]
+
+    for max_n in (2, 3):
+        extractor = PhraseExtractor(min_count=2, min_pmi=0.0, max_n=max_n)
+        doc_phrases = extractor.fit_transform(run_docs)
+
+        assert '브이로그' in extractor.phrases
+        assert '먹방 브이' not in extractor.phrases
+        assert '로그 리뷰' not in extractor.phrases
+        for phrases in doc_phrases:
+            for phrase in phrases:
+                assert JOINED_MARK not in phrase
+                assert not phrase.endswith('브이') and not phrase.startswith('로그')
+
+    # 3-gram이 채택된 위치와 겹치는 구는 동영상별 목록에 다시 넣지 않음
+    assert doc_phrases[0] == ['먹방 브이로그']
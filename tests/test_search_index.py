@@ -0,0 +1,24 @@
+import streamlit as st
+
+import config
+
+from utils.video_search import VideoSearchIndex
+
+
+def test_search_index_reuses_cached_field_tokens(processor, videos, monkeypatch, tmp_path):
+    """로컬 검색 색인은 캐시된 필드 토큰을 사용하고 형태소 분석을 다시 하지 않음"""
+    st.cache_resource.clear()
+    processor.build_field_tokens(videos, min_length=config.MIN_WORD_LENGTH, alias_version=processor.alias_version)
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError('색인할 때 키워드를 다시 추출하면 안 됩니다')
+
+    monkeypatch.setattr(processor, 'extract_keywords_from_text', fail_extract)
+    monkeypatch.setattr(processor, 'search_index', VideoSearchIndex(str(tmp_path / 'search.db')), raising=False)
+
+    assert processor.update_search_index(videos) == len(videos)
+    monkeypatch.undo()
+    monkeypatch.setattr(processor, 'search_index', VideoSearchIndex(str(tmp_path / 'search.db')), raising=False)
+
+    results = processor.search_local_videos('토트넘')
+    assert set(results['video_id']) == set(videos.loc[videos['title'].str.contains('토트넘'), 'video_id'])
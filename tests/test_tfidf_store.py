@@ -0,0 +1,59 @@
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+
+from utils.tfidf_store import IncrementalTfidf
+
+
+def test_concurrent_updates_keep_every_snapshot(tmp_path):
+    """공유 인스턴스에 여러 스레드가 동시에 반영해도 저장 파일에 모든 문서가 남음"""
+    store_path = str(tmp_path / 'tfidf.npz')
+    store = IncrementalTfidf(store_path, n_features=1024, window_days=30)
+    batches = [[['아이브', f'키워드{i}'], ['뉴진스']] for i in range(8)]
+
+    threads = [threading.Thread(target=store.update, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reloaded = IncrementalTfidf(store_path, n_features=1024, window_days=30)
+    assert reloaded.document_count == store.document_count == 2 * len(batches)
+
+
+def test_incremental_window_matches_recompute(tmp_path):
+    """배치를 더하고 만료분만 빼서 유지한 윈도우 문서 빈도가 전체 재계산과 같음"""
+    store = IncrementalTfidf(str(tmp_path / 'tfidf.npz'), n_features=256, window_days=3)
+    start = date(2026, 10, 1)
+    for day in range(6):
+        store.partial_fit([['a', 'b'], ['b', f'c{day}']], snapshot_date=start + timedelta(days=day))
+        store.partial_fit([['a']], snapshot_date=start + timedelta(days=day))
+
+    window_df, window_docs = store._window_df.copy(), store.document_count
+    store._recompute_window()
+
+    assert len(store._daily) == 3
+    assert window_docs == store.document_count == 9
+    np.testing.assert_array_equal(window_df, store._window_df)
+
+
+def test_same_day_recollection_is_not_double_counted(tmp_path):
+    """같은 날 같은 동영상을 다시 수집해도 문서 수와 문서 빈도가 늘지 않고, 다시 불러와도 유지됨"""
+    store_path = str(tmp_path / 'tfidf.npz')
+    store = IncrementalTfidf(store_path, n_features=256, window_days=30)
+    today = date(2026, 10, 1)
+    docs = [['아이브', '컴백'], ['뉴진스']]
+
+    store.update(docs, snapshot_date=today, doc_ids=['v1', 'v2'])
+    window_df = store._window_df.copy()
+    store.update(docs, snapshot_date=today, doc_ids=['v1', 'v2'])
+    assert store.document_count == 2
+    np.testing.assert_array_equal(window_df, store._window_df)
+
+    reloaded = IncrementalTfidf(store_path, n_features=256, window_days=30)
+    reloaded.update(docs + [['르세라핌']], snapshot_date=today, doc_ids=['v1', 'v2', 'v3'])
+    assert reloaded.document_count == 3
+
+    reloaded.update(docs, snapshot_date=today + timedelta(days=1), doc_ids=['v1', 'v2'])
+    assert reloaded.document_count == 5
@@ -0,0 +1,26 @@
+import config
+
+
+def test_tokenize_documents_matches_row_extraction(processor):
+    """원문 토큰화가 DataFrame 행 추출과 같은 결과 (구조화 필드·별칭 포함)"""
+    text = 'NewJeans 신곡 뮤직비디오 공개\n00:00 인트로\n#뉴진스 #신곡'
+
+    tokens = processor.tokenize_documents([text])[0]
+    expected = processor._extract_row_keywords({'description': text}, ['description'], config.MIN_WORD_LENGTH)
+
+    assert tokens == expected
+    assert '#' not in ''.join(tokens)
+
+
+def test_tokenize_documents_canonicalizes_aliases(processor):
+    """별칭은 대표 키워드로 통합"""
+    tokens = processor.tokenize_documents(['BlackPink 콘서트 무대 영상'])[0]
+    assert '블랙핑크' in tokens
+    assert 'blackpink' not in tokens
+
+
+def test_tokenize_documents_truncates_field(processor, monkeypatch):
+    """필드별 글자 수 예산 적용"""
+    monkeypatch.setitem(config.KEYWORD_FIELD_MAX_CHARS, 'description', 20)
+    tokens = processor.tokenize_documents(['아이브 컴백 ' + '토트넘 ' * 50 + '갤럭시'])[0]
+    assert '갤럭시' not in tokens
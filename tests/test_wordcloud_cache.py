@@ -0,0 +1,20 @@
+from utils.wordcloud_cache import WordcloudRenderCache
+
+
+def test_clear_drops_rendered_images():
+    """clear() 후에는 같은 키도 다시 렌더링"""
+    cache = WordcloudRenderCache(max_entries=4)
+    key = cache.make_key({'아이브': 3}, 800, 400, 'white', 'viridis')
+    renders = []
+
+    def render():
+        renders.append(1)
+        return b'png'
+
+    cache.get_or_render(key, render)
+    cache.get_or_render(key, render)
+    cache.clear()
+
+    assert cache.get(key) is None
+    assert cache.get_or_render(key, render) == b'png'
+    assert len(renders) == 2
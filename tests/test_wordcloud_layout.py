@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+from wordcloud import WordCloud
+
+from utils.wordcloud_layout import generate_layout, glyph_mask
+
+
+def _frequencies(n_words, seed=0):
+    """서로 다른 단어 n_words개의 빈도"""
+    rng = random.Random(seed)
+    return {f'word{i}': rng.randint(1, 1000) for i in range(n_words)}
+
+
+def _wordcloud(max_words, width=400, height=200):
+    """generate_wordcloud와 같은 설정 (폰트는 라이브러리 기본 폰트)"""
+    return WordCloud(width=width, height=height, relative_scaling=0.5, min_font_size=10, max_font_size=100,
+                     prefer_horizontal=0.7, max_words=max_words, random_state=random.Random(0))
+
+
+def _coverage(wordcloud):
+    """배치된 단어의 글리프 픽셀이 칠해진 횟수 (캔버스 크기)"""
+    coverage = np.zeros((wordcloud.height, wordcloud.width), dtype=np.int32)
+    for (word, _), font_size, (row, col), orientation, _ in wordcloud.layout_:
+        mask = glyph_mask(wordcloud.font_path, word, font_size, orientation)
+        # 배치된 글리프는 캔버스 안에 있어야 함 (잘린 부분 없이)
+        assert not mask[wordcloud.height - row:, :].any() and not mask[:, wordcloud.width - col:].any()
+        coverage[row:row + mask.shape[0], col:col + mask.shape[1]] += mask[:wordcloud.height - row,
+                                                                            :wordcloud.width - col]
+    return coverage
+
+
+def test_layout_has_no_overlapping_glyphs():
+    """배치된 단어의 글리프 픽셀이 서로 겹치지 않음"""
+    wordcloud = generate_layout(_wordcloud(max_words=80), _frequencies(80))
+
+    assert len(wordcloud.layout_) > 10
+    assert _coverage(wordcloud).max() == 1
+
+
+def test_layout_respects_max_words():
+    """max_words보다 많은 단어가 들어와도 빈도 상위 max_words개까지만 배치"""
+    frequencies = _frequencies(200, seed=1)
+    wordcloud = generate_layout(_wordcloud(max_words=30, width=800, height=400), frequencies)
+
+    top_words = set(sorted(frequencies, key=frequencies.get, reverse=True)[:30])
+    placed = [word for (word, _), *_ in wordcloud.layout_]
+    assert len(placed) == 30
+    assert set(placed) == top_words == set(wordcloud.words_)
+    assert _coverage(wordcloud).max() == 1
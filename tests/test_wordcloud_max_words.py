@@ -0,0 +1,30 @@
+import itertools
+
+import pandas as pd
+
+import config
+
+
+def _many_keywords_df(n_keywords=120):
+    """서로 다른 영어 키워드가 n_keywords개 이상 나오는 데이터 (빈도가 모두 달라 순위가 고정)"""
+    words = [''.join(letters) for letters in itertools.islice(itertools.product('bdfgklmprstvz', 'aeiou', 'nrx'),
+                                                                n_keywords)]
+    rows = []
+    for i, word in enumerate(words):
+        for j in range(i % 7 + 1):
+            rows.append({'video_id': f'v{i}-{j}', 'title': f'{word} {word}', 'description': '', 'tags': ''})
+    return pd.DataFrame(rows), words
+
+
+def test_large_wordcloud_lays_out_more_than_default_keywords(processor):
+    """고해상도 워드클라우드는 config.MAX_KEYWORDS보다 많은 단어를 배치"""
+    df, _ = _many_keywords_df()
+
+    default_freq = processor.keyword_frequency_from_matrix(df, max_keywords=config.WORDCLOUD_MAX_WORDS)
+    large_freq = processor.keyword_frequency_from_matrix(df, max_keywords=config.WORDCLOUD_LARGE_MAX_WORDS)
+    assert len(large_freq) > len(default_freq) > config.MAX_KEYWORDS
+
+    wordcloud = processor.generate_wordcloud(
+        large_freq, width=config.WORDCLOUD_LARGE_WIDTH, height=config.WORDCLOUD_LARGE_HEIGHT
+    )
+    assert len(wordcloud.layout_) > config.MAX_KEYWORDS
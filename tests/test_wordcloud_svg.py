@@ -0,0 +1,40 @@
+import random
+import xml.etree.ElementTree as ET
+
+from wordcloud import WordCloud
+
+from utils.wordcloud_layout import generate_layout
+from utils.wordcloud_svg import wordcloud_to_svg
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+def _laid_out(frequencies, **params):
+    """라이브러리 기본 폰트로 배치를 마친 WordCloud"""
+    params = {'width': 400, 'height': 200, 'max_font_size': 60, 'random_state': random.Random(0), **params}
+    return generate_layout(WordCloud(**params), frequencies)
+
+
+def test_svg_is_valid_xml_with_escaped_words():
+    """XML 특수 문자가 들어간 단어도 이스케이프되어 파싱 결과 원래 단어로 복원됨"""
+    frequencies = {'R&B': 50, '<script>': 40, 'say "hi"': 30, "it's": 20, 'plain': 10}
+    wordcloud = _laid_out(frequencies)
+
+    root = ET.fromstring(wordcloud_to_svg(wordcloud, font_family='"Odd" & <Family>'))
+
+    assert root.tag == f'{SVG_NS}svg'
+    assert root.get('viewBox') == '0 0 400 200'
+    assert root.get('font-family') == '"Odd" & <Family>'
+    texts = root.findall(f'{SVG_NS}text')
+    assert [text.text for text in texts] == [word for (word, _), *_ in wordcloud.layout_]
+    assert set(frequencies) == {text.text for text in texts}
+
+
+def test_svg_scale_and_background():
+    """scale만큼 커진 크기로 그리고, 배경색이 없으면 배경 사각형을 넣지 않음"""
+    wordcloud = _laid_out({'alpha': 3, 'beta': 2}, scale=2, background_color=None, mode='RGBA')
+    root = ET.fromstring(wordcloud_to_svg(wordcloud))
+
+    assert (root.get('width'), root.get('height')) == ('800', '400')
+    assert root.find(f'{SVG_NS}rect') is None
+    assert root.get('font-family')
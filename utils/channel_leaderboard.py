@@ -0,0 +1,168 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import pandas as pd
+
+import config
+
+# 리더보드 정렬 기준 (화면 이름 -> 컬럼)
+LEADERBOARD_ORDERS = {
+    '트렌드 등장 횟수': 'appearances',
+    '트렌드 동영상 수': 'distinct_videos',
+    '누적 조회수': 'cumulative_views',
+    '트렌드 동영상 등장 수': 'video_appearances'
+}
+
+LEADERBOARD_COLUMNS = ('channel_title', 'appearances', 'video_appearances', 'distinct_videos', 'cumulative_views',
+                       'first_seen', 'last_seen')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id INTEGER PRIMARY KEY,
+    recorded_at TEXT NOT NULL,
+    n_videos INTEGER,
+    n_channels INTEGER
+);
+CREATE TABLE IF NOT EXISTS channels (
+    channel_title TEXT PRIMARY KEY,
+    appearances INTEGER NOT NULL DEFAULT 0,
+    video_appearances INTEGER NOT NULL DEFAULT 0,
+    distinct_videos INTEGER NOT NULL DEFAULT 0,
+    cumulative_views INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE TABLE IF NOT EXISTS channel_videos (
+    channel_title TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT,
+    last_seen TEXT,
+    PRIMARY KEY (channel_title, video_id)
+) WITHOUT ROWID;
+"""
+
+# 스냅샷 배치를 채널별로 집계해 누적값에 더함 (기존 동영상은 조회수 증가분만 반영)
+_UPSERT_CHANNELS = """
+INSERT INTO channels (channel_title, appearances, video_appearances, distinct_videos, cumulative_views,
+                      first_seen, last_seen)
+SELECT b.channel_title, 1, COUNT(*), SUM(cv.video_id IS NULL), SUM(b.view_count - COALESCE(cv.view_count, 0)),
+       :seen, :seen
+FROM batch b
+LEFT JOIN channel_videos cv ON cv.channel_title = b.channel_title AND cv.video_id = b.video_id
+GROUP BY b.channel_title
+ON CONFLICT (channel_title) DO UPDATE SET
+    appearances = appearances + 1,
+    video_appearances = video_appearances + excluded.video_appearances,
+    distinct_videos = distinct_videos + excluded.distinct_videos,
+    cumulative_views = cumulative_views + excluded.cumulative_views,
+    last_seen = excluded.last_seen
+"""
+
+_UPSERT_VIDEOS = """
+INSERT INTO channel_videos (channel_title, video_id, view_count, first_seen, last_seen)
+SELECT channel_title, video_id, view_count, :seen, :seen FROM batch WHERE true
+ON CONFLICT (channel_title, video_id) DO UPDATE SET
+    view_count = excluded.view_count,
+    last_seen = excluded.last_seen
+"""
+
+
+class ChannelLeaderboard:
+    """
+    수집 스냅샷 누적 채널 리더보드 (SQLite)
+
+    채널마다 트렌드 등장 횟수(스냅샷 수), 동영상 등장 수, 트렌드에 오른 서로 다른 동영상 수,
+    누적 조회수(동영상별 최신 조회수 합), 처음·마지막 등장 시각을 보관합니다.
+    갱신은 새 스냅샷 행만 임시 테이블에 넣고 기본 키 조회로 누적값에 더하므로
+    비용이 새 행 수에만 비례합니다.
+    """
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로 (기본값: config.CHANNEL_LEADERBOARD_PATH)
+        """
+        self.db_path = db_path or config.CHANNEL_LEADERBOARD_PATH
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self):
+        """요청마다 새 연결 (Streamlit 스크립트 스레드 간 연결 공유 방지)"""
+        return sqlite3.connect(self.db_path)
+
+    def update(self, df, recorded_at=None):
+        """
+        수집 스냅샷 하나를 누적값에 반영
+
+        Args:
+            df (pd.DataFrame): 수집한 동영상 데이터 (channel_title, video_id, view_count)
+            recorded_at (datetime): 수집 시각 (기본값: 지금)
+
+        Returns:
+            int: 반영한 채널 수
+        """
+        if df.empty or 'channel_title' not in df.columns or 'video_id' not in df.columns:
+            return 0
+
+        batch = df[['channel_title', 'video_id']].copy()
+        batch['view_count'] = (pd.to_numeric(df['view_count'], errors='coerce').fillna(0).astype('int64')
+                               if 'view_count' in df.columns else 0)
+        batch = batch.dropna(subset=['channel_title', 'video_id'])
+        batch = batch[batch['channel_title'].astype(str).str.strip() != '']
+        # 같은 스냅샷 안의 중복 동영상은 마지막 행만 사용
+        batch = batch.drop_duplicates(subset=['channel_title', 'video_id'], keep='last')
+        if batch.empty:
+            return 0
+
+        seen = (recorded_at or datetime.now()).isoformat(timespec='seconds')
+        rows = list(batch.itertuples(index=False, name=None))
+        n_channels = batch['channel_title'].nunique()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                'CREATE TEMP TABLE batch (channel_title TEXT, video_id TEXT, view_count INTEGER, '
+                'PRIMARY KEY (channel_title, video_id))'
+            )
+            connection.executemany('INSERT INTO batch VALUES (?, ?, ?)', rows)
+            connection.execute(_UPSERT_CHANNELS, {'seen': seen})
+            connection.execute(_UPSERT_VIDEOS, {'seen': seen})
+            connection.execute(
+                'INSERT INTO snapshots (recorded_at, n_videos, n_channels) VALUES (?, ?, ?)',
+                (seen, len(rows), n_channels)
+            )
+            connection.execute('DROP TABLE batch')
+        return n_channels
+
+    def leaderboard(self, order_by='appearances', limit=None):
+        """
+        누적 리더보드
+
+        Args:
+            order_by (str): 정렬 컬럼 (LEADERBOARD_ORDERS의 값)
+            limit (int): 최대 채널 수 (기본값: config.CHANNEL_LEADERBOARD_LIMIT)
+
+        Returns:
+            pd.DataFrame: LEADERBOARD_COLUMNS (order_by 내림차순, 같으면 누적 조회수 순)
+        """
+        if order_by not in LEADERBOARD_ORDERS.values():
+            order_by = 'appearances'
+        sql = (f'SELECT {", ".join(LEADERBOARD_COLUMNS)} FROM channels '
+               f'ORDER BY {order_by} DESC, cumulative_views DESC LIMIT ?')
+        with closing(self._connect()) as connection:
+            rows = connection.execute(sql, (int(limit or config.CHANNEL_LEADERBOARD_LIMIT),)).fetchall()
+        return pd.DataFrame(rows, columns=list(LEADERBOARD_COLUMNS))
+
+    def snapshot_count(self):
+        """반영한 스냅샷 수"""
+        with closing(self._connect()) as connection:
+            return connection.execute('SELECT COUNT(*) FROM snapshots').fetchone()[0]
+
+    def __len__(self):
+        """누적된 채널 수"""
+        with closing(self._connect()) as connection:
+            return connection.execute('SELECT COUNT(*) FROM channels').fetchone()[0]
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# 정수로 집계하는 채널 통계 컬럼 (채널 분석 탭·채널 비교 차트와 같은 이름)
+COUNT_COLUMNS = ['동영상_수', '총_조회수', '평균_조회수', '총_좋아요', '총_댓글']
+
+# 수치로 변환해 집계하는 동영상 컬럼
+NUMERIC_COLUMNS = ('view_count', 'like_count', 'comment_count')
+
+
+def _numeric(df, column):
+    """수치 컬럼을 float 배열로 (없거나 변환 불가한 값은 0)"""
+    if column not in df.columns:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[column], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+class ChannelStats:
+    """
+    채널별 집계 (데이터셋당 한 번 계산)
+
+    채널명을 정수 코드로 바꾼 뒤 np.bincount로 동영상 수·합계를 한 번에 집계합니다.
+    행마다 채널 코드를 보관하므로 선택한 채널의 동영상 행도 다시 그룹화하지 않고 찾습니다.
+    행 번호는 통계를 만든 DataFrame의 위치 순서이며, 수치 컬럼을 변환한 사본(videos)도 함께 보관합니다.
+    """
+
+    def __init__(self, df):
+        """
+        Args:
+            df (pd.DataFrame): 동영상 데이터 (channel_title, view_count, like_count, comment_count, published_at)
+        """
+        # 조회수·좋아요·댓글을 수치로 변환한 사본 (변환 불가한 값은 0) - 집계와 동영상 표·차트가 공유
+        videos = df.copy()
+        for column in NUMERIC_COLUMNS:
+            if column in videos.columns:
+                videos[column] = _numeric(df, column)
+        self.videos = videos
+
+        titles = df['channel_title'] if 'channel_title' in df.columns else pd.Series(np.nan, index=df.index)
+        # 채널명이 없거나 공백뿐인 동영상은 집계에서 제외 (코드 -1)
+        valid = titles.notna().to_numpy() & (titles.astype(str).str.strip() != '').to_numpy()
+        codes = np.full(len(df), -1, dtype=np.int64)
+        valid_codes, channels = pd.factorize(titles[valid], sort=True)
+        codes[valid] = valid_codes
+        self._codes = codes
+        self.channels = list(channels)
+        self._channel_codes = {channel: i for i, channel in enumerate(self.channels)}
+
+        n_channels = len(self.channels)
+        rows = codes[valid]
+        counts = np.bincount(rows, minlength=n_channels)
+        sums = {
+            column: np.bincount(rows, weights=_numeric(videos, column)[valid], minlength=n_channels)
+            for column in NUMERIC_COLUMNS
+        }
+        # factorize로 만든 채널은 모두 동영상이 하나 이상
+        mean_views = sums['view_count'] / np.maximum(counts, 1)
+
+        stats = pd.DataFrame({
+            'channel_title': self.channels,
+            '동영상_수': counts.astype(np.int64),
+            '총_조회수': np.round(sums['view_count']).astype(np.int64),
+            '평균_조회수': np.round(mean_views).astype(np.int64),
+            '총_좋아요': np.round(sums['like_count']).astype(np.int64),
+            '총_댓글': np.round(sums['comment_count']).astype(np.int64)
+        })
+        if 'published_at' in df.columns and n_channels:
+            published = df['published_at'][valid].groupby(rows).agg(['min', 'max'])
+            stats['첫_업로드'] = published['min'].reindex(range(n_channels)).to_numpy()
+            stats['최근_업로드'] = published['max'].reindex(range(n_channels)).to_numpy()
+        else:
+            stats['첫_업로드'] = None
+            stats['최근_업로드'] = None
+        self.stats = stats
+
+    def __len__(self):
+        """채널 수"""
+        return len(self.channels)
+
+    @property
+    def empty(self):
+        """집계할 채널이 없는지"""
+        return not self.channels
+
+    def top(self, n, by='동영상_수'):
+        """기준 컬럼 상위 n개 채널 통계"""
+        return self.stats.nlargest(n, by)
+
+    def select(self, channels, sort_by='총_조회수'):
+        """선택한 채널의 통계 (sort_by 내림차순)"""
+        return self.stats[self.stats['channel_title'].isin(channels)].sort_values(sort_by, ascending=False)
+
+    def video_rows(self, channels):
+        """선택한 채널에 속한 동영상 행 번호 (오름차순)"""
+        codes = [self._channel_codes[channel] for channel in channels if channel in self._channel_codes]
+        return np.flatnonzero(np.isin(self._codes, codes))
+
+    def channel_videos(self, channels):
+        """선택한 채널의 동영상 (수치 컬럼을 변환한 사본에서 선택)"""
+        return self.videos.iloc[self.video_rows(channels)]
+
+
+@st.cache_resource(ttl=300)  # 읽기 전용 집계이므로 복사 없이 공유
+def build_channel_stats(df):
+    """채널별 집계 생성 - 데이터셋당 한 번 (채널 선택·정렬 변경 시 재계산하지 않음)"""
+    return ChannelStats(df)
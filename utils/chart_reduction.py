@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+import config
+
+
+def histogram_bins(values, nbins=None):
+    """
+    히스토그램을 서버에서 미리 집계 (브라우저에는 구간별 개수만 전송)
+
+    Args:
+        values (array-like): 수치 값 (NaN은 제외)
+        nbins (int): 구간 수 (기본값: config.HISTOGRAM_BINS)
+
+    Returns:
+        tuple: (구간 시작, 구간 끝, 개수) 배열 - 값이 없으면 빈 배열들
+    """
+    values = pd.to_numeric(pd.Series(values), errors='coerce').dropna().to_numpy(dtype=float)
+    if not len(values):
+        empty = np.empty(0)
+        return empty, empty, np.empty(0, dtype=np.int64)
+    counts, edges = np.histogram(values, bins=nbins or config.HISTOGRAM_BINS)
+    return edges[:-1], edges[1:], counts
+
+
+def sample_points(df, max_points=None, strata='category_id', priority='view_count', keep_top=None, seed=0):
+    """
+    점 예산을 넘는 DataFrame을 층화 표본으로 축소
+
+    priority 열 상위 keep_top개(바이럴 이상치)는 항상 남기고, 나머지 예산을 strata 열의 그룹 크기에
+    비례해 나눠(그룹마다 최소 1개, 그룹이 예산보다 많으면 큰 그룹부터 1개씩) 무작위로 뽑습니다.
+    seed가 같으면 같은 행이 뽑히므로 차트 캐시와 화면이 재실행마다 흔들리지 않습니다.
+
+    Args:
+        df (pd.DataFrame): 원본 데이터
+        max_points (int): 최대 행 수 (기본값: config.CHART_MAX_POINTS)
+        strata (str): 층 구분 열 (없으면 단순 무작위 표본)
+        priority (str): 항상 포함할 상위 행을 고를 수치 열
+        keep_top (int): 항상 포함할 상위 행 수 (기본값: 예산의 5%)
+        seed (int): 난수 시드
+
+    Returns:
+        pd.DataFrame: 원래 행 순서를 유지한 표본 (예산 이하면 원본 그대로)
+    """
+    max_points = max_points or config.CHART_MAX_POINTS
+    n_rows = len(df)
+    if n_rows <= max_points:
+        return df
+
+    rng = np.random.default_rng(seed)
+    selected = np.zeros(n_rows, dtype=bool)
+
+    if priority in df.columns:
+        keep_top = max_points // 20 if keep_top is None else min(keep_top, max_points)
+        values = pd.to_numeric(df[priority], errors='coerce').fillna(-np.inf).to_numpy()
+        if keep_top:
+            selected[np.argpartition(-values, keep_top - 1)[:keep_top]] = True
+
+    budget = max_points - int(selected.sum())
+    codes = pd.factorize(df[strata])[0] if strata in df.columns else np.zeros(n_rows, dtype=np.int64)
+    remaining = np.flatnonzero(~selected)
+    remaining_codes = codes[remaining]
+    groups, sizes = np.unique(remaining_codes, return_counts=True)
+    if budget <= 0 or not len(groups):
+        return df.iloc[np.flatnonzero(selected)]
+
+    if len(groups) > budget:
+        # 그룹이 예산보다 많으면 큰 그룹부터 budget개만 1개씩 (나머지 그룹은 0개)
+        quotas = np.zeros(len(groups), dtype=int)
+        quotas[np.argsort(-sizes, kind='stable')[:budget]] = 1
+    else:
+        # 그룹 크기에 비례한 배분 (최소 1개) 후 예산을 넘으면 큰 그룹부터 줄임
+        quotas = np.minimum(np.maximum(np.floor(budget * sizes / sizes.sum()).astype(int), 1), sizes)
+        for i in np.argsort(-quotas):
+            if quotas.sum() <= budget:
+                break
+            quotas[i] -= min(quotas[i] - 1, quotas.sum() - budget)
+
+    for group, quota in zip(groups, quotas):
+        if quota:
+            members = remaining[remaining_codes == group]
+            selected[rng.choice(members, size=quota, replace=False)] = True
+
+    return df.iloc[np.flatnonzero(selected)]
@@ -0,0 +1,120 @@
+import hashlib
+import re
+from collections import Counter, defaultdict
+
+import config
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _line_hash(line):
+    """정규화한 줄의 64비트 해시 (프로세스마다 달라지는 hash() 대신 고정 해시 사용)"""
+    return int.from_bytes(hashlib.blake2b(line.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _normalize_line(line):
+    """비교용 줄 정규화 - 소문자화 및 공백 정리"""
+    return _WHITESPACE.sub(' ', line).strip().lower()
+
+
+def truncate_text(text, max_chars):
+    """
+    필드 글자 수 예산 적용 - 단어 중간에서 자르지 않도록 마지막 공백까지 되돌림
+
+    Args:
+        text (str): 원문
+        max_chars (int): 최대 글자 수 (None 또는 0이면 자르지 않음)
+
+    Returns:
+        str: 예산 이내로 자른 텍스트
+    """
+    if not max_chars or len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundary = max(cut.rfind(' '), cut.rfind('\n'))
+    return cut[:boundary] if boundary > max_chars // 2 else cut
+
+
+class BoilerplateDetector:
+    """
+    채널별 반복 설명 블록(상용구) 탐지기
+
+    같은 채널의 설명을 줄 단위로 해시해, 채널 동영상의 일정 비율 이상에 반복되는 줄
+    (구독 안내, 협찬 문구, SNS 링크 목록 등)을 상용구로 학습하고 토큰화 전에 제거합니다.
+    """
+
+    def __init__(self, min_videos=None, min_ratio=None, min_line_chars=None):
+        """
+        Args:
+            min_videos (int): 상용구로 볼 최소 반복 동영상 수 (기본값: config.BOILERPLATE_MIN_VIDEOS)
+            min_ratio (float): 채널 동영상 중 반복 비율 하한 (기본값: config.BOILERPLATE_MIN_RATIO)
+            min_line_chars (int): 학습 대상 줄의 최소 글자 수 (기본값: config.BOILERPLATE_MIN_LINE_CHARS)
+        """
+        self.min_videos = min_videos or config.BOILERPLATE_MIN_VIDEOS
+        self.min_ratio = min_ratio if min_ratio is not None else config.BOILERPLATE_MIN_RATIO
+        self.min_line_chars = min_line_chars or config.BOILERPLATE_MIN_LINE_CHARS
+        # 채널 -> 상용구 줄 해시 집합
+        self.channel_blocks = {}
+
+    def _line_hashes(self, text):
+        """설명 한 건의 (원문 줄, 해시 또는 None) 목록"""
+        hashed = []
+        for line in text.split('\n'):
+            normalized = _normalize_line(line)
+            if len(normalized) < self.min_line_chars:
+                hashed.append((line, None))
+            else:
+                hashed.append((line, _line_hash(normalized)))
+        return hashed
+
+    def fit(self, df, text_column='description', channel_column='channel_title'):
+        """
+        데이터셋 전체에서 채널별 상용구 줄 학습
+
+        Args:
+            df (pd.DataFrame): 동영상 데이터
+            text_column (str): 설명 컬럼
+            channel_column (str): 채널 구분 컬럼
+
+        Returns:
+            BoilerplateDetector: 체이닝용 자기 자신
+        """
+        self.channel_blocks = {}
+        if text_column not in df.columns or channel_column not in df.columns:
+            return self
+
+        line_videos = defaultdict(Counter)  # 채널 -> {줄 해시: 등장 동영상 수}
+        channel_videos = Counter()
+        for channel, text in zip(df[channel_column], df[text_column]):
+            if not isinstance(text, str) or not text:
+                continue
+            channel_videos[channel] += 1
+            hashes = {h for _, h in self._line_hashes(text) if h is not None}
+            line_videos[channel].update(hashes)
+
+        for channel, counts in line_videos.items():
+            threshold = max(self.min_videos, self.min_ratio * channel_videos[channel])
+            blocks = {h for h, n in counts.items() if n >= threshold}
+            if blocks:
+                self.channel_blocks[channel] = blocks
+        return self
+
+    def strip(self, text, channel):
+        """
+        학습된 채널 상용구 줄 제거
+
+        Args:
+            text (str): 설명 원문
+            channel (str): 채널 이름
+
+        Returns:
+            str: 상용구를 뺀 설명
+        """
+        blocks = self.channel_blocks.get(channel)
+        if not blocks or not isinstance(text, str):
+            return text
+        return '\n'.join(line for line, h in self._line_hashes(text) if h not in blocks)
+
+    def __len__(self):
+        """상용구가 학습된 채널 수"""
+        return len(self.channel_blocks)
@@ -0,0 +1,49 @@
+import re
+
+# 설명에서 분리하는 구조화 필드 (키워드 필드 순서)
+STRUCTURED_FIELDS = ('hashtags', 'chapters', 'mentions')
+
+# 챕터 줄("00:00 인트로", "1:02:03 - 하이라이트"), 해시태그, @멘션을 한 번에 찾는 정규식
+_STRUCTURED_PATTERN = re.compile(
+    r'^[ \t]*(?:\d{1,2}:)?\d{1,2}:\d{2}[ \t]*(?:[-–—:|][ \t]*)?(?P<chapter>[^\n]*)$'
+    r'|(?<![\w&/#])#(?P<hashtag>[0-9A-Za-z_가-힣]+)'
+    r'|(?<![\w.@/])@(?P<mention>[0-9A-Za-z_가-힣][0-9A-Za-z_.\-가-힣]*)',
+    re.MULTILINE
+)
+
+
+def parse_description(text):
+    """
+    설명에서 해시태그, 챕터 제목, @멘션을 분리 (정규식 한 번 순회)
+
+    clean_text는 '#'과 '@'를 다른 특수문자와 함께 지워 버리고 타임스탬프를 숫자 잡음으로
+    남기므로, 토큰화 전에 구조화 필드를 먼저 떼어 내고 나머지 본문만 형태소 분석합니다.
+
+    Args:
+        text (str): 설명 원문
+
+    Returns:
+        dict: {'body': 구조화 필드를 뺀 본문, 'hashtags': [...], 'chapters': [...], 'mentions': [...]}
+    """
+    parsed = {'hashtags': [], 'chapters': [], 'mentions': []}
+    if not isinstance(text, str) or not text:
+        parsed['body'] = text if isinstance(text, str) else ''
+        return parsed
+
+    def collect(match):
+        hashtag = match.group('hashtag')
+        if hashtag is not None:
+            parsed['hashtags'].append(hashtag)
+            return ' '
+        mention = match.group('mention')
+        if mention is not None:
+            parsed['mentions'].append(mention.rstrip('.-'))
+            return ' '
+        chapter = match.group('chapter').strip()
+        if chapter:
+            parsed['chapters'].append(chapter)
+        return ''
+
+    parsed['body'] = _STRUCTURED_PATTERN.sub(collect, text)
+    return parsed
+
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+import config
+
+
+class FacetIndex:
+    """
+    대시보드 필터 패싯 색인 (데이터셋당 한 번 생성)
+
+    카테고리별 행 비트맵, 조회수 정렬 배열, 키워드 역색인을 미리 만들어 두고
+    필터 조합은 불리언 배열 AND로만 계산합니다. 행 번호는 색인을 만든 DataFrame의 위치 순서입니다.
+    """
+
+    def __init__(self, df, keyword_index=None):
+        """
+        Args:
+            df (pd.DataFrame): 동영상 데이터
+            keyword_index (KeywordIndex): 같은 DataFrame으로 만든 키워드 역색인 (없으면 키워드 필터 미지원)
+        """
+        self.n_videos = len(df)
+        self.keyword_index = keyword_index
+
+        # 카테고리: 첫 등장 순서의 카테고리 목록과 카테고리별 행 비트맵
+        if 'category_id' in df.columns:
+            codes, categories = pd.factorize(df['category_id'], sort=False)
+        else:
+            codes, categories = np.full(self.n_videos, -1), []
+        self.categories = list(categories)
+        self._category_bitmaps = {category: codes == i for i, category in enumerate(self.categories)}
+        # 화면에 보이는 카테고리 이름 -> 카테고리 ID (매핑에 없는 ID도 "카테고리 N" 이름으로 선택 가능)
+        self._category_by_name = dict(zip(self.category_names(), self.categories))
+
+        # 조회수: 정렬된 값과 원래 행 번호 (범위 조회는 이진 탐색 두 번)
+        views = df['view_count'].to_numpy() if 'view_count' in df.columns else np.zeros(self.n_videos)
+        self._view_order = np.argsort(views, kind='stable')
+        self._sorted_views = views[self._view_order]
+
+    @property
+    def view_min(self):
+        """최소 조회수"""
+        return self._sorted_views[0].item() if self.n_videos else 0
+
+    @property
+    def view_max(self):
+        """최대 조회수"""
+        return self._sorted_views[-1].item() if self.n_videos else 0
+
+    def category_names(self):
+        """데이터에 있는 카테고리 이름 목록 (첫 등장 순서)"""
+        return [config.CATEGORY_MAPPING.get(category, f"카테고리 {category}") for category in self.categories]
+
+    def category_mask(self, category_names):
+        """선택한 카테고리 이름 중 하나에 속한 행 (OR)"""
+        mask = np.zeros(self.n_videos, dtype=bool)
+        for name in category_names:
+            bitmap = self._category_bitmaps.get(self._category_by_name.get(name))
+            if bitmap is not None:
+                mask |= bitmap
+        return mask
+
+    def view_mask(self, low, high):
+        """조회수가 [low, high] 범위인 행"""
+        start = np.searchsorted(self._sorted_views, low, side='left')
+        end = np.searchsorted(self._sorted_views, high, side='right')
+        mask = np.zeros(self.n_videos, dtype=bool)
+        mask[self._view_order[start:end]] = True
+        return mask
+
+    def keyword_mask(self, keywords):
+        """선택한 키워드 중 하나라도 나온 행 (OR)"""
+        return self.keyword_index.mask(self.keyword_index.union(keywords))
+
+    def supports_keywords(self, keywords):
+        """모든 키워드를 역색인으로 처리할 수 있는지"""
+        return self.keyword_index is not None and all(keyword in self.keyword_index for keyword in keywords)
+
+    def resolve(self, keywords=None, category_names=None, views_range=None):
+        """
+        필터 조합을 행 비트맵 AND로 계산
+
+        Args:
+            keywords (list): 키워드 조건 (supports_keywords가 참일 때만)
+            category_names (list): 카테고리 이름 조건
+            views_range (tuple): (최소, 최대) 조회수
+
+        Returns:
+            np.ndarray: 조건을 모두 만족하는 행 번호 (오름차순)
+        """
+        mask = np.ones(self.n_videos, dtype=bool)
+        if views_range is not None and (views_range[0] > self.view_min or views_range[1] < self.view_max):
+            mask &= self.view_mask(*views_range)
+        if category_names:
+            mask &= self.category_mask(category_names)
+        if keywords:
+            mask &= self.keyword_mask(keywords)
+        return np.flatnonzero(mask)
@@ -0,0 +1,138 @@
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import config
+
+
+def _feed(hasher, value):
+    """값의 내용을 해시에 누적 (DataFrame·배열은 벡터화 해시, 컨테이너는 재귀)"""
+    if isinstance(value, pd.DataFrame):
+        hasher.update(f"df{value.shape}{list(value.columns)}".encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(value.index).to_numpy().tobytes())
+        for _, column in value.items():
+            _feed(hasher, column)
+    elif isinstance(value, pd.Series):
+        try:
+            hashed = pd.util.hash_pandas_object(value, index=False)
+        except TypeError:
+            # 리스트(태그 등)처럼 해시할 수 없는 값이 든 열은 문자열로 변환해 해시
+            hashed = pd.util.hash_pandas_object(value.astype(str), index=False)
+        hasher.update(f"s{value.name}{value.dtype}".encode('utf-8'))
+        hasher.update(hashed.to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"a{value.shape}{value.dtype}".encode('utf-8'))
+        hasher.update(value.astype(str).tobytes() if value.dtype == object else np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        hasher.update(b'{')
+        for key, item in value.items():
+            _feed(hasher, key)
+            _feed(hasher, item)
+        hasher.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'[')
+        for item in value:
+            _feed(hasher, item)
+        hasher.update(b']')
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode('utf-8'))
+
+
+def fingerprint(*values):
+    """입력 데이터 지문 (내용이 같으면 객체가 달라도 같은 값)"""
+    hasher = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _feed(hasher, value)
+    return hasher.hexdigest()
+
+
+class FigureCache:
+    """
+    Plotly 그림 LRU 캐시 (프로세스 공용)
+
+    그림은 JSON 문자열로 보관하므로 세션 간에 공유해도 서로의 수정이 섞이지 않습니다.
+    적중·미스·제거 횟수를 세어 stats()로 확인할 수 있습니다.
+    """
+
+    def __init__(self, max_entries=None):
+        """
+        Args:
+            max_entries (int): 보관할 최대 그림 수 (기본값: config.FIGURE_CACHE_SIZE)
+        """
+        self.max_entries = max_entries or config.FIGURE_CACHE_SIZE
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """캐시된 그림 (없으면 None) - 호출마다 새 Figure 객체"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # 검증을 마친 그림의 JSON이므로 다시 검증하지 않고 복원
+        return go.Figure(json.loads(payload), _validate=False)
+
+    def put(self, key, fig):
+        """그림 저장 (가장 오래 쓰지 않은 항목부터 제거)"""
+        if fig is None:
+            return
+        payload = fig.to_json()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """모든 그림 삭제 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'bytes': sum(len(payload) for payload in self._entries.values())
+            }
+
+
+# 프로세스 공용 캐시 (모든 세션의 Visualizer가 공유)
+figure_cache = FigureCache()
+
+
+def cached_figure(method):
+    """
+    Visualizer.create_* 메서드 결과를 figure_cache에 저장하는 데코레이터
+
+    키는 (메서드 이름, 테마, 글꼴, 인자 지문)이며, 그림 생성에 실패해 None을 반환하면 저장하지 않습니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        theme = (self.is_dark_mode, self.get_current_theme(), self.font_family)
+        key = (method.__name__, theme, fingerprint(args, sorted(kwargs.items())))
+        fig = figure_cache.get(key)
+        if fig is None:
+            fig = method(self, *args, **kwargs)
+            figure_cache.put(key, fig)
+        return fig
+    return wrapper
@@ -0,0 +1,124 @@
+import os
+from functools import lru_cache
+
+import config
+
+# 한글 글리프가 있는 시스템 폰트 후보 (번들 폰트 다음 순서로 확인)
+KOREAN_FONT_CANDIDATES = [
+    # Streamlit Cloud / Linux 배포 환경 (packages.txt의 fonts-nanum)
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+    '/usr/share/fonts/truetype/nanum-coding/NanumGothicCoding.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    # macOS
+    '/System/Library/Fonts/AppleSDGothicNeo.ttc',
+    '/System/Library/Fonts/AppleGothic.ttf',
+    '/Library/Fonts/NanumGothic.ttf',
+    # Windows
+    'C:/Windows/Fonts/malgun.ttf',
+    'C:/Windows/Fonts/gulim.ttc',
+    'C:/Windows/Fonts/batang.ttc',
+]
+
+# 시스템 폰트 목록에서 찾을 한글 폰트 이름 (우선순위)
+KOREAN_FONT_NAMES = ('nanum', 'malgun', 'applesdgothic', 'applegothic', 'notosanscjk', 'notosanskr', 'gulim',
+                     'batang')
+
+# 한글 폰트가 없을 때 마지막으로 쓰는 유니코드 폰트 (한글은 네모로 표시될 수 있음)
+FALLBACK_FONT_CANDIDATES = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans.ttf',
+    '/usr/share/fonts/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+]
+
+# Plotly는 브라우저 글꼴로 그리므로 등록된 폰트 뒤에 흔한 한글 글꼴 이름을 대체 목록으로 둠
+PLOTLY_FALLBACK_FAMILIES = ['NanumGothic', 'Malgun Gothic', 'Apple SD Gothic Neo', 'Noto Sans KR', 'Arial',
+                            'sans-serif']
+
+
+def _is_usable_font(path):
+    """실제로 열 수 있는 폰트 파일인지 (다운로드 실패로 남은 빈 파일 등 제외)"""
+    if not path or not os.path.isfile(path):
+        return False
+    try:
+        from PIL import ImageFont
+        ImageFont.truetype(path, 12)
+        return True
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def korean_font_path():
+    """
+    한글 폰트 경로 - 프로세스당 한 번만 탐색
+
+    번들 폰트(config.BUNDLED_FONT_PATH) → 알려진 시스템 경로 → Matplotlib 시스템 폰트 목록 →
+    유니코드 대체 폰트 순서로 찾습니다.
+
+    Returns:
+        str: 폰트 파일 경로 (없으면 None)
+    """
+    for path in [config.BUNDLED_FONT_PATH] + KOREAN_FONT_CANDIDATES:
+        if _is_usable_font(path):
+            return path
+
+    try:
+        from matplotlib import font_manager
+        system_fonts = font_manager.findSystemFonts()
+        for name in KOREAN_FONT_NAMES:
+            for path in system_fonts:
+                if name in os.path.basename(path).lower().replace(' ', '') and _is_usable_font(path):
+                    return path
+    except Exception as e:
+        print(f"시스템 폰트 검색 중 오류: {e}")
+
+    for path in FALLBACK_FONT_CANDIDATES:
+        if _is_usable_font(path):
+            print(f"한글 폰트를 찾지 못해 대체 폰트를 사용합니다: {path}")
+            return path
+
+    print("사용할 수 있는 폰트를 찾지 못했습니다. 라이브러리 기본 폰트를 사용합니다.")
+    return None
+
+
+@lru_cache(maxsize=1)
+def korean_font_name():
+    """
+    한글 폰트를 Matplotlib 폰트 관리자에 등록하고 패밀리 이름 반환 (프로세스당 한 번)
+
+    Returns:
+        str: 폰트 패밀리 이름 (폰트가 없거나 등록 실패 시 None)
+    """
+    path = korean_font_path()
+    if path is None:
+        return None
+    try:
+        from matplotlib import font_manager
+        font_manager.fontManager.addfont(path)
+        return font_manager.FontProperties(fname=path).get_name()
+    except Exception as e:
+        print(f"Matplotlib 폰트 등록 실패: {e}")
+        return None
+
+
+def configure_matplotlib():
+    """Matplotlib 기본 글꼴을 등록된 한글 폰트로 설정"""
+    import matplotlib.pyplot as plt
+
+    name = korean_font_name()
+    if name:
+        plt.rcParams['font.family'] = 'sans-serif'
+        plt.rcParams['font.sans-serif'] = [name] + [
+            family for family in plt.rcParams['font.sans-serif'] if family != name
+        ]
+    plt.rcParams['axes.unicode_minus'] = False
+
+
+def plotly_font_family():
+    """Plotly 레이아웃용 글꼴 패밀리 문자열 (한글 폰트를 찾았으면 그 폰트 우선)"""
+    registered = korean_font_name() if korean_font_path() not in FALLBACK_FONT_CANDIDATES else None
+    families = [registered] + PLOTLY_FALLBACK_FAMILIES
+    return ', '.join(dict.fromkeys(family for family in families if family))
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+
+import config
+
+# 한글 음절 -> 로마자 (국어의 로마자 표기법 기준, 받침은 대표음)
+_INITIALS = ['g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj', 'ch', 'k', 't', 'p', 'h']
+_MEDIALS = ['a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo', 'u', 'wo', 'we', 'wi',
+            'yu', 'eu', 'ui', 'i']
+_FINALS = ['', 'k', 'k', 'k', 'n', 'n', 'n', 't', 'l', 'k', 'm', 'l', 'l', 'l', 'p', 'l', 'm', 'p', 'p', 't', 't',
+           'ng', 't', 't', 'k', 't', 'p', 't']
+
+# 자음 골격 비교용 치환 (유/무성, 외래어 표기 차이 흡수)
+_SKELETON_MAP = str.maketrans({'g': 'k', 'q': 'k', 'c': 'k', 'd': 't', 'b': 'p', 'f': 'p', 'v': 'p',
+                               'z': 'j', 'l': 'r', 'x': 'k'})
+_SKELETON_DROP = re.compile(r'[aeiouywh\W\d_]+')
+
+
+def romanize(text):
+    """한글 음절을 로마자로 변환 (한글이 아닌 문자는 그대로 유지)"""
+    result = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            initial, rest = divmod(code, 588)
+            medial, final = divmod(rest, 28)
+            result.append(_INITIALS[initial] + _MEDIALS[medial] + _FINALS[final])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def _skeleton(text):
+    """로마자 자음 골격 ("뉴진스" -> "njns", "NewJeans" -> "njns")"""
+    skeleton = _SKELETON_DROP.sub('', romanize(text).lower()).translate(_SKELETON_MAP)
+    return re.sub(r'(.)\1+', r'\1', skeleton)
+
+
+def _initials(text):
+    """한글 음절별 초성의 로마자 첫 글자 ("방탄소년단" -> "btsnd")"""
+    letters = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            letters.append((_INITIALS[code // 588] or 'o')[0])
+        else:
+            return ''
+    return ''.join(letters)
+
+
+def _char_ngrams(text, n=2):
+    """공백을 뺀 소문자 문자 n-gram 집합"""
+    text = re.sub(r'\s+', '', text.lower())
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _collapse(phrase):
+    """여러 단어 별칭의 공백 없는 소문자 형태"""
+    return re.sub(r'\s+', '', phrase.lower())
+
+
+class KeywordAliasIndex:
+    """
+    키워드 표기 통합(정규화) 색인
+
+    config.KEYWORD_ALIASES 기본 사전과 사용자가 편집하는 JSON 사전(config.KEYWORD_ALIAS_PATH)을
+    {별칭: 대표 키워드} 딕셔너리 하나로 펼쳐 두므로 토큰당 조회는 O(1)입니다.
+    영문(ASCII) 토큰은 소문자로 통일한 뒤 조회합니다.
+
+    토큰 단위로는 찾을 수 없는 여러 단어 별칭("new jeans")은 토큰화 전에 replace_phrases로
+    원문에서 공백을 뺀 한 단어("newjeans")로 바꾸고, 그 형태도 같은 대표 키워드로 등록합니다.
+    """
+
+    def __init__(self, alias_path=None):
+        """
+        Args:
+            alias_path (str): 사용자 별칭 사전 JSON 경로 (기본값: config.KEYWORD_ALIAS_PATH)
+        """
+        self.alias_path = alias_path or config.KEYWORD_ALIAS_PATH
+        self.user_aliases = {}
+        self._lookup = {}
+        self._phrase_pattern = None
+        # 사전 내용 지문 (같은 사전이면 세션·인스턴스가 달라도 같은 값 - 추출 결과 캐시 키용)
+        self.version = ''
+        self.load()
+
+    def _rebuild(self):
+        """기본 사전 + 사용자 사전을 별칭 -> 대표 키워드 딕셔너리로 펼침 (사용자 사전 우선)"""
+        lookup = {}
+
+        def assign(alias, canonical):
+            lookup[alias] = canonical
+            if alias.isascii():
+                lookup[alias.lower()] = canonical
+
+        # 사용자 사전을 나중에 적용하므로 기본 사전의 대표 키워드도 사용자가 다른 키워드로 합칠 수 있음
+        for source in (config.KEYWORD_ALIASES, self.user_aliases):
+            aliased = set()
+            for canonical, aliases in source.items():
+                for alias in aliases:
+                    assign(alias, canonical)
+                    aliased.add(alias)
+            # 대표 키워드 자신은 자기 자신으로 (같은 사전에서 다른 대표 키워드로 합친 경우는 제외)
+            for canonical in source:
+                if canonical not in aliased:
+                    assign(canonical, canonical)
+
+        # 별칭 -> 대표 -> 새 대표 체인을 최종 대표 키워드로 펼침 ("newjeans" -> "뉴진스" -> 사용자 대표)
+        for alias in list(lookup):
+            canonical = lookup[alias]
+            seen = {alias}
+            while lookup.get(canonical, canonical) != canonical and canonical not in seen:
+                seen.add(canonical)
+                canonical = lookup[canonical]
+            lookup[alias] = canonical
+
+        # 여러 단어 별칭은 공백을 뺀 형태로 원문을 바꾸므로 그 형태도 조회되게 등록 (긴 별칭부터 매칭)
+        phrases = {}
+        for alias, canonical in lookup.items():
+            if len(alias.split()) > 1:
+                phrases.setdefault(alias.lower(), canonical)
+        for phrase, canonical in phrases.items():
+            lookup.setdefault(_collapse(phrase), canonical)
+        patterns = [r'\s+'.join(map(re.escape, phrase.split())) for phrase in sorted(phrases, key=len, reverse=True)]
+        self._phrase_pattern = (re.compile(r'(?<!\w)(?:' + '|'.join(patterns) + r')(?!\w)', re.IGNORECASE)
+                                if patterns else None)
+
+        self._lookup = lookup
+        payload = json.dumps(sorted(lookup.items()), ensure_ascii=False)
+        self.version = hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+    def load(self):
+        """사용자 별칭 사전 불러오기"""
+        self.user_aliases = {}
+        if os.path.exists(self.alias_path):
+            try:
+                with open(self.alias_path, 'r', encoding='utf-8') as f:
+                    self.user_aliases = {canonical: list(aliases) for canonical, aliases in json.load(f).items()}
+            except Exception as e:
+                print(f"키워드 별칭 사전 불러오기 실패: {e}")
+        self._rebuild()
+        return self
+
+    def save(self):
+        """사용자 별칭 사전 저장"""
+        try:
+            directory = os.path.dirname(self.alias_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.alias_path, 'w', encoding='utf-8') as f:
+                json.dump(self.user_aliases, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"키워드 별칭 사전 저장 실패: {e}")
+
+    def add_alias(self, canonical, alias):
+        """사용자 별칭 추가 (save()를 호출해야 파일에 반영)"""
+        if not canonical or not alias or canonical == alias:
+            return
+        aliases = self.user_aliases.setdefault(canonical, [])
+        if alias not in aliases:
+            aliases.append(alias)
+        # 별칭이 원래 대표 키워드였다면 그 별칭들도 새 대표 키워드로 옮김
+        for moved in self.user_aliases.pop(alias, []):
+            if moved != canonical and moved not in aliases:
+                aliases.append(moved)
+        self._rebuild()
+
+    def replace_phrases(self, text):
+        """원문의 여러 단어 별칭을 공백 없는 한 단어로 변환 ("New Jeans 신곡" -> "newjeans 신곡")"""
+        if self._phrase_pattern is None or not text:
+            return text
+        return self._phrase_pattern.sub(lambda match: _collapse(match.group(0)), text)
+
+    def canonicalize(self, token):
+        """토큰 하나의 대표 키워드 (O(1) 딕셔너리 조회)"""
+        canonical = self._lookup.get(token)
+        if canonical is not None:
+            return canonical
+        if token.isascii():
+            lowered = token.lower()
+            return self._lookup.get(lowered, lowered)
+        return token
+
+    def canonicalize_fields(self, field_keywords):
+        """{필드: 키워드 목록}의 모든 키워드를 대표 키워드로 변환"""
+        canonicalize = self.canonicalize
+        return {field: [canonicalize(keyword) for keyword in keywords]
+                for field, keywords in field_keywords.items()}
+
+    def surface_forms(self, keyword):
+        """대표 키워드와 그 별칭 전체 (원문 검색용)"""
+        forms = {keyword}
+        forms.update(alias for alias, canonical in self._lookup.items() if canonical == keyword)
+        return sorted(forms)
+
+    def suggest_merges(self, keyword_freq, threshold=None, max_suggestions=None):
+        """
+        표기가 다른 같은 대상으로 보이는 키워드 쌍 제안
+
+        후보는 문자 2-gram, 로마자 자음 골격, 한글 초성 약어로 만든 색인에서만 뽑으므로
+        모든 쌍을 비교하지 않습니다. 점수:
+            - 문자 2-gram Jaccard 유사도 ("new jeans" / "newjeans")
+            - 로마자 자음 골격 일치 0.9 ("뉴진스" / "newjeans")
+            - 영문 약어가 한글 초성과 일치 0.85 ("bts" / "방탄소년단")
+
+        Args:
+            keyword_freq (dict): {키워드: 빈도}
+            threshold (float): 제안할 최소 점수 (기본값: config.KEYWORD_ALIAS_SUGGEST_THRESHOLD)
+            max_suggestions (int): 최대 제안 수
+
+        Returns:
+            list: [{'canonical', 'alias', 'score', 'reason'}] (점수 내림차순, 빈도가 높은 쪽이 대표)
+        """
+        if threshold is None:
+            threshold = config.KEYWORD_ALIAS_SUGGEST_THRESHOLD
+        keywords = list(keyword_freq)
+
+        ngram_index = defaultdict(set)
+        skeleton_index = defaultdict(set)
+        initials_index = defaultdict(set)
+        ngrams = {}
+        for keyword in keywords:
+            ngrams[keyword] = _char_ngrams(keyword)
+            for gram in ngrams[keyword]:
+                ngram_index[gram].add(keyword)
+            skeleton = _skeleton(keyword)
+            if len(skeleton) >= 3:
+                skeleton_index[skeleton].add(keyword)
+            initials = _initials(keyword.replace(' ', ''))
+            for length in range(2, min(len(initials), 5) + 1):
+                initials_index[initials[:length]].add(keyword)
+
+        scores = {}
+
+        def propose(first, second, score, reason):
+            if first == second or self.canonicalize(first) == self.canonicalize(second):
+                return
+            pair = tuple(sorted((first, second)))
+            if score > scores.get(pair, (0, ''))[0]:
+                scores[pair] = (score, reason)
+
+        for keyword in keywords:
+            grams = ngrams[keyword]
+            if grams:
+                candidates = set()
+                for gram in grams:
+                    candidates |= ngram_index[gram]
+                for other in candidates:
+                    other_grams = ngrams[other]
+                    similarity = len(grams & other_grams) / len(grams | other_grams)
+                    if similarity >= threshold:
+                        propose(keyword, other, similarity, '문자 유사')
+            skeleton = _skeleton(keyword)
+            for other in skeleton_index.get(skeleton, ()):
+                propose(keyword, other, 0.9, '발음 유사')
+            if keyword.isascii() and keyword.isalpha() and 2 <= len(keyword) <= 5:
+                for other in initials_index.get(keyword.lower(), ()):
+                    propose(keyword, other, 0.85, '약어')
+
+        suggestions = []
+        for (first, second), (score, reason) in scores.items():
+            if score < threshold:
+                continue
+            # 빈도가 높은 쪽(같으면 한글 표기)을 대표 키워드로
+            canonical, alias = sorted(
+                (first, second), key=lambda k: (keyword_freq.get(k, 0), not k.isascii()), reverse=True
+            )
+            suggestions.append({'canonical': canonical, 'alias': alias, 'score': round(score, 2), 'reason': reason})
+
+        suggestions.sort(key=lambda s: (s['score'], keyword_freq.get(s['canonical'], 0)), reverse=True)
+        return suggestions[:max_suggestions] if max_suggestions else suggestions
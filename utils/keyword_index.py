@@ -0,0 +1,112 @@
+from functools import reduce
+
+import numpy as np
+from scipy import sparse
+
+
+class KeywordIndex:
+    """
+    키워드 -> 동영상 행 번호 역색인
+
+    KeywordMatrix의 출현 여부를 CSC(열 압축) 형태로 바꿔, 키워드마다 정렬된 행 번호 배열을
+    하나의 연속 배열 구간으로 보관합니다. 키워드 필터와 유사도 계산을 텍스트 재검색 없이
+    정렬 배열의 합집합·교집합으로 처리합니다. 행 번호는 색인을 만든 DataFrame의 위치 순서입니다.
+    """
+
+    def __init__(self, vocabulary, indptr, indices, n_videos):
+        """
+        Args:
+            vocabulary (list): 열 순서대로 나열한 키워드
+            indptr (np.ndarray): 키워드별 행 번호 구간 시작 위치 (길이 = 키워드 수 + 1)
+            indices (np.ndarray): 키워드 순서로 이어 붙인 정렬된 행 번호
+            n_videos (int): 동영상 수
+        """
+        self.vocabulary = list(vocabulary)
+        self.vocabulary_index = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+        self.indptr = indptr
+        self.indices = indices
+        self.n_videos = n_videos
+
+    @classmethod
+    def from_matrix(cls, keyword_matrix, fields=None):
+        """
+        동영상 × 키워드 행렬에서 역색인 생성
+
+        Args:
+            keyword_matrix (KeywordMatrix): TextProcessor.build_keyword_matrix 결과
+            fields (list): 색인할 필드 (기본값: 전체 필드)
+
+        Returns:
+            KeywordIndex: 생성된 역색인
+        """
+        presence = keyword_matrix.counts(fields).tocsc()
+        presence.eliminate_zeros()
+        presence.sort_indices()
+        indices = presence.indices.astype(np.int32, copy=False)
+        return cls(keyword_matrix.vocabulary, presence.indptr, indices, keyword_matrix.n_videos)
+
+    def __contains__(self, keyword):
+        """색인을 만든 추출 결과의 어휘에 있는 키워드인지 (색인 필드에 나오지 않았으면 행 번호는 비어 있음)"""
+        return keyword in self.vocabulary_index
+
+    def __len__(self):
+        """색인된 키워드 수"""
+        return len(self.vocabulary)
+
+    def rows(self, keyword):
+        """키워드가 나온 동영상 행 번호 (정렬된 배열, 없는 키워드는 빈 배열)"""
+        index = self.vocabulary_index.get(keyword)
+        if index is None:
+            return np.empty(0, dtype=np.int32)
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def document_frequency(self, keyword):
+        """키워드가 나온 동영상 수"""
+        index = self.vocabulary_index.get(keyword)
+        return 0 if index is None else int(self.indptr[index + 1] - self.indptr[index])
+
+    def union(self, keywords):
+        """키워드 중 하나라도 나온 동영상 행 번호 (OR)"""
+        postings = [self.rows(keyword) for keyword in keywords]
+        if not postings:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(postings))
+
+    def intersection(self, keywords):
+        """키워드가 모두 나온 동영상 행 번호 (AND) - 짧은 목록부터 교집합"""
+        postings = sorted((self.rows(keyword) for keyword in keywords), key=len)
+        if not postings:
+            return np.empty(0, dtype=np.int32)
+        return reduce(
+            lambda result, rows: np.intersect1d(result, rows, assume_unique=True) if len(result) else result,
+            postings[1:], postings[0]
+        )
+
+    def mask(self, rows):
+        """행 번호 배열을 동영상 수 길이의 불리언 마스크로 변환"""
+        mask = np.zeros(self.n_videos, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def jaccard(self, keyword1, keyword2):
+        """두 키워드가 나온 동영상 집합의 Jaccard 유사도"""
+        first, second = self.rows(keyword1), self.rows(keyword2)
+        intersection = len(np.intersect1d(first, second, assume_unique=True))
+        union = len(first) + len(second) - intersection
+        return intersection / union if union else 0
+
+    def presence(self, keywords):
+        """
+        키워드 포함 여부 행렬 (KeywordMatcher.presence와 같은 형태)
+
+        Returns:
+            scipy.sparse.csr_matrix: (동영상 수 × 키워드 수) 0/1 행렬
+        """
+        columns = [self.rows(keyword) for keyword in keywords]
+        indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(rows) for rows in columns])
+        indices = np.concatenate(columns) if columns else np.empty(0, dtype=np.int32)
+        return sparse.csc_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(self.n_videos, len(columns))
+        ).tocsr()
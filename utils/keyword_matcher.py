@@ -0,0 +1,116 @@
+from collections import deque
+
+import numpy as np
+from scipy import sparse
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 다중 패턴 매처
+
+    키워드(와 별칭 표기)를 오토마톤 하나로 묶어 두고 텍스트를 한 번만 훑어
+    포함된 키워드를 모두 찾습니다. 키워드 수만큼 부분 문자열 검색을 반복하지 않습니다.
+    대소문자는 구분하지 않습니다.
+    """
+
+    def __init__(self, keywords, surface_forms=None):
+        """
+        Args:
+            keywords (list): 찾을 키워드 (결과 열 순서)
+            surface_forms (callable): 키워드 -> 원문에서 찾을 표기 목록 (기본값: 키워드 자신)
+        """
+        self.keywords = list(keywords)
+
+        # 패턴(소문자) -> 키워드 번호 집합 (여러 키워드가 같은 표기를 공유할 수 있음)
+        patterns = {}
+        for index, keyword in enumerate(self.keywords):
+            forms = surface_forms(keyword) if surface_forms else [keyword]
+            for form in forms:
+                form = str(form).lower()
+                if form:
+                    patterns.setdefault(form, set()).add(index)
+
+        self._build(patterns)
+
+    def _build(self, patterns):
+        """트라이 생성 후 실패 링크와 출력 집합 계산 (전이는 패턴에 나온 문자만 보관)"""
+        goto = [{}]
+        outputs = [set()]
+        for pattern, indices in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state] |= indices
+
+        # 너비 우선으로 실패 링크 계산 - 상태마다 루트 전이표를 복사하지 않고 검색할 때 실패 링크를 따라감
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0) if state else 0
+                outputs[next_state] |= outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [frozenset(output) for output in outputs]
+
+    def find(self, text):
+        """
+        텍스트에 포함된 키워드 번호 집합
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            set: 포함된 키워드의 번호 (self.keywords 기준)
+        """
+        found = set()
+        if not text or not self.keywords:
+            return found
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        n_keywords = len(self.keywords)
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+                if len(found) == n_keywords:
+                    break
+        return found
+
+    def presence(self, texts):
+        """
+        텍스트별 키워드 포함 여부 행렬
+
+        Args:
+            texts (iterable): 동영상별 텍스트
+
+        Returns:
+            scipy.sparse.csr_matrix: (텍스트 수 × 키워드 수) 0/1 행렬
+        """
+        indices = []
+        indptr = [0]
+        for text in texts:
+            indices.extend(sorted(self.find(text)))
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.keywords))
+        )
@@ -0,0 +1,153 @@
+import numpy as np
+from scipy import sparse
+
+
+class KeywordMatrix:
+    """동영상 × 키워드 희소 빈도 행렬 (필드별로 보관)"""
+
+    def __init__(self, vocabulary, field_matrices):
+        """
+        Args:
+            vocabulary (list): 열 순서대로 나열한 키워드
+            field_matrices (dict): {필드: (동영상 수 × 키워드 수) CSR 빈도 행렬}
+        """
+        self.vocabulary = list(vocabulary)
+        self.vocabulary_index = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+        self.field_matrices = field_matrices
+        self._incidence_cache = {}
+        self._counts_cache = {}
+
+    @classmethod
+    def from_field_tokens(cls, field_tokens, n_videos=None):
+        """
+        필드별 동영상 키워드 목록에서 행렬 생성
+
+        Args:
+            field_tokens (dict): {필드: 동영상 순서대로 나열한 키워드 목록들}
+            n_videos (int): 동영상 수 (기본값: 가장 긴 필드 목록의 길이)
+
+        Returns:
+            KeywordMatrix: 생성된 행렬
+        """
+        vocabulary_index = {}
+        fields = list(field_tokens)
+        raw = {field: ([], [0]) for field in fields}
+        n_rows = max((len(token_lists) for token_lists in field_tokens.values()), default=0)
+
+        # 동영상(행) 순서 → 필드 순서로 훑어 키워드 열 번호를 첫 등장 순서대로 부여
+        for row in range(n_rows):
+            for field in fields:
+                indices, indptr = raw[field]
+                token_lists = field_tokens[field]
+                tokens = token_lists[row] if row < len(token_lists) else []
+                for token in tokens:
+                    index = vocabulary_index.get(token)
+                    if index is None:
+                        index = len(vocabulary_index)
+                        vocabulary_index[token] = index
+                    indices.append(index)
+                indptr.append(len(indices))
+
+        if n_videos is None:
+            n_videos = n_rows
+        shape = (n_videos, len(vocabulary_index))
+
+        field_matrices = {}
+        for field, (indices, indptr) in raw.items():
+            matrix = sparse.csr_matrix(
+                (np.ones(len(indices), dtype=np.int32),
+                 np.asarray(indices, dtype=np.int32),
+                 np.asarray(indptr, dtype=np.int64)),
+                shape=shape
+            )
+            # 같은 동영상 안의 반복 등장을 합산
+            matrix.sum_duplicates()
+            field_matrices[field] = matrix
+
+        vocabulary = sorted(vocabulary_index, key=vocabulary_index.get)
+        return cls(vocabulary, field_matrices)
+
+    @property
+    def n_videos(self):
+        """행(동영상) 수"""
+        return next(iter(self.field_matrices.values())).shape[0] if self.field_matrices else 0
+
+    @property
+    def fields(self):
+        """보관 중인 필드 목록"""
+        return list(self.field_matrices)
+
+    def counts(self, fields=None):
+        """필드를 합친 동영상 × 키워드 빈도 행렬"""
+        if fields is None:
+            fields = self.fields
+        total = None
+        for field in fields:
+            if field in self.field_matrices:
+                matrix = self.field_matrices[field]
+                total = matrix if total is None else total + matrix
+        if total is None:
+            return sparse.csr_matrix((self.n_videos, len(self.vocabulary)), dtype=np.int32)
+        return total.tocsr()
+
+    def frequency(self, rows=None, fields=None):
+        """
+        키워드별 출현 빈도 - 동영상별 빈도 행을 선택한 행만 합산 (형태소 분석 재실행 없음)
+
+        Args:
+            rows (array-like): 합산할 행 위치 (기본값: 전체)
+            fields (list): 합산할 필드 (기본값: 전체 필드)
+
+        Returns:
+            np.ndarray: 열(키워드) 순서의 빈도 벡터
+        """
+        cache_key = tuple(fields) if fields is not None else None
+        counts = self._counts_cache.get(cache_key)
+        if counts is None:
+            counts = self._counts_cache[cache_key] = self.counts(fields)
+        if rows is not None:
+            counts = counts[np.asarray(rows, dtype=np.int64)]
+        return np.asarray(counts.sum(axis=0)).ravel()
+
+    def incidence(self, field_weights):
+        """
+        필드 가중 출현 행렬 - 필드마다 키워드가 한 번이라도 나오면 해당 필드 가중치를 더함
+
+        태그에 같은 키워드를 수십 번 넣어도 필드 가중치만큼만 반영됩니다.
+
+        Args:
+            field_weights (dict): {필드: 가중치}
+
+        Returns:
+            scipy.sparse.csr_matrix: 동영상 × 키워드 가중 출현 행렬
+        """
+        cache_key = tuple(sorted(field_weights.items()))
+        cached = self._incidence_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        weighted = sparse.csr_matrix((self.n_videos, len(self.vocabulary)), dtype=np.float64)
+        for field, weight in field_weights.items():
+            matrix = self.field_matrices.get(field)
+            if matrix is None or not weight:
+                continue
+            presence = matrix.astype(np.float64)
+            presence.data[:] = weight
+            weighted = weighted + presence
+
+        weighted = weighted.tocsr()
+        self._incidence_cache[cache_key] = weighted
+        return weighted
+
+    def top_keywords(self, scores, max_keywords):
+        """점수 벡터에서 상위 키워드 {키워드: 점수} 딕셔너리 생성"""
+        nonzero = np.flatnonzero(scores)
+        if len(nonzero) > max_keywords:
+            # 전체 정렬 대신 k번째 점수 이상인 후보만 골라 정렬 (경계 동점은 모두 후보로 유지)
+            kth_score = np.partition(scores[nonzero], len(nonzero) - max_keywords)[len(nonzero) - max_keywords]
+            candidates = nonzero[scores[nonzero] >= kth_score]
+        else:
+            candidates = nonzero
+        # 점수 내림차순, 동점이면 먼저 등장한 키워드 우선 (Counter.most_common과 동일)
+        order = candidates[np.lexsort((candidates, -scores[candidates]))][:max_keywords]
+        return {self.vocabulary[i]: scores[i].item() for i in order}
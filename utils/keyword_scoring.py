@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+import config
+
+# 랭킹 방식 (표시 이름 -> 내부 모드)
+RANKING_MODES = {
+    '출현 빈도': 'frequency',
+    '조회수 가중': 'views',
+    '좋아요 가중': 'likes',
+    '댓글 가중': 'comments',
+    '참여도 가중 (좋아요+댓글)': 'engagement'
+}
+
+
+class KeywordScorer:
+    """
+    조회수·좋아요·댓글 가중 키워드 점수 계산기
+
+    동영상 × 키워드 가중 출현 행렬을 한 번 만들어 두고 통계 벡터와 곱하므로
+    랭킹 방식을 바꿀 때는 희소 행렬-벡터 곱 한 번만 수행합니다.
+    """
+
+    def __init__(self, keyword_matrix, df, field_weights=None):
+        """
+        Args:
+            keyword_matrix (KeywordMatrix): TextProcessor.build_keyword_matrix 결과
+            df (pd.DataFrame): 행렬과 같은 행 순서의 동영상 데이터
+            field_weights (dict): {필드: 가중치} (기본값: config.KEYWORD_FIELD_WEIGHTS)
+        """
+        self.matrix = keyword_matrix
+        self.field_weights = dict(field_weights or config.KEYWORD_FIELD_WEIGHTS)
+
+        def stat(column):
+            if column not in df.columns:
+                return np.zeros(len(df), dtype=np.float64)
+            return pd.to_numeric(df[column], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+        likes = stat('like_count')
+        comments = stat('comment_count')
+        self.stats = {
+            'views': stat('view_count'),
+            'likes': likes,
+            'comments': comments,
+            'engagement': likes + comments
+        }
+
+    def score(self, mode='frequency', max_keywords=None, rows=None, field_weights=None):
+        """
+        키워드 점수 계산
+
+        Args:
+            mode (str): 'frequency', 'views', 'likes', 'comments', 'engagement'
+            max_keywords (int): 반환할 최대 키워드 수 (기본값: config.MAX_KEYWORDS)
+            rows (array-like): 점수에 포함할 행 위치 (기본값: 전체)
+            field_weights (dict): 이번 계산에만 쓸 필드 가중치
+
+        Returns:
+            dict: {키워드: 점수} (점수 내림차순 - 빈도는 정수, 가중 점수는 실수)
+        """
+        if max_keywords is None:
+            max_keywords = config.MAX_KEYWORDS
+
+        if mode == 'frequency':
+            # 단순 출현 빈도 (get_keyword_frequency와 동일) - 선택한 행의 빈도 행 합
+            scores = self.matrix.frequency(rows)
+            return self.matrix.top_keywords(scores, max_keywords)
+
+        if mode not in self.stats:
+            raise ValueError(f"알 수 없는 랭킹 방식입니다: {mode}")
+        matrix = self.matrix.incidence(field_weights or self.field_weights)
+        weights = self.stats[mode]
+
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+            matrix = matrix[rows]
+            weights = weights[rows]
+
+        # (키워드 × 동영상) @ (동영상,) -> 키워드별 점수
+        # 가중 점수는 실수 그대로 순위를 매김 (반올림은 표시할 때만 - 동점·0점 왜곡 방지)
+        scores = np.asarray(matrix.T @ weights).ravel()
+        return self.matrix.top_keywords(scores, max_keywords)
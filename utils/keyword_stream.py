@@ -0,0 +1,255 @@
+import heapq
+import json
+from collections import Counter
+from itertools import islice
+
+import pandas as pd
+
+import config
+
+
+def iter_jsonl_records(path, encoding='utf-8'):
+    """
+    JSONL 파일에서 동영상 레코드를 한 줄씩 읽기
+
+    Args:
+        path (str): JSONL 파일 경로
+        encoding (str): 파일 인코딩
+
+    Yields:
+        dict: 동영상 레코드
+    """
+    with open(path, 'r', encoding=encoding) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"JSONL {line_number}번째 줄 파싱 실패: {e}")
+
+
+def iter_records(source):
+    """
+    다양한 입력을 레코드 단위로 펼치기
+
+    DataFrame 청크(pd.read_csv(chunksize=...) 등), dict 레코드, pandas Series,
+    또는 이들이 섞인 이터러블을 받아 행 단위 레코드를 하나씩 돌려줍니다.
+
+    Args:
+        source: DataFrame, dict, 또는 이들의 이터러블
+
+    Yields:
+        dict 또는 pd.Series: 동영상 레코드
+    """
+    if isinstance(source, pd.DataFrame):
+        for _, row in source.iterrows():
+            yield row
+        return
+
+    if isinstance(source, (dict, pd.Series)):
+        yield source
+        return
+
+    for item in source:
+        if isinstance(item, pd.DataFrame):
+            for _, row in item.iterrows():
+                yield row
+        else:
+            yield item
+
+
+class SpaceSavingCounter:
+    """
+    Space-Saving 기반 상위 K 키워드 근사 집계 (메모리 상한 고정)
+
+    최대 capacity개의 키워드만 추적하며, 자리가 없으면 빈도가 가장 낮은 키워드를
+    밀어내고 그 빈도를 새 키워드의 오차로 물려줍니다 (Metwally et al., 2005).
+
+    오차 한계 (N = 지금까지 집계한 전체 키워드 수, m = capacity):
+        - 보고된 빈도는 실제 빈도 이상이며, 초과분은 해당 키워드의 error 이하
+        - error는 항상 N / m 이하 (min_count()가 더 엄격한 상한)
+        - 실제 빈도가 N / m 을 넘는 키워드는 반드시 결과에 포함
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is None:
+            capacity = config.KEYWORD_SKETCH_CAPACITY
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        # (빈도, 키워드) 최소 힙 - 빈도는 증가만 하므로 오래된 항목은 꺼낼 때 건너뜀
+        self._heap = []
+
+    def _increment(self, keyword, weight):
+        """키워드 하나를 weight만큼 증가 (가중 Space-Saving)"""
+        counts = self.counts
+        if keyword in counts:
+            counts[keyword] += weight
+        elif len(counts) < self.capacity:
+            counts[keyword] = weight
+            self.errors[keyword] = 0
+        else:
+            # 현재 최소 빈도 키워드를 찾아 교체
+            while True:
+                count, victim = heapq.heappop(self._heap)
+                if counts.get(victim) == count:
+                    break
+            del counts[victim]
+            del self.errors[victim]
+            counts[keyword] = count + weight
+            self.errors[keyword] = count
+        heapq.heappush(self._heap, (counts[keyword], keyword))
+
+        # 오래된 힙 항목이 쌓이면 다시 구성
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, k) for k, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, keywords):
+        """
+        키워드 목록(이터러블) 또는 {키워드: 빈도} 매핑으로 갱신
+
+        목록은 config.KEYWORD_SKETCH_CHUNK개씩 끊어 읽으며 묶음 안의 중복만 먼저 합치므로
+        입력 전체의 정확한 빈도표를 만들지 않고, 메모리는 capacity + 묶음 크기로 고정됩니다.
+        """
+        if isinstance(keywords, dict):
+            self._update_counts(keywords)
+            return
+        iterator = iter(keywords)
+        while True:
+            chunk = list(islice(iterator, config.KEYWORD_SKETCH_CHUNK))
+            if not chunk:
+                break
+            # 묶음 안의 중복은 먼저 합쳐서 힙 연산 횟수를 줄임
+            self._update_counts(Counter(chunk))
+
+    def _update_counts(self, counts):
+        """{키워드: 빈도} 매핑 반영"""
+        for keyword, weight in counts.items():
+            if weight > 0:
+                self._increment(keyword, weight)
+                self.total += weight
+
+    def merge(self, other):
+        """다른 요약과 병합 - 한쪽에 없는 키워드는 그쪽의 최소 빈도를 상한으로 사용"""
+        own_floor = self.min_count()
+        other_floor = other.min_count()
+        merged_counts = {}
+        merged_errors = {}
+        for keyword in set(self.counts) | set(other.counts):
+            merged_counts[keyword] = (self.counts.get(keyword, own_floor)
+                                      + other.counts.get(keyword, other_floor))
+            merged_errors[keyword] = (self.errors.get(keyword, own_floor)
+                                      + other.errors.get(keyword, other_floor))
+
+        top = heapq.nlargest(self.capacity, merged_counts.items(), key=lambda item: item[1])
+        self.counts = dict(top)
+        self.errors = {keyword: merged_errors[keyword] for keyword in self.counts}
+        self.total += other.total
+        self._heap = [(c, k) for k, c in self.counts.items()]
+        heapq.heapify(self._heap)
+        return self
+
+    def min_count(self):
+        """추적 중이지 않은 키워드의 빈도 상한 (자리가 남아 있으면 0)"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def max_error(self):
+        """보고된 빈도의 최대 과대추정치 (N / capacity 이하)"""
+        return max(self.errors.values()) if self.errors else 0
+
+    def most_common(self, n=None):
+        """상위 n개 (키워드, 추정 빈도) 목록 - Counter.most_common과 같은 형식"""
+        if n is None:
+            return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+
+    def guaranteed_top(self, n):
+        """
+        순위가 보장되는 상위 키워드
+
+        (빈도 - 오차)가 n+1번째 추정 빈도 이상인 키워드는
+        실제 상위 n개 안에 든다는 것이 보장됩니다.
+        """
+        ranked = self.most_common(n + 1)
+        if len(ranked) <= n:
+            return [keyword for keyword, _ in ranked]
+        threshold = ranked[-1][1]
+        return [keyword for keyword, count in ranked[:n]
+                if count - self.errors[keyword] >= threshold]
+
+    def __contains__(self, keyword):
+        return keyword in self.counts
+
+    def __len__(self):
+        return len(self.counts)
+
+
+class KeywordFrequencyAggregator:
+    """키워드 빈도 증분 집계기 - 전체 토큰 목록을 만들지 않고 빈도만 갱신"""
+
+    def __init__(self, approximate=False, capacity=None):
+        """
+        Args:
+            approximate (bool): True면 Space-Saving 요약으로 메모리 상한 고정
+            capacity (int): 근사 모드에서 추적할 최대 키워드 수
+                (기본값: config.KEYWORD_SKETCH_CAPACITY)
+        """
+        self.approximate = approximate
+        self.counter = SpaceSavingCounter(capacity) if approximate else Counter()
+        self.total_keywords = 0
+        self.total_videos = 0
+
+    def update(self, keywords):
+        """키워드 묶음(동영상 하나 분량)으로 빈도 갱신"""
+        self.counter.update(keywords)
+        self.total_keywords += len(keywords)
+        self.total_videos += 1
+
+    def consume(self, keyword_stream):
+        """
+        (video_id, keywords) 스트림을 끝까지 소비하며 빈도 갱신
+
+        Args:
+            keyword_stream: TextProcessor.iter_keywords_from_records 결과
+
+        Returns:
+            KeywordFrequencyAggregator: 체이닝용 자기 자신
+        """
+        for _, keywords in keyword_stream:
+            self.update(keywords)
+        return self
+
+    def merge(self, other):
+        """다른 집계기(예: 스냅샷 파티션별 집계)의 결과 병합"""
+        if self.approximate and other.approximate:
+            self.counter.merge(other.counter)
+        elif self.approximate:
+            self.counter.update(other.counter)
+        elif other.approximate:
+            raise ValueError("정확 집계기에 근사 집계 결과를 병합할 수 없습니다.")
+        else:
+            self.counter.update(other.counter)
+        self.total_keywords += other.total_keywords
+        self.total_videos += other.total_videos
+        return self
+
+    def most_common(self, n=None):
+        """상위 n개 (키워드, 빈도) 목록"""
+        return self.counter.most_common(n)
+
+    def to_frequency_dict(self, max_keywords=None):
+        """get_keyword_frequency와 같은 형식의 {키워드: 빈도} 딕셔너리"""
+        if max_keywords is None:
+            max_keywords = config.MAX_KEYWORDS
+        return dict(self.counter.most_common(max_keywords))
+
+    def __len__(self):
+        return len(self.counter)
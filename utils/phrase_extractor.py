@@ -0,0 +1,158 @@
+import numpy as np
+
+import config
+
+# 명사열 안에서 앞 토큰과 띄어쓰기 없이 붙어 있던 토큰 표시 ("브이" + "+로그" -> "브이로그")
+JOINED_MARK = '+'
+
+
+def _render(tokens):
+    """명사열 토큰을 원문 띄어쓰기대로 이어 붙인 구 문자열"""
+    text = tokens[0].lstrip(JOINED_MARK)
+    for token in tokens[1:]:
+        if token.startswith(JOINED_MARK):
+            text += token[len(JOINED_MARK):]
+        else:
+            text += ' ' + token
+    return text
+
+
+class PhraseExtractor:
+    """
+    인접 명사열 기반 복합명사·구 추출기 ("아이브 컴백", "손흥민 하이라이트" 등)
+
+    동영상별 명사열(원문에서 공백만 사이에 두고 이어진 명사 토큰들)을 하나의 정수 배열로
+    이어 붙인 뒤, 2-gram/3-gram을 정수 코드로 만들어 np.unique로 한 번에 집계합니다.
+    출현 횟수와 PMI(점별 상호정보량)가 모두 기준 이상인 n-gram만 구로 채택합니다.
+    """
+
+    def __init__(self, min_count=None, min_pmi=None, max_n=None):
+        """
+        Args:
+            min_count (int): 구로 채택할 최소 출현 횟수 (기본값: config.PHRASE_MIN_COUNT)
+            min_pmi (float): 구로 채택할 최소 PMI (기본값: config.PHRASE_MIN_PMI)
+            max_n (int): 최대 n-gram 길이, 2 또는 3 (기본값: config.PHRASE_MAX_N)
+        """
+        self.min_count = min_count or config.PHRASE_MIN_COUNT
+        self.min_pmi = min_pmi if min_pmi is not None else config.PHRASE_MIN_PMI
+        self.max_n = max_n or config.PHRASE_MAX_N
+        # 채택된 구 -> 전체 출현 횟수
+        self.phrases = {}
+
+    def _encode(self, run_docs):
+        """명사열 목록을 (토큰 id 배열, 동영상 번호 배열, 어휘) 로 변환 - 명사열 사이는 -1로 구분"""
+        vocabulary = {}
+        ids = []
+        docs = []
+        for doc_index, runs in enumerate(run_docs):
+            for run in runs:
+                for token in run:
+                    index = vocabulary.get(token)
+                    if index is None:
+                        index = len(vocabulary)
+                        vocabulary[token] = index
+                    ids.append(index)
+                    docs.append(doc_index)
+                ids.append(-1)
+                docs.append(doc_index)
+        names = sorted(vocabulary, key=vocabulary.get)
+        return np.asarray(ids, dtype=np.int64), np.asarray(docs, dtype=np.int64), names
+
+    def _select(self, codes, valid, pmi_numerator, unigram_parts):
+        """n-gram 코드 중 출현 횟수·PMI 기준을 통과한 위치 마스크와 채택 코드별 횟수"""
+        selected = np.zeros(len(valid), dtype=bool)
+        if not valid.any():
+            return selected, {}
+
+        unique_codes, inverse, counts = np.unique(codes[valid], return_inverse=True, return_counts=True)
+        # PMI = log( P(n-gram) / Π P(토큰) ) - 출현 위치 단위로 계산 후 코드별로 하나만 사용
+        denominator = np.ones(valid.sum(), dtype=np.float64)
+        for part in unigram_parts:
+            denominator *= part[valid]
+        pmi = np.log(counts[inverse] * pmi_numerator / denominator)
+
+        accepted = (counts[inverse] >= self.min_count) & (pmi >= self.min_pmi)
+        selected[np.flatnonzero(valid)[accepted]] = True
+        accepted_codes = unique_codes[np.unique(inverse[accepted])]
+        accepted_counts = dict(zip(accepted_codes.tolist(), counts[np.isin(unique_codes, accepted_codes)].tolist()))
+        return selected, accepted_counts
+
+    def fit_transform(self, run_docs):
+        """
+        명사열에서 구를 학습하고 동영상별 구 출현 목록 반환
+
+        3-gram으로 채택된 위치에 겹치는 2-gram은 집계하지 않고, 서로 겹치는 구는
+        앞에서부터 먼저 나온 것만 집계합니다.
+
+        Args:
+            run_docs (list): 동영상별 명사열 목록 (명사열은 토큰 목록)
+
+        Returns:
+            list: 동영상별 구 목록 (원문 띄어쓰기를 살린 문자열, 출현 순서)
+        """
+        self.phrases = {}
+        doc_phrases = [[] for _ in run_docs]
+        ids, docs, names = self._encode(run_docs)
+        n_vocab = len(names)
+        if n_vocab == 0 or len(ids) < 2:
+            return doc_phrases
+
+        is_token = ids >= 0
+        unigram_counts = np.bincount(ids[is_token], minlength=n_vocab).astype(np.float64)
+        n_tokens = float(is_token.sum())
+        # 구분자(-1) 위치는 빈도 1로 채워 곱셈이 깨지지 않도록 함 (해당 위치는 valid에서 제외됨)
+        token_counts = np.where(is_token, unigram_counts[np.maximum(ids, 0)], 1.0)
+
+        # 붙여 쓴 복합명사 중간에서 시작하거나 끝나는 n-gram은 제외 ("로그 리뷰", "먹방 브이")
+        joined_vocab = np.array([name.startswith(JOINED_MARK) for name in names])
+        joined = np.append(np.where(is_token, joined_vocab[np.maximum(ids, 0)], False), False)
+
+        # 2-gram: 연속된 두 토큰이 모두 명사열 안에 있고 서로 다른 경우
+        first, second = ids[:-1], ids[1:]
+        bigram_valid = (first >= 0) & (second >= 0) & (first != second) & ~joined[:-2] & ~joined[2:]
+        bigram_codes = first * n_vocab + second
+        bigram_selected, bigram_counts = self._select(
+            bigram_codes, bigram_valid, n_tokens, (token_counts[:-1], token_counts[1:])
+        )
+
+        trigram_selected = np.zeros(max(len(ids) - 2, 0), dtype=bool)
+        trigram_counts = {}
+        # 코드가 int64 범위를 넘지 않을 때만 3-gram 집계
+        if self.max_n >= 3 and len(ids) >= 3 and n_vocab ** 3 < 2 ** 62:
+            third = ids[2:]
+            trigram_valid = ((first[:-1] >= 0) & (second[:-1] >= 0) & (third >= 0)
+                             & (first[:-1] != second[:-1]) & (second[:-1] != third)
+                             & ~joined[:-3] & ~joined[3:])
+            trigram_codes = (ids[:-2] * n_vocab + ids[1:-1]) * n_vocab + third
+            trigram_selected, trigram_counts = self._select(
+                trigram_codes, trigram_valid, n_tokens ** 2,
+                (token_counts[:-2], token_counts[1:-1], token_counts[2:])
+            )
+            # 채택된 3-gram 위치와 겹치는 2-gram(시작 위치 i, i+1)은 제외
+            covered = np.zeros(len(bigram_selected), dtype=bool)
+            covered[:-1] |= trigram_selected
+            covered[1:] |= trigram_selected
+            bigram_selected &= ~covered
+
+        for code, count in trigram_counts.items():
+            first_id, rest = divmod(code, n_vocab * n_vocab)
+            second_id, third_id = divmod(rest, n_vocab)
+            self.phrases[_render([names[first_id], names[second_id], names[third_id]])] = count
+        for code, count in bigram_counts.items():
+            first_id, second_id = divmod(code, n_vocab)
+            self.phrases[_render([names[first_id], names[second_id]])] = count
+
+        # 출현 위치 순서대로 동영상별 목록 구성
+        positions = np.concatenate([np.flatnonzero(bigram_selected), np.flatnonzero(trigram_selected)])
+        lengths = np.concatenate([
+            np.full(bigram_selected.sum(), 2, dtype=np.int64),
+            np.full(trigram_selected.sum(), 3, dtype=np.int64)
+        ])
+        order = np.lexsort((-lengths, positions))
+        next_free = 0
+        for position, length in zip(positions[order].tolist(), lengths[order].tolist()):
+            if position < next_free:
+                continue
+            doc_phrases[docs[position]].append(_render([names[i] for i in ids[position:position + length]]))
+            next_free = position + length
+        return doc_phrases
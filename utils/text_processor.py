@@ -1,4 +1,8 @@
+import io
+import os
 import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from collections import Counter
@@ -33,6 +37,66 @@ KONLPY_AVAILABLE = False
 print("한국어 형태소 분석기가 비활성화되었습니다. Kiwi를 우선 사용합니다.")
 
 import config
+from utils.keyword_stream import iter_records, SpaceSavingCounter
+from utils.tfidf_store import get_tfidf_history
+from utils.keyword_matrix import KeywordMatrix
+from utils.keyword_scoring import KeywordScorer
+from utils.description_cleaner import BoilerplateDetector, truncate_text
+from utils.description_parser import STRUCTURED_FIELDS, parse_description
+from utils.phrase_extractor import JOINED_MARK, PhraseExtractor
+from utils.keyword_alias import KeywordAliasIndex
+from utils.keyword_matcher import KeywordMatcher
+from utils.keyword_index import KeywordIndex
+from utils.facet_index import FacetIndex
+from utils.video_search import VIDEO_COLUMNS, VideoSearchIndex
+from utils.wordcloud_cache import render_cache
+from utils.wordcloud_layout import generate_layout
+from utils.wordcloud_svg import wordcloud_to_svg
+from utils.font_registry import korean_font_path
+
+# 프로세스 풀 워커별 TextProcessor (워커 초기화 시 한 번만 생성)
+_worker_processor = None
+
+def _init_keyword_worker():
+    """프로세스 풀 워커 초기화 - 워커마다 Kiwi 인스턴스를 하나씩 생성"""
+    global _worker_processor
+    # NLTK 데이터는 부모 프로세스에서 이미 내려받았으므로 다운로드 단계는 생략
+    processor = TextProcessor.__new__(TextProcessor)
+    processor.setup_korean_analyzer()
+    processor.setup_stopwords()
+    processor.setup_keyword_aliases()
+    _worker_processor = processor
+
+def _extract_keywords_shard(shard, text_columns, min_length, as_counter=False, dedup=None, boilerplate=None,
+                            collect_runs=False, by_field=False):
+    """
+    샤드(행 범위) 하나의 키워드 추출 - 워커 프로세스에서 실행
+
+    Returns:
+        tuple: (키워드 목록, Counter, 또는 by_field면 동영상별 {필드: 키워드 목록} 목록, 동영상별 명사열)
+    """
+    keywords = []
+    shard_runs = [] if collect_runs else None
+    tag_cache = {}  # 샤드 안에서 반복되는 태그는 한 번만 토큰화
+    for _, row in shard.iterrows():
+        runs = [] if collect_runs else None
+        if by_field:
+            keywords.append(_worker_processor._extract_row_field_keywords(
+                row, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate,
+                noun_runs=runs
+            ))
+        else:
+            keywords.extend(_worker_processor._extract_row_keywords(
+                row, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate,
+                noun_runs=runs
+            ))
+        if collect_runs:
+            shard_runs.append(runs)
+    return (Counter(keywords) if as_counter else keywords), shard_runs
+
+def _identity_analyzer(tokens):
+    """이미 토큰화된 문서를 그대로 돌려주는 TfidfVectorizer analyzer"""
+    return tokens
 
 class TextProcessor:
     """텍스트 전처리 및 키워드 추출 클래스"""
@@ -41,6 +105,7 @@ class TextProcessor:
         self.download_nltk_data()
         self.setup_korean_analyzer()
         self.setup_stopwords()
+        self.setup_keyword_aliases()
     
     def download_nltk_data(self):
         """NLTK 데이터 다운로드 - 배포 환경 지원 개선"""
@@ -94,6 +159,21 @@ class TextProcessor:
         else:
             self.korean_available = False
     
+    def setup_keyword_aliases(self):
+        """키워드 표기 통합 사전 로드 (별칭 사전을 편집한 뒤 다시 호출하면 반영)"""
+        try:
+            self.keyword_aliases = KeywordAliasIndex()
+        except Exception as e:
+            print(f"키워드 별칭 사전 초기화 실패: {e}")
+            self.keyword_aliases = None
+        # (별칭 사전 버전, 키워드 목록) -> KeywordMatcher
+        self._matcher_cache = {}
+    
+    @property
+    def alias_version(self):
+        """별칭 사전 내용 지문 (추출 결과 캐시 키에 포함)"""
+        return self.keyword_aliases.version if self.keyword_aliases is not None else None
+    
     def setup_stopwords(self):
         """불용어 사전 설정"""
         # 영어 불용어
@@ -124,6 +204,9 @@ class TextProcessor:
             'NR',  # 수사
             'SL', 'SH', 'SN'  # 외국어, 한자, 숫자
         }
+        
+        # 구(인접 명사열) 추출에 사용할 품사
+        self.phrase_pos_tags = {'NNG', 'NNP', 'SL', 'SH'}
     
     def clean_text(self, text):
         """텍스트 전처리"""
@@ -144,8 +227,13 @@ class TextProcessor:
         
         return text.strip()
     
-    def extract_korean_keywords_with_kiwi(self, text, min_length=2):
-        """Kiwi를 사용한 한국어 키워드 추출"""
+    def extract_korean_keywords_with_kiwi(self, text, min_length=2, noun_runs=None):
+        """
+        Kiwi를 사용한 한국어 키워드 추출
+        
+        noun_runs 목록을 넘기면 원문에서 공백만 사이에 두고 이어진 명사 키워드들을
+        명사열(토큰 목록)로 묶어 추가합니다 (구 추출용, 같은 형태소 분석 결과 재사용).
+        """
         if not text or not self.korean_available:
             return []
         
@@ -154,6 +242,8 @@ class TextProcessor:
             tokens = self.kiwi.tokenize(text)
             
             keywords = []
+            run = []
+            run_end = 0
             for token in tokens:
                 word = token.form
                 pos = token.tag
@@ -190,7 +280,22 @@ class TextProcessor:
                 # 의미 있는 키워드만 추가
                 if len(word) >= min_length:
                     keywords.append(word)
+                    
+                    # 제외된 토큰(조사 등)이 사이에 있으면 위치가 벌어지므로 명사열이 끊김
+                    if noun_runs is not None and pos in self.phrase_pos_tags:
+                        if run and token.start == run_end:
+                            # 띄어쓰기 없이 이어진 복합명사 ("브이" + "로그")
+                            run.append(JOINED_MARK + word)
+                        elif run and token.start - run_end <= 1:
+                            run.append(word)
+                        else:
+                            if run:
+                                noun_runs.append(run)
+                            run = [word]
+                        run_end = token.start + token.len
             
+            if noun_runs is not None and run:
+                noun_runs.append(run)
             return keywords
             
         except Exception as e:
@@ -236,10 +341,10 @@ class TextProcessor:
             print(f"정규표현식 키워드 추출 실패: {e}")
             return []
     
-    def extract_korean_keywords(self, text, min_length=2):
-        """한국어 키워드 추출 - Kiwi 우선, 실패시 정규표현식"""
+    def extract_korean_keywords(self, text, min_length=2, noun_runs=None):
+        """한국어 키워드 추출 - Kiwi 우선, 실패시 정규표현식 (명사열은 Kiwi에서만 수집)"""
         if KIWI_AVAILABLE and self.korean_available:
-            return self.extract_korean_keywords_with_kiwi(text, min_length)
+            return self.extract_korean_keywords_with_kiwi(text, min_length, noun_runs=noun_runs)
         else:
             return self.extract_korean_keywords_regex(text, min_length)
     
@@ -314,91 +419,601 @@ class TextProcessor:
         korean_chars = re.findall(r'[가-힣]', text)
         return len(korean_chars) > len(text) * 0.3
     
-    def extract_keywords_from_text(self, text, min_length=None):
-        """텍스트에서 키워드 추출"""
+    def extract_keywords_from_text(self, text, min_length=None, noun_runs=None):
+        """텍스트에서 키워드 추출 (noun_runs: 한국어 명사열을 모을 목록)"""
         if min_length is None:
             min_length = config.MIN_WORD_LENGTH
         
         cleaned_text = self.clean_text(text)
+        # 여러 단어 별칭("new jeans")은 토큰 단위로 찾을 수 없으므로 토큰화 전에 한 단어로 합침
+        if self.keyword_aliases is not None:
+            cleaned_text = self.keyword_aliases.replace_phrases(cleaned_text)
         
         if self.is_korean(cleaned_text):
-            return self.extract_korean_keywords(cleaned_text, min_length)
+            return self.extract_korean_keywords(cleaned_text, min_length, noun_runs=noun_runs)
         else:
             return self.extract_english_keywords(cleaned_text, min_length)
     
+    def _tokenize_tag(self, tag, min_length, tag_cache=None, noun_runs=None):
+        """
+        태그 하나 토큰화 - tag_cache가 있으면 같은 태그 문자열은 한 번만 분석
+        
+        같은 채널의 동영상들은 태그 묶음을 그대로 재사용하는 경우가 많으므로
+        호출 단위(DataFrame 한 번, 샤드 하나, 스트림 하나)로 결과를 재사용합니다.
+        """
+        if tag_cache is None:
+            return self.extract_keywords_from_text(tag, min_length=min_length, noun_runs=noun_runs)
+        
+        cached = tag_cache.get(tag)
+        if cached is None:
+            if len(tag_cache) >= config.TAG_TOKEN_CACHE_SIZE:
+                tag_cache.clear()
+            runs = []
+            keywords = self.extract_keywords_from_text(tag, min_length=min_length, noun_runs=runs)
+            cached = tag_cache[tag] = (keywords, runs)
+        
+        keywords, runs = cached
+        if noun_runs is not None:
+            noun_runs.extend(runs)
+        return keywords
+    
+    def _dedup_field_keywords(self, field_keywords, dedup):
+        """
+        동영상 하나의 필드별 키워드에 중복 처리 적용
+        
+        Args:
+            field_keywords (dict): {필드: 키워드 목록}
+            dedup: None(모두 집계), 'video'(동영상당 1회), 'field'(필드당 1회),
+                정수 N(동영상당 최대 N회)
+            
+        Returns:
+            dict: 중복 처리된 {필드: 키워드 목록} (첫 등장 순서 유지)
+        """
+        if dedup is None:
+            return field_keywords
+        
+        if dedup == 'field':
+            return {field: list(dict.fromkeys(keywords)) for field, keywords in field_keywords.items()}
+        
+        if dedup == 'video':
+            cap = 1
+        elif isinstance(dedup, int) and not isinstance(dedup, bool) and dedup >= 1:
+            cap = dedup
+        else:
+            raise ValueError(f"알 수 없는 중복 처리 방식입니다: {dedup}")
+        
+        # 필드 순서(제목 → 설명 → 태그)대로 훑으며 동영상 전체에서 cap회까지만 유지
+        seen = Counter()
+        deduped = {}
+        for field, keywords in field_keywords.items():
+            kept = []
+            for keyword in keywords:
+                if seen[keyword] < cap:
+                    seen[keyword] += 1
+                    kept.append(keyword)
+            deduped[field] = kept
+        return deduped
+    
+    def _fit_boilerplate(self, df, text_columns):
+        """설명 필드를 분석할 때만 데이터셋에서 채널별 상용구 학습"""
+        if not config.DESCRIPTION_STRIP_BOILERPLATE or 'description' not in text_columns:
+            return None
+        try:
+            return BoilerplateDetector().fit(df)
+        except Exception as e:
+            print(f"설명 상용구 학습 실패: {e}")
+            return None
+    
+    def _structured_fields(self, text_columns):
+        """설명에서 분리해 따로 집계하는 필드 목록"""
+        if config.DESCRIPTION_PARSE_STRUCTURED and 'description' in text_columns:
+            return list(STRUCTURED_FIELDS)
+        return []
+    
+    def _prepare_field_text(self, row, column, boilerplate=None):
+        """
+        토큰화 전 필드 텍스트 준비
+        
+        설명은 채널 상용구 제거 → 해시태그/챕터/멘션 분리 순으로 처리하고,
+        마지막으로 필드별 글자 수 예산을 본문에 적용합니다.
+        
+        Returns:
+            tuple: (본문 텍스트, parse_description 결과 또는 None)
+        """
+        text = row[column]
+        if not isinstance(text, str):
+            return text, None
+        
+        parsed = None
+        if column == 'description':
+            if boilerplate is not None:
+                text = boilerplate.strip(text, row.get('channel_title'))
+            if config.DESCRIPTION_PARSE_STRUCTURED:
+                parsed = parse_description(text)
+                text = parsed['body']
+        return truncate_text(text, config.KEYWORD_FIELD_MAX_CHARS.get(column)), parsed
+    
+    def _structured_keywords(self, parsed, min_length):
+        """
+        설명에서 분리한 구조화 필드의 키워드
+        
+        해시태그, 챕터 제목, 멘션은 작성자가 직접 붙인 구간 이름·키워드이므로
+        형태소 분석 없이 정리만 해서 그대로 집계합니다 (멘션은 '@' 접두어 유지).
+        """
+        hashtags = [tag.lower() for tag in parsed['hashtags'] if len(tag) >= min_length]
+        chapters = []
+        for chapter in parsed['chapters']:
+            chapter = self.clean_text(chapter).lower()
+            if len(chapter) >= min_length:
+                chapters.append(chapter)
+        mentions = ['@' + name.lower() for name in parsed['mentions'] if len(name) >= min_length]
+        return {'hashtags': hashtags, 'chapters': chapters, 'mentions': mentions}
+    
+    def _extract_row_field_keywords(self, row, text_columns, min_length, dedup=None, tag_cache=None,
+                                    boilerplate=None, noun_runs=None):
+        """
+        DataFrame 한 행(동영상)에서 필드별 키워드 추출 - {필드: 키워드 목록}
+        
+        noun_runs 목록을 넘기면 텍스트 필드와 태그의 명사열을 함께 모읍니다 (구 추출용).
+        """
+        field_keywords = {}
+        
+        for column in text_columns:
+            if column in row and row[column]:
+                text, parsed = self._prepare_field_text(row, column, boilerplate)
+                keywords = self.extract_keywords_from_text(text, min_length=min_length, noun_runs=noun_runs)
+                field_keywords.setdefault(column, []).extend(keywords)
+                
+                if parsed is not None:
+                    for field, structured in self._structured_keywords(parsed, min_length).items():
+                        field_keywords.setdefault(field, []).extend(structured)
+        
+        # 태그 처리
+        if 'tags' in row and row['tags']:
+            tag_keywords = field_keywords.setdefault('tags', [])
+            if isinstance(row['tags'], list):
+                # 리스트인 경우 (기존 로직 유지)
+                for tag in row['tags']:
+                    tag_keywords.extend(self._tokenize_tag(tag, min_length, tag_cache, noun_runs))
+            else:
+                # 문자열인 경우 (쉼표로 구분된 태그들을 분할하여 처리)
+                tags_str = str(row['tags'])
+                if ',' in tags_str:
+                    # 쉼표로 구분된 태그들을 분할
+                    individual_tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
+                    for tag in individual_tags:
+                        tag_keywords.extend(self._tokenize_tag(tag, min_length, tag_cache, noun_runs))
+                else:
+                    # 단일 태그인 경우
+                    tag_keywords.extend(self._tokenize_tag(tags_str, min_length, tag_cache, noun_runs))
+        
+        # 별칭을 대표 키워드로 통합 ("NewJeans", "newjeans" -> "뉴진스") - 중복 처리보다 먼저 적용
+        if self.keyword_aliases is not None:
+            field_keywords = self.keyword_aliases.canonicalize_fields(field_keywords)
+        
+        return self._dedup_field_keywords(field_keywords, dedup)
+    
+    def _extract_row_keywords(self, row, text_columns, min_length, dedup=None, tag_cache=None, boilerplate=None,
+                              noun_runs=None):
+        """DataFrame 한 행(동영상)에서 키워드 추출 - 순차/병렬 경로 공용"""
+        row_keywords = []
+        field_keywords = self._extract_row_field_keywords(
+            row, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate,
+            noun_runs=noun_runs
+        )
+        for keywords in field_keywords.values():
+            row_keywords.extend(keywords)
+        return row_keywords
+    
+    def _phrase_keywords(self, row_runs, dedup=None):
+        """
+        동영상별 명사열에서 구를 학습해 동영상별 구 목록 반환
+        
+        출현 횟수·PMI 기준이 데이터셋 전체 통계이므로 모든 행을 추출한 뒤 한 번에 계산합니다.
+        """
+        try:
+            doc_phrases = PhraseExtractor().fit_transform(row_runs)
+        except Exception as e:
+            print(f"구 추출 실패: {e}")
+            return [[] for _ in row_runs]
+        if self.keyword_aliases is not None:
+            doc_phrases = [self.keyword_aliases.canonicalize_fields({'phrases': phrases})['phrases']
+                           for phrases in doc_phrases]
+        if dedup is not None:
+            doc_phrases = [self._dedup_field_keywords({'phrases': phrases}, dedup)['phrases']
+                           for phrases in doc_phrases]
+        return doc_phrases
+    
+    def _append_phrases(self, keywords, row_runs, dedup=None):
+        """키워드 목록(또는 Counter) 뒤에 구를 덧붙임 - row_runs가 None이면 그대로 반환"""
+        if row_runs is None:
+            return keywords
+        for phrases in self._phrase_keywords(row_runs, dedup):
+            if isinstance(keywords, Counter):
+                keywords.update(phrases)
+            else:
+                keywords.extend(phrases)
+        return keywords
+    
+    def _should_use_process_pool(self, df, n_workers):
+        """프로세스 풀 사용 여부 판단 (작은 데이터는 프로세스 기동 비용이 더 큼)"""
+        return n_workers > 1 and len(df) >= config.KEYWORD_PARALLEL_MIN_ROWS
+    
+    def _extract_keywords_parallel(self, df, text_columns, min_length, n_workers, shard_size, as_counter=False,
+                                   dedup=None, boilerplate=None, collect_runs=False, by_field=False):
+        """
+        행 범위 단위로 DataFrame을 나누어 프로세스 풀에서 키워드 추출
+        
+        Args:
+            df (pd.DataFrame): 동영상 데이터
+            text_columns (list): 키워드를 추출할 텍스트 컬럼
+            min_length (int): 최소 단어 길이
+            n_workers (int): 워커 프로세스 수
+            shard_size (int): 샤드당 행 수
+            as_counter (bool): True면 샤드별 Counter를 병합해 반환
+            dedup: 동영상별 중복 처리 방식 (_dedup_field_keywords 참고)
+            boilerplate (BoilerplateDetector): 데이터셋 전체에서 학습한 채널별 상용구
+            collect_runs (bool): True면 구 추출용 동영상별 명사열도 함께 수집
+            by_field (bool): True면 동영상별 {필드: 키워드 목록}을 행 순서대로 반환
+            
+        Returns:
+            tuple: (순차 처리와 동일한 순서의 키워드 목록, 병합된 빈도, 또는 동영상별 필드 키워드,
+                동영상별 명사열 또는 None)
+        """
+        shards = [df.iloc[start:start + shard_size] for start in range(0, len(df), shard_size)]
+        
+        # Streamlit 서버는 멀티스레드이므로 fork 대신 spawn 사용
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(shards)),
+            mp_context=mp_context,
+            initializer=_init_keyword_worker
+        ) as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 샤드 순서가 보존됨
+            results = executor.map(
+                _extract_keywords_shard,
+                shards,
+                [text_columns] * len(shards),
+                [min_length] * len(shards),
+                [as_counter] * len(shards),
+                [dedup] * len(shards),
+                [boilerplate] * len(shards),
+                [collect_runs] * len(shards),
+                [by_field] * len(shards)
+            )
+            
+            merged = Counter() if as_counter else []
+            row_runs = [] if collect_runs else None
+            for shard_keywords, shard_runs in results:
+                if as_counter:
+                    merged.update(shard_keywords)
+                else:
+                    merged.extend(shard_keywords)
+                if collect_runs:
+                    row_runs.extend(shard_runs)
+            return merged, row_runs
+    
     @st.cache_data(ttl=300)  # 5분 캐시
-    def extract_keywords_from_dataframe(_self, df, text_columns=['title', 'description'], min_length=None):
-        """DataFrame에서 키워드 추출 (캐시 적용)"""
+    def extract_keywords_from_dataframe(_self, df, text_columns=['title', 'description'], min_length=None,
+                                        n_workers=None, shard_size=None, dedup=None):
+        """
+        DataFrame에서 키워드 추출 (캐시 적용)
+        
+        데이터가 config.KEYWORD_PARALLEL_MIN_ROWS 이상이고 워커가 2개 이상이면
+        프로세스 풀에서 샤드 단위로 추출하며, 결과는 순차 처리와 동일합니다.
+        
+        Args:
+            df (pd.DataFrame): 동영상 데이터
+            text_columns (list): 키워드를 추출할 텍스트 컬럼
+            min_length (int): 최소 단어 길이 (기본값: config.MIN_WORD_LENGTH)
+            n_workers (int): 워커 프로세스 수 (기본값: config.KEYWORD_WORKERS)
+            shard_size (int): 샤드당 행 수 (기본값: config.KEYWORD_SHARD_SIZE)
+            dedup: 동영상별 중복 처리 - None(모두 집계), 'video'(동영상당 1회),
+                'field'(필드당 1회), 정수 N(동영상당 최대 N회)
+            
+        Returns:
+            list: 추출된 키워드 목록
+        """
         if min_length is None:
             min_length = config.MIN_WORD_LENGTH
+        if n_workers is None:
+            n_workers = config.KEYWORD_WORKERS or os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = config.KEYWORD_SHARD_SIZE
+        
+        # 채널별 상용구는 샤드로 나누기 전에 데이터셋 전체에서 학습
+        boilerplate = _self._fit_boilerplate(df, text_columns)
+        collect_runs = config.KEYWORD_PHRASES
+        
+        if _self._should_use_process_pool(df, n_workers):
+            try:
+                all_keywords, row_runs = _self._extract_keywords_parallel(
+                    df, text_columns, min_length, n_workers, shard_size, dedup=dedup, boilerplate=boilerplate,
+                    collect_runs=collect_runs
+                )
+                return _self._append_phrases(all_keywords, row_runs, dedup)
+            except Exception as e:
+                print(f"병렬 키워드 추출 실패, 순차 처리로 전환: {e}")
             
         all_keywords = []
+        row_runs = [] if collect_runs else None
+        tag_cache = {}
         
         for _, row in df.iterrows():
-            for column in text_columns:
-                if column in row and row[column]:
-                    keywords = _self.extract_keywords_from_text(row[column], min_length=min_length)
-                    all_keywords.extend(keywords)
-            
-            # 태그 처리
-            if 'tags' in row and row['tags']:
-                if isinstance(row['tags'], list):
-                    # 리스트인 경우 (기존 로직 유지)
-                    for tag in row['tags']:
-                        tag_keywords = _self.extract_keywords_from_text(tag, min_length=min_length)
-                        all_keywords.extend(tag_keywords)
-                else:
-                    # 문자열인 경우 (쉼표로 구분된 태그들을 분할하여 처리)
-                    tags_str = str(row['tags'])
-                    if ',' in tags_str:
-                        # 쉼표로 구분된 태그들을 분할
-                        individual_tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-                        for tag in individual_tags:
-                            tag_keywords = _self.extract_keywords_from_text(tag, min_length=min_length)
-                            all_keywords.extend(tag_keywords)
-                    else:
-                        # 단일 태그인 경우
-                        tag_keywords = _self.extract_keywords_from_text(tags_str, min_length=min_length)
-                        all_keywords.extend(tag_keywords)
-        
-        return all_keywords
-    
-    def get_keyword_frequency(self, keywords, max_keywords=None):
-        """키워드 빈도 계산"""
+            runs = [] if collect_runs else None
+            all_keywords.extend(_self._extract_row_keywords(
+                row, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate,
+                noun_runs=runs
+            ))
+            if collect_runs:
+                row_runs.append(runs)
+        
+        # 인접 명사열에서 찾은 구("아이브 컴백" 등)를 단일 키워드와 함께 집계
+        return _self._append_phrases(all_keywords, row_runs, dedup)
+    
+    def count_keywords_from_dataframe(self, df, text_columns=['title', 'description'], min_length=None,
+                                      n_workers=None, shard_size=None, dedup=None):
+        """
+        DataFrame의 키워드 빈도(Counter) 계산
+        
+        병렬 경로에서는 워커가 샤드별 Counter만 돌려주므로
+        전체 키워드 목록을 프로세스 간에 전송하지 않습니다.
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
+        if n_workers is None:
+            n_workers = config.KEYWORD_WORKERS or os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = config.KEYWORD_SHARD_SIZE
+        
+        boilerplate = self._fit_boilerplate(df, text_columns)
+        collect_runs = config.KEYWORD_PHRASES
+        
+        if self._should_use_process_pool(df, n_workers):
+            try:
+                counter, row_runs = self._extract_keywords_parallel(
+                    df, text_columns, min_length, n_workers, shard_size, as_counter=True,
+                    dedup=dedup, boilerplate=boilerplate, collect_runs=collect_runs
+                )
+                return self._append_phrases(counter, row_runs, dedup)
+            except Exception as e:
+                print(f"병렬 키워드 빈도 계산 실패, 순차 처리로 전환: {e}")
+        
+        counter = Counter()
+        row_runs = [] if collect_runs else None
+        tag_cache = {}
+        for _, row in df.iterrows():
+            runs = [] if collect_runs else None
+            counter.update(self._extract_row_keywords(
+                row, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate,
+                noun_runs=runs
+            ))
+            if collect_runs:
+                row_runs.append(runs)
+        return self._append_phrases(counter, row_runs, dedup)
+
+    def extract_field_keywords(self, df, text_columns=['title', 'description'], min_length=None, dedup=None,
+                               n_workers=None, shard_size=None):
+        """
+        동영상별·필드별 키워드 추출
+        
+        extract_keywords_from_dataframe와 같은 기준으로 큰 데이터는 프로세스 풀에서 샤드 단위로 추출합니다.
+        
+        Returns:
+            dict: {필드: 동영상 순서대로 나열한 키워드 목록들}
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
+        if n_workers is None:
+            n_workers = config.KEYWORD_WORKERS or os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = config.KEYWORD_SHARD_SIZE
+        
+        fields = list(text_columns) + self._structured_fields(text_columns)
+        fields += [] if 'tags' in text_columns else ['tags']
+        boilerplate = self._fit_boilerplate(df, text_columns)
+        collect_runs = config.KEYWORD_PHRASES
+        
+        rows_fields = None
+        row_runs = None
+        if self._should_use_process_pool(df, n_workers):
+            try:
+                rows_fields, row_runs = self._extract_keywords_parallel(
+                    df, text_columns, min_length, n_workers, shard_size, dedup=dedup, boilerplate=boilerplate,
+                    collect_runs=collect_runs, by_field=True
+                )
+            except Exception as e:
+                print(f"병렬 필드 키워드 추출 실패, 순차 처리로 전환: {e}")
+                rows_fields = None
+        
+        if rows_fields is None:
+            rows_fields = []
+            row_runs = [] if collect_runs else None
+            tag_cache = {}
+            for _, row in df.iterrows():
+                runs = [] if collect_runs else None
+                rows_fields.append(self._extract_row_field_keywords(
+                    row, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate,
+                    noun_runs=runs
+                ))
+                if collect_runs:
+                    row_runs.append(runs)
+        
+        field_tokens = {field: [row_fields.get(field, []) for row_fields in rows_fields] for field in fields}
+        
+        if row_runs is not None:
+            field_tokens['phrases'] = self._phrase_keywords(row_runs, dedup)
+        
+        return field_tokens
+    
+    @st.cache_resource(ttl=300)  # 읽기 전용 토큰 목록이므로 복사 없이 공유 (호출자는 수정하지 않음)
+    def build_field_tokens(_self, df, text_columns=['title', 'description'], min_length=None, dedup=None,
+                           alias_version=None):
+        """
+        동영상별·필드별 키워드 (extract_field_keywords 결과를 데이터셋당 한 번만 계산)
+        
+        alias_version은 캐시 키에만 쓰이며, 호출자가 self.alias_version을 넘겨 별칭 사전이 바뀌면
+        다시 추출하게 합니다 (아래 build_* 빌더도 같음).
+        """
+        return _self.extract_field_keywords(df, text_columns=text_columns, min_length=min_length, dedup=dedup)
+    
+    @st.cache_resource(ttl=300)  # 읽기 전용 행렬이므로 복사 없이 공유
+    def build_keyword_matrix(_self, df, text_columns=['title', 'description'], min_length=None, dedup=None,
+                             alias_version=None):
+        """DataFrame의 동영상 × 키워드 희소 행렬 생성 (필드별)"""
+        field_tokens = _self.build_field_tokens(df, text_columns=text_columns, min_length=min_length, dedup=dedup,
+                                                alias_version=alias_version)
+        return KeywordMatrix.from_field_tokens(field_tokens, n_videos=len(df))
+    
+    @st.cache_resource(ttl=300)
+    def build_keyword_scorer(_self, df, text_columns=['title', 'description'], min_length=None, dedup=None,
+                             alias_version=None):
+        """조회수·좋아요·댓글 가중 키워드 점수 계산기 생성 (데이터셋당 한 번)"""
+        matrix = _self.build_keyword_matrix(df, text_columns=text_columns, min_length=min_length, dedup=dedup,
+                                            alias_version=alias_version)
+        return KeywordScorer(matrix, df)
+    
+    @st.cache_resource(ttl=300)
+    def build_keyword_index(_self, df, text_columns=['title', 'description'], min_length=None, dedup=None,
+                            include_tags=True, alias_version=None):
+        """
+        키워드 -> 동영상 행 번호 역색인 생성 (키워드 행렬과 같은 추출 결과를 공유)
+        
+        Args:
+            include_tags (bool): False면 태그 필드를 빼고 제목·설명에서 나온 키워드만 색인
+        """
+        matrix = _self.build_keyword_matrix(df, text_columns=text_columns, min_length=min_length, dedup=dedup,
+                                            alias_version=alias_version)
+        fields = None if include_tags else [field for field in matrix.fields if field != 'tags']
+        return KeywordIndex.from_matrix(matrix, fields=fields)
+    
+    @st.cache_resource(ttl=300)
+    def build_facet_index(_self, df, min_length=None, dedup=None, alias_version=None):
+        """대시보드 필터용 패싯 색인 (카테고리·조회수·키워드) 생성 - 데이터셋당 한 번"""
+        keyword_index = _self.build_keyword_index(df, min_length=min_length, dedup=dedup, alias_version=alias_version)
+        return FacetIndex(df, keyword_index=keyword_index)
+    
+    def iter_keywords_from_records(self, records, text_columns=['title', 'description'], min_length=None,
+                                   dedup=None, boilerplate=None):
+        """
+        레코드 스트림에서 동영상별 키워드를 하나씩 추출하는 제너레이터
+
+        DataFrame 청크, JSONL 레코드, 스냅샷 파티션 등 끝이 정해지지 않은 입력에서도
+        전체 키워드 목록을 메모리에 올리지 않고 처리할 수 있습니다.
+
+        Args:
+            records: DataFrame, dict 레코드, 또는 이들의 이터러블
+            text_columns (list): 키워드를 추출할 텍스트 컬럼
+            min_length (int): 최소 단어 길이 (기본값: config.MIN_WORD_LENGTH)
+            dedup: 동영상별 중복 처리 방식 (extract_keywords_from_dataframe 참고)
+            boilerplate (BoilerplateDetector): 미리 학습한 채널별 상용구 (스트림은 한 번만 읽으므로 호출자가 학습)
+
+        구 추출은 데이터셋 전체의 출현 통계가 필요하므로 스트림 경로에서는 수행하지 않습니다.
+
+        Yields:
+            tuple: (video_id, 키워드 목록)
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
+
+        # 태그 캐시 크기는 config.TAG_TOKEN_CACHE_SIZE로 제한되므로 끝없는 스트림에서도 안전
+        tag_cache = {}
+        for record in iter_records(records):
+            video_id = record.get('video_id')
+            yield video_id, self._extract_row_keywords(
+                record, text_columns, min_length, dedup=dedup, tag_cache=tag_cache, boilerplate=boilerplate
+            )
+
+    def suggest_keyword_merges(self, keyword_freq, threshold=None, max_suggestions=None):
+        """같은 대상의 다른 표기로 보이는 키워드 병합 제안 (KeywordAliasIndex.suggest_merges 참고)"""
+        if self.keyword_aliases is None:
+            return []
+        try:
+            return self.keyword_aliases.suggest_merges(keyword_freq, threshold, max_suggestions)
+        except Exception as e:
+            print(f"키워드 병합 제안 실패: {e}")
+            return []
+    
+    def get_keyword_frequency(self, keywords, max_keywords=None, approximate=False, capacity=None):
+        """
+        키워드 빈도 계산
+        
+        Args:
+            keywords: 키워드 목록 또는 {키워드: 빈도} 매핑
+            max_keywords (int): 반환할 최대 키워드 수
+            approximate (bool): True면 Space-Saving 요약으로 상위 키워드 근사
+                (메모리는 capacity개로 고정, 빈도 오차는 전체 키워드 수 / capacity 이하)
+            capacity (int): 근사 모드에서 추적할 최대 키워드 수
+        """
         if max_keywords is None:
             max_keywords = config.MAX_KEYWORDS
         
-        counter = Counter(keywords)
+        if approximate:
+            counter = SpaceSavingCounter(capacity)
+        else:
+            counter = Counter()
+        counter.update(keywords)
         return dict(counter.most_common(max_keywords))
     
+    def tokenize_documents(self, texts, column='description', min_length=None, boilerplate=None):
+        """
+        TF-IDF용 문서 토큰화 - 이미 토큰화된 문서(list/tuple)는 그대로 사용
+        
+        원문은 DataFrame 행과 같은 경로(_extract_row_keywords)로 처리하므로 필드별 글자 수 예산,
+        설명 상용구 제거·구조화 필드 분리, 별칭 통합이 키워드 빈도·행렬과 똑같이 적용됩니다.
+        
+        Args:
+            texts (list): 원문 문자열 또는 토큰 목록이 섞인 문서 목록
+            column (str): 원문을 어떤 필드로 처리할지 ('title', 'description' 등)
+            min_length (int): 최소 단어 길이 (기본값: config.MIN_WORD_LENGTH)
+            boilerplate (BoilerplateDetector): 미리 학습한 채널별 상용구 (원문만으로는 채널을 알 수 없으므로 선택)
+            
+        Returns:
+            list: 문서별 토큰 목록
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
+        
+        token_docs = []
+        tag_cache = {}
+        for text in texts:
+            if isinstance(text, (list, tuple)):
+                token_docs.append(list(text))
+            elif text and not pd.isna(text):
+                token_docs.append(self._extract_row_keywords(
+                    {column: str(text)}, [column], min_length, tag_cache=tag_cache, boilerplate=boilerplate
+                ))
+            else:
+                token_docs.append([])
+        return token_docs
+    
     @st.cache_data(ttl=600)  # 10분 캐시
     def calculate_tfidf_scores(_self, texts, max_features=100):
-        """TF-IDF 점수 계산"""
+        """
+        TF-IDF 점수 계산
+        
+        문서를 다시 문자열로 합치지 않고 토큰 목록을 그대로 벡터라이저에 넘기므로
+        기본 token_pattern에 의해 한 글자 토큰이 빠지거나 한국어 토큰이 다시 쪼개지지 않고,
+        키워드 빈도 경로와 같은 토큰을 사용합니다.
+        
+        Args:
+            texts (list): 원문 문자열 또는 이미 추출한 키워드 목록(list)의 목록
+            max_features (int): 최대 특성(키워드) 수
+        """
         try:
-            # 텍스트 전처리
-            processed_texts = []
-            for text in texts:
-                if text and not pd.isna(text):
-                    cleaned = _self.clean_text(str(text))
-                    if _self.is_korean(cleaned):
-                        keywords = _self.extract_korean_keywords(cleaned)
-                    else:
-                        keywords = _self.extract_english_keywords(cleaned)
-                    processed_texts.append(' '.join(keywords))
-                else:
-                    processed_texts.append('')
+            token_docs = _self.tokenize_documents(texts)
             
-            if not processed_texts or all(not text for text in processed_texts):
+            if not token_docs or all(not tokens for tokens in token_docs):
                 return {}
             
-            # TF-IDF 벡터라이저
+            # TF-IDF 벡터라이저 (토큰 목록을 그대로 사용하는 analyzer)
             vectorizer = TfidfVectorizer(
                 max_features=max_features,
-                stop_words=None,  # 이미 전처리에서 제거
-                lowercase=False   # 이미 전처리됨
+                analyzer=_identity_analyzer,  # 이미 전처리/토큰화됨
+                lowercase=False
             )
             
-            tfidf_matrix = vectorizer.fit_transform(processed_texts)
+            tfidf_matrix = vectorizer.fit_transform(token_docs)
             feature_names = vectorizer.get_feature_names_out()
             
             # 평균 TF-IDF 점수 계산
@@ -412,82 +1027,142 @@ class TextProcessor:
             print(f"TF-IDF 계산 실패: {e}")
             return {}
     
-    def _find_korean_font(self):
-        """한글 폰트 찾기 - 여러 방법으로 시도"""
-        import os
-        import platform
-        
-        # 1. 우선순위 폰트 목록 (배포 환경에서 많이 사용되는 폰트들)
-        font_candidates = [
-            # Streamlit Cloud / Linux 배포 환경 (Ubuntu, Debian 등)
-            '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-            '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
-            '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
-            '/usr/share/fonts/truetype/nanum-coding/NanumGothicCoding.ttf',
-            '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
-            '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',  # 유니코드 지원
-            '/usr/share/fonts/TTF/DejaVuSans.ttf',
-            '/usr/share/fonts/dejavu/DejaVuSans.ttf',
-            # 프로젝트 내 폰트 (향후 추가 가능)
-            './fonts/NanumGothic.ttf',
-            'fonts/NanumGothic.ttf',
-            # macOS
-            '/System/Library/Fonts/AppleGothic.ttf',
-            '/Library/Fonts/NanumGothic.ttf',
-            # Windows
-            'C:/Windows/Fonts/malgun.ttf',
-            'C:/Windows/Fonts/gulim.ttc',
-            'C:/Windows/Fonts/batang.ttc',
-        ]
-        
-        # 2. 직접 파일 경로 확인
-        for font_path in font_candidates:
-            if os.path.exists(font_path):
-                return font_path
-        
-        # 3. matplotlib font_manager 사용
+    def update_tfidf_history(self, df, min_length=None, snapshot_date=None, max_keywords=None):
+        """
+        새 스냅샷을 누적 TF-IDF 저장소에 반영하고 두드러진 키워드 반환
+        
+        calculate_tfidf_scores와 달리 IDF가 최근 config.TFIDF_WINDOW_DAYS일 동안
+        수집한 모든 동영상을 기준으로 계산됩니다. 토큰은 키워드 행렬과 같은 캐시(build_field_tokens)에서
+        가져오고(구 제외), 저장소는 모든 세션이 공유하는 get_tfidf_history()를 잠금 안에서 갱신합니다.
+        
+        Args:
+            df (pd.DataFrame): 새로 수집한 동영상 데이터
+            min_length (int): 최소 단어 길이
+            snapshot_date (date): 스냅샷 날짜 (기본값: 오늘)
+            max_keywords (int): 반환할 최대 키워드 수
+            
+        Returns:
+            dict: {키워드: 평균 TF-IDF 점수}
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
+        
         try:
-            import matplotlib.font_manager as fm
-            system_fonts = fm.findSystemFonts()
+            field_tokens = self.build_field_tokens(df, min_length=min_length, alias_version=self.alias_version)
+            token_docs = [[] for _ in range(len(df))]
+            for field, token_lists in field_tokens.items():
+                if field == 'phrases':
+                    continue
+                for tokens, row_tokens in zip(token_docs, token_lists):
+                    tokens.extend(row_tokens)
             
-            # 한글 폰트 검색 (우선순위)
-            korean_font_names = [
-                'nanum', 'malgun', 'gulim', 'batang', 'gothic', 
-                'apple', 'korean', 'hangul', 'dejavu'
-            ]
+            doc_ids = df['video_id'].tolist() if 'video_id' in df.columns else None
+            return get_tfidf_history().update(token_docs, snapshot_date=snapshot_date, max_keywords=max_keywords,
+                                              doc_ids=doc_ids)
             
-            for font_name in korean_font_names:
-                matching_fonts = [f for f in system_fonts if font_name in f.lower()]
-                if matching_fonts:
-                    return matching_fonts[0]
-                    
         except Exception as e:
-            print(f"Font manager 사용 중 오류: {e}")
+            print(f"누적 TF-IDF 갱신 실패: {e}")
+            return {}
+    
+    def _get_search_index(self):
+        """로컬 검색 색인 (처음 사용할 때 연결)"""
+        if getattr(self, 'search_index', None) is None:
+            self.search_index = VideoSearchIndex()
+        return self.search_index
+    
+    def update_search_index(self, df, min_length=None):
+        """
+        수집한 동영상을 로컬 검색 색인에 추가 (같은 동영상은 최신 정보로 갱신)
+        
+        Args:
+            df (pd.DataFrame): 새로 수집한 동영상 데이터
+            min_length (int): 최소 단어 길이
+            
+        Returns:
+            int: 색인한 동영상 수
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
         
-        # 4. 플랫폼별 기본 폰트 시도
         try:
-            system = platform.system().lower()
-            if system == 'linux':
-                # Linux/배포 환경에서 DejaVu Sans 사용 (유니코드 지원)
-                linux_fonts = [
-                    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-                    '/usr/share/fonts/TTF/DejaVuSans.ttf',
-                    '/usr/share/fonts/liberation/LiberationSans-Regular.ttf'
-                ]
-                for font in linux_fonts:
-                    if os.path.exists(font):
-                        return font
-                        
-            elif system == 'darwin':  # macOS
-                return '/System/Library/Fonts/AppleGothic.ttf'
+            # 키워드 행렬과 같은 캐시의 토큰을 사용하므로 형태소 분석을 다시 하지 않음
+            cached_tokens = self.build_field_tokens(df, min_length=min_length, alias_version=self.alias_version)
+            # 설명에서 분리한 해시태그·챕터·멘션은 설명 검색 필드에 포함 (구는 제외)
+            description_fields = [field for field in cached_tokens if field not in ('title', 'tags', 'phrases')]
+            records = []
+            field_tokens = []
+            for position, (_, row) in enumerate(df.iterrows()):
+                field_tokens.append({
+                    'title': cached_tokens['title'][position],
+                    'tags': cached_tokens['tags'][position],
+                    'description': [keyword for field in description_fields
+                                    for keyword in cached_tokens[field][position]]
+                })
                 
+                record = {column: row.get(column) for column in VIDEO_COLUMNS}
+                if isinstance(record['tags'], list):
+                    record['tags'] = ', '.join(record['tags'])
+                for column in ('view_count', 'like_count', 'comment_count'):
+                    record[column] = int(record[column]) if pd.notna(record[column]) else 0
+                records.append(record)
+            
+            return self._get_search_index().add(records, field_tokens)
+            
         except Exception as e:
-            print(f"플랫폼별 폰트 검색 중 오류: {e}")
+            print(f"로컬 검색 색인 갱신 실패: {e}")
+            return 0
+    
+    def search_local_videos(self, query, categories=None, date_range=None, limit=None, min_length=None):
+        """
+        지금까지 수집한 동영상에서 키워드 검색 (API 할당량 사용 없음)
+        
+        검색어는 색인과 같은 형태소 분석·별칭 통합을 거치므로 "NewJeans"로 검색해도
+        "뉴진스"로 색인된 동영상을 찾습니다.
+        
+        Args:
+            query (str): 검색어
+            categories (list): 카테고리 ID 조건
+            date_range (tuple): (시작일, 종료일) 게시일 조건
+            limit (int): 최대 결과 수
+            min_length (int): 최소 단어 길이 (색인할 때와 같게)
+            
+        Returns:
+            pd.DataFrame: 검색된 동영상 (관련도 높은 순, search_score 컬럼 포함)
+        """
+        if min_length is None:
+            min_length = config.MIN_WORD_LENGTH
         
-        return None
+        try:
+            tokens = self.extract_keywords_from_text(query, min_length=min_length)
+            if self.keyword_aliases is not None:
+                tokens = [self.keyword_aliases.canonicalize(token) for token in tokens]
+            if not tokens:
+                # 불용어·최소 길이에 걸린 짧은 검색어는 공백 단위로 그대로 검색
+                tokens = str(query).lower().split()
+            tokens = list(dict.fromkeys(tokens))
+            
+            return self._get_search_index().search(tokens, categories=categories, date_range=date_range, limit=limit)
+            
+        except Exception as e:
+            print(f"로컬 검색 실패: {e}")
+            return pd.DataFrame(columns=list(VIDEO_COLUMNS) + ['search_score'])
     
-    def generate_wordcloud(self, keywords_freq, width=None, height=None):
-        """워드 클라우드 생성 - 배포 환경 한글 지원 개선"""
+    def _find_korean_font(self):
+        """한글 폰트 경로 (프로세스 공용 폰트 레지스트리에서 한 번만 탐색)"""
+        return korean_font_path()
+    
+    def generate_wordcloud(self, keywords_freq, width=None, height=None, background_color=None, colormap=None,
+                           max_words=None):
+        """
+        워드 클라우드 생성 - 배포 환경 한글 지원 개선
+        
+        단어 배치는 utils.wordcloud_layout의 빠른 배치 엔진(셀 격자 적분 이미지 + 글리프 마스크 캐시)으로
+        계산하고, 반환값은 라이브러리와 같은 WordCloud 객체입니다.
+        
+        Args:
+            max_words (int): 최대 단어 수 (기본값: 고해상도 캔버스면 config.WORDCLOUD_LARGE_MAX_WORDS,
+                아니면 config.WORDCLOUD_MAX_WORDS)
+        """
         if not keywords_freq:
             return None
         
@@ -496,6 +1171,9 @@ class TextProcessor:
                 width = config.WORDCLOUD_WIDTH
             if height is None:
                 height = config.WORDCLOUD_HEIGHT
+            if max_words is None:
+                large = width * height >= config.WORDCLOUD_LARGE_WIDTH * config.WORDCLOUD_LARGE_HEIGHT
+                max_words = config.WORDCLOUD_LARGE_MAX_WORDS if large else config.WORDCLOUD_MAX_WORDS
             
             # 한글 폰트 경로 찾기
             font_path = self._find_korean_font()
@@ -504,27 +1182,31 @@ class TextProcessor:
             wordcloud_params = {
                 'width': width,
                 'height': height,
-                'background_color': config.WORDCLOUD_BACKGROUND,
-                'colormap': config.WORDCLOUD_COLORMAP,
+                'background_color': background_color or config.WORDCLOUD_BACKGROUND,
+                'colormap': colormap or config.WORDCLOUD_COLORMAP,
                 'relative_scaling': 0.5,
                 'min_font_size': 10,
                 'max_font_size': 100,
                 'prefer_horizontal': 0.7,
-                'max_words': 100,
+                'max_words': max_words,
                 'collocations': False  # 단어 조합 방지
             }
             
             # 폰트가 발견된 경우에만 font_path 추가
             if font_path:
                 wordcloud_params['font_path'] = font_path
-                print(f"워드클라우드에 폰트 적용: {font_path}")
             else:
                 print("한글 폰트를 찾지 못했습니다. 기본 폰트를 사용합니다.")
                 # 폰트가 없어도 워드클라우드 생성 시도
                 pass
             
-            # 워드클라우드 생성
-            wordcloud = WordCloud(**wordcloud_params).generate_from_frequencies(keywords_freq)
+            # 워드클라우드 생성 (빠른 배치 엔진이 실패하면 라이브러리 배치로 대체)
+            wordcloud = WordCloud(**wordcloud_params)
+            try:
+                generate_layout(wordcloud, keywords_freq)
+            except Exception as e:
+                print(f"빠른 워드클라우드 배치 실패, 기본 배치 사용: {e}")
+                wordcloud.generate_from_frequencies(keywords_freq)
             
             return wordcloud
             
@@ -536,8 +1218,8 @@ class TextProcessor:
                 basic_params = {
                     'width': width or config.WORDCLOUD_WIDTH,
                     'height': height or config.WORDCLOUD_HEIGHT,
-                    'background_color': config.WORDCLOUD_BACKGROUND,
-                    'colormap': config.WORDCLOUD_COLORMAP,
+                    'background_color': background_color or config.WORDCLOUD_BACKGROUND,
+                    'colormap': colormap or config.WORDCLOUD_COLORMAP,
                     'relative_scaling': 0.5,
                     'min_font_size': 10,
                     'collocations': False
@@ -548,21 +1230,81 @@ class TextProcessor:
                 print(f"기본 워드클라우드 생성도 실패: {e2}")
                 return None
     
-    def create_keyword_network(self, df, min_length=2, max_keywords=30, min_cooccurrence=2):
+    def render_wordcloud_png(self, keywords_freq, width=None, height=None, background_color=None, colormap=None,
+                             wait=True):
+        """
+        워드클라우드 PNG 이미지 (빈도표·크기·배경색·컬러맵 기준으로 프로세스 공용 캐시)
+        
+        Args:
+            keywords_freq (dict): {키워드: 빈도}
+            width, height (int): 캔버스 크기 (기본값: config.WORDCLOUD_WIDTH/HEIGHT)
+            background_color (str): 배경색 (테마별)
+            colormap (str): Matplotlib 컬러맵 이름
+            wait (bool): False면 캐시에 없을 때 백그라운드 렌더링만 시작하고 None 반환
+            
+        Returns:
+            bytes: PNG 이미지 (없거나 실패 시 None)
+        """
+        def encode(wordcloud):
+            buffer = io.BytesIO()
+            wordcloud.to_image().save(buffer, format='PNG')
+            return buffer.getvalue()
+        
+        return self._render_wordcloud(keywords_freq, width, height, background_color, colormap, 'png', encode, wait)
+    
+    def render_wordcloud_svg(self, keywords_freq, width=None, height=None, background_color=None, colormap=None,
+                             wait=True):
+        """
+        워드클라우드 SVG 문자열 - 위치 지정 텍스트 요소 (인자와 캐시 키 규칙은 render_wordcloud_png와 같음)
+        
+        Returns:
+            str: SVG 문서 (없거나 실패 시 None)
+        """
+        return self._render_wordcloud(
+            keywords_freq, width, height, background_color, colormap, 'svg', wordcloud_to_svg, wait
+        )
+    
+    def _render_wordcloud(self, keywords_freq, width, height, background_color, colormap, image_format, encode,
+                          wait):
+        """워드클라우드를 배치한 뒤 encode로 변환해 render_cache에 저장 (형식별로 따로 캐시)"""
+        if not keywords_freq:
+            return None
+        
+        width = width or config.WORDCLOUD_WIDTH
+        height = height or config.WORDCLOUD_HEIGHT
+        background_color = background_color or config.WORDCLOUD_BACKGROUND
+        colormap = colormap or config.WORDCLOUD_COLORMAP
+        keywords_freq = dict(keywords_freq)
+        key = render_cache.make_key(keywords_freq, width, height, background_color, colormap, image_format)
+        
+        def render():
+            wordcloud = self.generate_wordcloud(
+                keywords_freq, width=width, height=height, background_color=background_color, colormap=colormap
+            )
+            if wordcloud is None:
+                return None
+            return encode(wordcloud)
+        
+        if wait:
+            return render_cache.get_or_render(key, render)
+        render_cache.prerender(key, render)
+        return render_cache.get(key)
+    
+    def create_keyword_network(self, df, min_length=2, max_keywords=30, min_cooccurrence=2, dedup=None):
         """키워드 네트워크 분석 - 키워드 간 연관성 분석"""
         try:
-            # 모든 텍스트에서 키워드 추출
-            all_keywords = self.extract_keywords_from_dataframe(df, min_length=min_length)
+            # 상위 키워드 선별 (키워드 행렬의 열 합 = 전체 키워드 빈도)
+            keyword_freq = self.keyword_frequency_from_matrix(df, min_length, max_keywords, dedup)
             
-            if not all_keywords:
+            if not keyword_freq:
                 return None, None
             
-            # 상위 키워드 선별
-            keyword_freq = self.get_keyword_frequency(all_keywords, max_keywords=max_keywords)
             top_keywords = list(keyword_freq.keys())
             
-            # 공출현 매트릭스 생성
-            cooccurrence_matrix = self._calculate_cooccurrence_matrix(df, top_keywords, min_cooccurrence)
+            # 공출현 매트릭스 생성 (제목·설명 기준 역색인)
+            index = self.build_keyword_index(df, min_length=min_length, dedup=dedup, include_tags=False,
+                                             alias_version=self.alias_version)
+            cooccurrence_matrix = self._calculate_cooccurrence_matrix(df, top_keywords, min_cooccurrence, index=index)
             
             # 네트워크 그래프 데이터 생성
             network_data = self._create_network_data(cooccurrence_matrix, keyword_freq)
@@ -573,41 +1315,93 @@ class TextProcessor:
             st.error(f"키워드 네트워크 분석 중 오류 발생: {str(e)}")
             return None, None
     
-    def _calculate_cooccurrence_matrix(self, df, keywords, min_cooccurrence=2):
+    def keyword_frequency_from_matrix(self, df, min_length=None, max_keywords=None, dedup=None, rows=None):
+        """
+        키워드 행렬에서 상위 키워드 빈도 (extract_keywords_from_dataframe + get_keyword_frequency와 동일)
+        
+        동영상별 빈도 행을 한 번 만들어 두고 필터된 행(rows)의 합만 다시 계산하므로
+        필터를 바꿔도 형태소 분석을 다시 하지 않습니다.
+        
+        Args:
+            rows (array-like): 집계할 행 위치 (기본값: 전체)
+        """
+        if max_keywords is None:
+            max_keywords = config.MAX_KEYWORDS
+        matrix = self.build_keyword_matrix(df, min_length=min_length, dedup=dedup, alias_version=self.alias_version)
+        if not matrix.vocabulary:
+            return {}
+        return matrix.top_keywords(matrix.frequency(rows), max_keywords)
+    
+    def _surface_forms(self, keyword):
+        """원문 검색에 사용할 키워드 표기 목록 (소문자, 별칭 포함)"""
+        if self.keyword_aliases is None:
+            return [keyword.lower()]
+        return sorted({form.lower() for form in self.keyword_aliases.surface_forms(keyword)})
+    
+    def keyword_matcher(self, keywords):
+        """키워드 목록의 다중 패턴 매처 (같은 키워드 목록이면 오토마톤을 재사용)"""
+        version = self.alias_version
+        key = (version, tuple(keywords))
+        matcher = self._matcher_cache.get(key)
+        if matcher is None:
+            if len(self._matcher_cache) >= config.KEYWORD_MATCHER_CACHE_SIZE:
+                self._matcher_cache.pop(next(iter(self._matcher_cache)))
+            matcher = KeywordMatcher(keywords, surface_forms=self._surface_forms)
+            self._matcher_cache[key] = matcher
+        return matcher
+    
+    def keyword_presence(self, df, keywords, columns=('title', 'description'), index=None):
+        """
+        동영상별 키워드 포함 여부 행렬
+        
+        역색인이 주어지고 모든 키워드가 색인에 있으면 색인에서 바로 꺼내고, 그렇지 않으면
+        동영상 텍스트를 한 번만 훑어 포함된 키워드(별칭 표기 포함)를 모두 찾습니다.
+        
+        Args:
+            df (pd.DataFrame): 동영상 데이터
+            keywords (list): 찾을 키워드 (행렬 열 순서)
+            columns (tuple): 검색할 텍스트 컬럼 (텍스트 검색 시)
+            index (KeywordIndex): df로 만든 역색인
+        
+        Returns:
+            scipy.sparse.csr_matrix: (동영상 수 × 키워드 수) 0/1 행렬 (df 행 순서)
+        """
+        if index is not None and index.n_videos == len(df) and all(keyword in index for keyword in keywords):
+            return index.presence(keywords)
+        
+        columns = [column for column in columns if column in df.columns]
+        if columns:
+            texts = df[columns[0]].fillna('').astype(str)
+            for column in columns[1:]:
+                texts = texts + '\n' + df[column].fillna('').astype(str)
+        else:
+            texts = [''] * len(df)
+        return self.keyword_matcher(keywords).presence(texts)
+    
+    def _calculate_cooccurrence_matrix(self, df, keywords, min_cooccurrence=2, index=None):
         """키워드 공출현 매트릭스 계산"""
-        import pandas as pd
-        from collections import defaultdict
-        import itertools
+        # 색인이 없으면 대표 키워드의 별칭 표기까지 원문에서 검색
+        presence = self.keyword_presence(df, keywords, index=index)
         
-        # 공출현 카운트 딕셔너리
-        cooccurrence = defaultdict(int)
+        # 키워드 쌍별 공출현 동영상 수 = Pᵀ·P 의 비대각 원소
+        cooccurrence = (presence.T @ presence).tocoo()
         
-        # 각 동영상에 대해 키워드 공출현 계산
-        for _, row in df.iterrows():
-            # 제목과 설명에서 키워드 찾기
-            text = str(row.get('title', '')) + ' ' + str(row.get('description', ''))
-            text = text.lower()
-            
-            # 해당 텍스트에 존재하는 키워드들 찾기
-            present_keywords = []
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    present_keywords.append(keyword)
-            
-            # 키워드 쌍에 대한 공출현 계산
-            for keyword1, keyword2 in itertools.combinations(present_keywords, 2):
-                # 알파벳 순으로 정렬하여 일관성 유지
-                pair = tuple(sorted([keyword1, keyword2]))
-                cooccurrence[pair] += 1
-        
-        # 최소 공출현 횟수 이상인 것만 필터링
-        filtered_cooccurrence = {
-            pair: count for pair, count in cooccurrence.items() 
-            if count >= min_cooccurrence
-        }
+        # 최소 공출현 횟수 이상인 것만 필터링 (알파벳 순 쌍으로 일관성 유지)
+        filtered_cooccurrence = {}
+        for i, j, count in zip(cooccurrence.row.tolist(), cooccurrence.col.tolist(), cooccurrence.data.tolist()):
+            if i < j and count >= min_cooccurrence:
+                filtered_cooccurrence[tuple(sorted([keywords[i], keywords[j]]))] = count
         
         return filtered_cooccurrence
     
+    def _jaccard_matrix(self, df, keywords, index=None):
+        """키워드 간 Jaccard 유사도 행렬 (포함 여부 행렬 한 번으로 전체 쌍 계산)"""
+        presence = self.keyword_presence(df, keywords, index=index)
+        intersection = (presence.T @ presence).toarray().astype(np.float64)
+        sizes = np.diag(intersection)
+        union = sizes[:, None] + sizes[None, :] - intersection
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+    
     def _create_network_data(self, cooccurrence_matrix, keyword_freq):
         """네트워크 그래프 데이터 생성"""
         nodes = []
@@ -635,54 +1429,35 @@ class TextProcessor:
         
         return {'nodes': nodes, 'edges': edges}
     
-    def calculate_keyword_similarity(self, df, keyword1, keyword2):
+    def calculate_keyword_similarity(self, df, keyword1, keyword2, index=None):
         """두 키워드 간의 유사도 계산"""
         try:
-            # 각 키워드가 포함된 동영상 찾기
-            keyword1_videos = set()
-            keyword2_videos = set()
-            
-            for idx, row in df.iterrows():
-                text = str(row.get('title', '')) + ' ' + str(row.get('description', ''))
-                text = text.lower()
-                
-                if keyword1.lower() in text:
-                    keyword1_videos.add(idx)
-                if keyword2.lower() in text:
-                    keyword2_videos.add(idx)
-            
-            # Jaccard 유사도 계산
-            intersection = len(keyword1_videos & keyword2_videos)
-            union = len(keyword1_videos | keyword2_videos)
-            
-            if union == 0:
-                return 0
-            
-            similarity = intersection / union
-            return similarity
+            # 각 키워드가 포함된 동영상 집합의 Jaccard 유사도 (색인에 있으면 행 번호 교집합)
+            if index is not None and index.n_videos == len(df) and keyword1 in index and keyword2 in index:
+                return index.jaccard(keyword1, keyword2)
+            return float(self._jaccard_matrix(df, [keyword1, keyword2])[0, 1])
             
         except Exception as e:
             st.error(f"키워드 유사도 계산 중 오류 발생: {str(e)}")
             return 0
     
-    def get_keyword_clusters(self, df, min_length=2, max_keywords=20, similarity_threshold=0.3):
+    def get_keyword_clusters(self, df, min_length=2, max_keywords=20, similarity_threshold=0.3, dedup=None):
         """키워드 클러스터링 - 유사한 키워드들을 그룹화"""
         try:
-            # 키워드 추출
-            all_keywords = self.extract_keywords_from_dataframe(df, min_length=min_length)
-            if not all_keywords:
-                return []
-            
             # 상위 키워드 선별
-            keyword_freq = self.get_keyword_frequency(all_keywords, max_keywords=max_keywords)
+            keyword_freq = self.keyword_frequency_from_matrix(df, min_length, max_keywords, dedup)
+            if not keyword_freq:
+                return []
             keywords = list(keyword_freq.keys())
             
-            # 유사도 매트릭스 계산
+            # 유사도 매트릭스 계산 (역색인으로 전체 쌍을 한 번에 계산, 조회와 같은 정렬된 쌍을 키로 사용)
+            index = self.build_keyword_index(df, min_length=min_length, dedup=dedup, include_tags=False,
+                                             alias_version=self.alias_version)
+            jaccard = self._jaccard_matrix(df, keywords, index=index)
             similarity_matrix = {}
             for i, keyword1 in enumerate(keywords):
                 for j, keyword2 in enumerate(keywords[i+1:], i+1):
-                    similarity = self.calculate_keyword_similarity(df, keyword1, keyword2)
-                    similarity_matrix[(keyword1, keyword2)] = similarity
+                    similarity_matrix[tuple(sorted([keyword1, keyword2]))] = jaccard[i, j]
             
             # 간단한 클러스터링 (threshold 기반)
             clusters = []
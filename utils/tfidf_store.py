@@ -0,0 +1,309 @@
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import streamlit as st
+from scipy import sparse
+from sklearn.utils import murmurhash3_32
+
+import config
+
+
+class IncrementalTfidf:
+    """
+    스냅샷 누적 문서 빈도 기반 증분 TF-IDF
+
+    TfidfVectorizer처럼 매번 다시 학습하지 않고, 토큰을 해시 인덱스로 변환
+    (HashingVectorizer 방식)한 뒤 최근 window_days일 동안의 문서 빈도로 IDF를 계산합니다.
+    윈도우 문서 빈도는 새 스냅샷을 더하고 만료된 날짜만 빼서 유지하므로 갱신 비용은 새 문서 수에
+    비례합니다. 저장(save)은 윈도우 안의 날짜별 희소 배열 전체를 다시 쓰므로 윈도우 크기에 비례합니다.
+    여러 세션이 함께 쓸 때는 get_tfidf_history()의 프로세스 공용 인스턴스와 update()를 사용합니다.
+    """
+
+    def __init__(self, store_path=None, n_features=None, window_days=None):
+        """
+        Args:
+            store_path (str): 문서 빈도 저장 파일 (.npz, 기본값: config.TFIDF_STORE_PATH)
+            n_features (int): 해시 공간 크기 (기본값: config.TFIDF_HASH_FEATURES)
+            window_days (int): IDF 계산에 사용할 최근 일수 (기본값: config.TFIDF_WINDOW_DAYS)
+        """
+        self.store_path = store_path or config.TFIDF_STORE_PATH
+        self.n_features = n_features or config.TFIDF_HASH_FEATURES
+        self.window_days = window_days or config.TFIDF_WINDOW_DAYS
+
+        # 날짜(ISO 문자열) -> (해시 인덱스 배열, 문서 빈도 배열, 문서 수)
+        self._daily = {}
+        # 날짜 -> 그날 문서 빈도에 이미 반영한 동영상 ID (같은 날 다시 수집해도 중복 집계하지 않음)
+        self._daily_ids = {}
+        self._window_df = np.zeros(self.n_features, dtype=np.int64)
+        self._window_docs = 0
+        self._hash_cache = {}
+        self._lock = threading.RLock()
+
+        self.load()
+
+    def _hash(self, token):
+        """토큰 -> 해시 인덱스 (부호 없는 MurmurHash3)"""
+        index = self._hash_cache.get(token)
+        if index is None:
+            index = murmurhash3_32(token, seed=0, positive=True) % self.n_features
+            self._hash_cache[token] = index
+        return index
+
+    def transform(self, token_docs):
+        """
+        토큰 목록 문서들을 해시 인덱스 기반 빈도 행렬로 변환 (학습 없음)
+
+        Args:
+            token_docs (list): 문서별 토큰 목록
+
+        Returns:
+            scipy.sparse.csr_matrix: (문서 수 × n_features) 빈도 행렬
+        """
+        indptr = [0]
+        indices = []
+        for tokens in token_docs:
+            indices.extend(self._hash(token) for token in tokens)
+            indptr.append(len(indices))
+
+        data = np.ones(len(indices), dtype=np.float64)
+        matrix = sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(token_docs), self.n_features)
+        )
+        # 같은 문서 안의 중복 인덱스를 합산
+        matrix.sum_duplicates()
+        return matrix
+
+    def _document_frequency(self, counts):
+        """빈도 행렬에서 해시 인덱스별 문서 빈도 계산"""
+        binary = counts.copy()
+        binary.data[:] = 1
+        return np.asarray(binary.sum(axis=0)).ravel().astype(np.int64)
+
+    def _new_documents(self, doc_ids, key):
+        """그날 아직 반영하지 않은 문서 여부 (ID가 없는 문서는 항상 새 문서, 배치 안의 중복은 첫 문서만)"""
+        if doc_ids is None:
+            return None
+        counted = self._daily_ids.get(key, set())
+        batch_seen = set()
+        mask = []
+        for doc_id in doc_ids:
+            if doc_id is None or doc_id != doc_id:
+                mask.append(True)
+                continue
+            # 저장 파일에는 문자열로 남으므로 비교도 문자열로
+            doc_id = str(doc_id)
+            if doc_id in counted or doc_id in batch_seen:
+                mask.append(False)
+            else:
+                batch_seen.add(doc_id)
+                mask.append(True)
+        return np.array(mask, dtype=bool)
+
+    def score(self, token_docs, max_keywords=None, doc_ids=None, snapshot_date=None):
+        """
+        누적 문서 빈도 기준 TF-IDF 점수 계산
+
+        IDF는 최근 window_days일 스냅샷과 현재 배치를 합친 문서 빈도로 계산되므로
+        점수가 높을수록 "최근 기간 대비 이번 배치에서 두드러진" 키워드입니다.
+
+        Args:
+            token_docs (list): 문서별 토큰 목록
+            max_keywords (int): 반환할 최대 키워드 수 (기본값: config.MAX_KEYWORDS)
+            doc_ids (list): 문서별 동영상 ID - 그날 이미 반영한 문서는 IDF에 다시 더하지 않음
+            snapshot_date (date): 스냅샷 날짜 (기본값: 오늘)
+
+        Returns:
+            dict: {키워드: 평균 TF-IDF 점수} (점수 내림차순)
+        """
+        if max_keywords is None:
+            max_keywords = config.MAX_KEYWORDS
+        if not token_docs or not any(token_docs):
+            return {}
+
+        counts = self.transform(token_docs)
+        new_documents = self._new_documents(doc_ids, (snapshot_date or date.today()).isoformat())
+        if new_documents is None:
+            batch_df = self._document_frequency(counts)
+            n_new = len(token_docs)
+        else:
+            batch_df = self._document_frequency(counts[np.flatnonzero(new_documents)])
+            n_new = int(new_documents.sum())
+
+        total_docs = self._window_docs + n_new
+        doc_freq = self._window_df + batch_df
+        # TfidfVectorizer(smooth_idf=True)와 같은 IDF 식
+        idf = np.log((1 + total_docs) / (1 + doc_freq)) + 1
+
+        tfidf = counts.multiply(idf).tocsr()
+        # 문서별 L2 정규화
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        tfidf = sparse.diags(1 / norms) @ tfidf
+        mean_scores = np.asarray(tfidf.mean(axis=0)).ravel()
+
+        # 해시 인덱스를 이번 배치의 토큰 이름으로 되돌림
+        names = {}
+        for tokens in token_docs:
+            for token in tokens:
+                names.setdefault(self._hash(token), token)
+
+        ranked = sorted(names.items(), key=lambda item: mean_scores[item[0]], reverse=True)
+        return {token: float(mean_scores[index]) for index, token in ranked[:max_keywords]}
+
+    def partial_fit(self, token_docs, snapshot_date=None, doc_ids=None):
+        """
+        새 스냅샷의 문서 빈도를 누적 (재학습 없음)
+
+        Args:
+            token_docs (list): 문서별 토큰 목록
+            snapshot_date (date): 스냅샷 날짜 (기본값: 오늘)
+            doc_ids (list): 문서별 동영상 ID - 같은 날 이미 반영한 동영상은 건너뜀
+        """
+        if snapshot_date is None:
+            snapshot_date = date.today()
+        key = snapshot_date.isoformat()
+
+        new_documents = self._new_documents(doc_ids, key)
+        if new_documents is not None:
+            token_docs = [tokens for tokens, is_new in zip(token_docs, new_documents) if is_new]
+            self._daily_ids.setdefault(key, set()).update(
+                str(doc_id) for doc_id, is_new in zip(doc_ids, new_documents)
+                if is_new and doc_id is not None and doc_id == doc_id
+            )
+        if not token_docs:
+            return self
+
+        batch_df = self._document_frequency(self.transform(token_docs))
+        nonzero = np.flatnonzero(batch_df)
+
+        if key in self._daily:
+            # 같은 날 여러 번 수집한 경우 기존 배열과 합산
+            old_indices, old_counts, old_docs = self._daily[key]
+            day_df = np.zeros(self.n_features, dtype=np.int64)
+            day_df[old_indices] = old_counts
+            day_df[nonzero] += batch_df[nonzero]
+            nonzero_day = np.flatnonzero(day_df)
+            self._daily[key] = (nonzero_day.astype(np.int32), day_df[nonzero_day].astype(np.int32),
+                                old_docs + len(token_docs))
+        else:
+            self._daily[key] = (nonzero.astype(np.int32), batch_df[nonzero].astype(np.int32), len(token_docs))
+
+        # 윈도우 문서 빈도에 이번 배치만 더함 (전체 재계산 없음)
+        self._window_df[nonzero] += batch_df[nonzero]
+        self._window_docs += len(token_docs)
+        self._prune(snapshot_date)
+        return self
+
+    def update(self, token_docs, snapshot_date=None, max_keywords=None, doc_ids=None):
+        """
+        점수 계산 → 누적 → 저장을 잠금 안에서 한 번에 수행 (세션 간 공유 인스턴스용)
+
+        Returns:
+            dict: 누적 전 문서 빈도 기준 {키워드: 평균 TF-IDF 점수}
+        """
+        with self._lock:
+            scores = self.score(token_docs, max_keywords=max_keywords, doc_ids=doc_ids, snapshot_date=snapshot_date)
+            self.partial_fit(token_docs, snapshot_date=snapshot_date, doc_ids=doc_ids)
+            self.save()
+        return scores
+
+    def _prune(self, reference_date=None):
+        """window_days보다 오래된 스냅샷을 제거하고 그 문서 빈도만 윈도우에서 뺌"""
+        if reference_date is None and self._daily:
+            reference_date = max(datetime.strptime(key, '%Y-%m-%d').date() for key in self._daily)
+        if reference_date is None:
+            return
+        cutoff = (reference_date - timedelta(days=self.window_days - 1)).isoformat()
+        for key in [key for key in self._daily if key < cutoff]:
+            indices, counts, n_docs = self._daily.pop(key)
+            self._daily_ids.pop(key, None)
+            self._window_df[indices] -= counts
+            self._window_docs -= n_docs
+
+    def _recompute_window(self):
+        """날짜별 문서 빈도에서 윈도우 문서 빈도를 처음부터 계산 (불러온 직후에만 사용)"""
+        self._window_df = np.zeros(self.n_features, dtype=np.int64)
+        self._window_docs = 0
+        for indices, counts, n_docs in self._daily.values():
+            self._window_df[indices] += counts
+            self._window_docs += n_docs
+
+    @property
+    def document_count(self):
+        """윈도우 안의 누적 문서 수"""
+        return self._window_docs
+
+    def save(self):
+        """날짜별 희소 문서 빈도를 압축 npz로 저장"""
+        try:
+            directory = os.path.dirname(self.store_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            keys = sorted(self._daily)
+            offsets = np.cumsum([0] + [len(self._daily[key][0]) for key in keys])
+            day_ids = [sorted(self._daily_ids.get(key, ())) for key in keys]
+            # 임시 파일에 쓴 뒤 교체하므로 저장 중에 읽어도 반쯤 쓰인 파일을 보지 않음
+            temp_path = f"{self.store_path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+            np.savez_compressed(
+                temp_path,
+                n_features=np.int64(self.n_features),
+                dates=np.array(keys, dtype='U10'),
+                offsets=offsets.astype(np.int64),
+                n_docs=np.array([self._daily[key][2] for key in keys], dtype=np.int64),
+                indices=np.concatenate([self._daily[key][0] for key in keys]) if keys else np.array([], dtype=np.int32),
+                counts=np.concatenate([self._daily[key][1] for key in keys]) if keys else np.array([], dtype=np.int32),
+                id_offsets=np.cumsum([0] + [len(ids) for ids in day_ids]).astype(np.int64),
+                ids=np.array([doc_id for ids in day_ids for doc_id in ids], dtype=str)
+            )
+            os.replace(temp_path, self.store_path)
+        except Exception as e:
+            print(f"TF-IDF 문서 빈도 저장 실패: {e}")
+
+    def load(self):
+        """저장된 문서 빈도 불러오기 (해시 공간 크기가 다르면 무시)"""
+        if not os.path.exists(self.store_path):
+            return self
+
+        try:
+            with np.load(self.store_path) as store:
+                if int(store['n_features']) != self.n_features:
+                    print("TF-IDF 저장소의 해시 크기가 달라 새로 시작합니다.")
+                    return self
+
+                offsets = store['offsets']
+                indices = store['indices']
+                counts = store['counts']
+                for i, (key, n_docs) in enumerate(zip(store['dates'], store['n_docs'])):
+                    start, end = offsets[i], offsets[i + 1]
+                    self._daily[str(key)] = (indices[start:end], counts[start:end], int(n_docs))
+                # 동영상 ID 목록이 없는 이전 형식 파일도 그대로 읽음
+                if 'ids' in store.files:
+                    id_offsets = store['id_offsets']
+                    ids = store['ids']
+                    for i, key in enumerate(store['dates']):
+                        self._daily_ids[str(key)] = set(ids[id_offsets[i]:id_offsets[i + 1]].tolist())
+
+            self._prune()
+            self._recompute_window()
+        except Exception as e:
+            print(f"TF-IDF 문서 빈도 불러오기 실패: {e}")
+            self._daily = {}
+            self._daily_ids = {}
+            self._recompute_window()
+
+        return self
+
+
+@st.cache_resource
+def get_tfidf_history(store_path=None):
+    """
+    프로세스 공용 누적 TF-IDF 저장소
+
+    세션마다 인스턴스를 따로 만들면 save()가 파일 전체를 다시 쓰면서
+    다른 세션이 반영한 스냅샷을 덮어쓰므로, 모든 세션이 이 인스턴스의 update()를 사용합니다.
+    """
+    return IncrementalTfidf(store_path)
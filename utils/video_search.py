@@ -0,0 +1,161 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+import config
+
+# 검색 결과로 돌려주는 동영상 컬럼 (수집 DataFrame과 같은 이름)
+VIDEO_COLUMNS = ('video_id', 'title', 'description', 'channel_title', 'category_id', 'tags', 'published_at',
+                 'view_count', 'like_count', 'comment_count')
+
+# FTS5 색인 컬럼 (순서대로 bm25 가중치 적용)
+SEARCH_FIELDS = ('title', 'description', 'tags')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    rowid INTEGER PRIMARY KEY,
+    video_id TEXT UNIQUE NOT NULL,
+    title TEXT,
+    description TEXT,
+    channel_title TEXT,
+    category_id TEXT,
+    tags TEXT,
+    published_at TEXT,
+    view_count INTEGER,
+    like_count INTEGER,
+    comment_count INTEGER,
+    indexed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS videos_category ON videos (category_id);
+CREATE INDEX IF NOT EXISTS videos_published ON videos (published_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS video_fts USING fts5 (title, description, tags, tokenize = 'unicode61');
+"""
+
+
+def _quote(token):
+    """FTS5 쿼리용 문자열 리터럴 (연산자로 해석되지 않도록 큰따옴표로 감쌈)"""
+    return '"' + token.replace('"', '""') + '"'
+
+
+class VideoSearchIndex:
+    """
+    수집한 동영상의 로컬 전문 검색 색인 (SQLite FTS5)
+
+    동영상 원본 필드는 videos 테이블에, 형태소 분석(Kiwi)으로 뽑은 필드별 키워드는
+    FTS5 테이블에 같은 rowid로 저장합니다. 검색은 bm25 순위와 카테고리·게시일 조건을
+    SQL 한 번으로 처리하므로 API 할당량을 쓰지 않습니다.
+    """
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로 (기본값: config.SEARCH_INDEX_PATH)
+        """
+        self.db_path = db_path or config.SEARCH_INDEX_PATH
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self):
+        """요청마다 새 연결 (Streamlit 스크립트 스레드 간 연결 공유 방지)"""
+        return sqlite3.connect(self.db_path)
+
+    def add(self, records, field_tokens):
+        """
+        동영상 추가 또는 갱신 (같은 video_id는 최신 통계와 색인으로 교체)
+
+        Args:
+            records (list): 동영상 dict 목록 (VIDEO_COLUMNS)
+            field_tokens (list): 동영상별 {검색 필드: 키워드 목록}
+
+        Returns:
+            int: 반영한 동영상 수
+        """
+        indexed_at = datetime.now().isoformat(timespec='seconds')
+        count = 0
+        with closing(self._connect()) as connection, connection:
+            for record, tokens in zip(records, field_tokens):
+                video_id = record.get('video_id')
+                if not video_id:
+                    continue
+                values = [record.get(column) for column in VIDEO_COLUMNS]
+                existing = connection.execute('SELECT rowid FROM videos WHERE video_id = ?', (video_id,)).fetchone()
+                if existing:
+                    rowid = existing[0]
+                    assignments = ', '.join(f'{column} = ?' for column in VIDEO_COLUMNS[1:])
+                    connection.execute(
+                        f'UPDATE videos SET {assignments}, indexed_at = ? WHERE rowid = ?',
+                        values[1:] + [indexed_at, rowid]
+                    )
+                    connection.execute('DELETE FROM video_fts WHERE rowid = ?', (rowid,))
+                else:
+                    placeholders = ', '.join('?' * (len(VIDEO_COLUMNS) + 1))
+                    rowid = connection.execute(
+                        f'INSERT INTO videos ({", ".join(VIDEO_COLUMNS)}, indexed_at) VALUES ({placeholders})',
+                        values + [indexed_at]
+                    ).lastrowid
+                connection.execute(
+                    'INSERT INTO video_fts (rowid, title, description, tags) VALUES (?, ?, ?, ?)',
+                    [rowid] + [' '.join(tokens.get(field, [])) for field in SEARCH_FIELDS]
+                )
+                count += 1
+        return count
+
+    def search(self, query_tokens, categories=None, date_range=None, limit=None, match_all=True):
+        """
+        키워드 검색
+
+        Args:
+            query_tokens (list): 검색어 키워드 (색인과 같은 방식으로 토큰화한 것)
+            categories (list): 카테고리 ID 조건 (없으면 전체)
+            date_range (tuple): (시작일, 종료일) 게시일 조건 - 종료일 포함, 한쪽은 None 가능
+            limit (int): 최대 결과 수 (기본값: config.SEARCH_RESULTS_LIMIT)
+            match_all (bool): True면 모든 키워드 포함(AND), False면 하나라도 포함(OR)
+
+        Returns:
+            pd.DataFrame: VIDEO_COLUMNS + search_score (관련도 높은 순)
+        """
+        tokens = [token for token in query_tokens if token]
+        if not tokens:
+            return pd.DataFrame(columns=list(VIDEO_COLUMNS) + ['search_score'])
+
+        match = (' AND ' if match_all else ' OR ').join(_quote(token) for token in tokens)
+        weights = [float(config.KEYWORD_FIELD_WEIGHTS.get(field, 1.0)) for field in SEARCH_FIELDS]
+        selected = ', '.join(f'v.{column}' for column in VIDEO_COLUMNS)
+        sql = [
+            f'SELECT {selected}, -bm25(video_fts, ?, ?, ?) AS search_score',
+            'FROM video_fts JOIN videos v ON v.rowid = video_fts.rowid',
+            'WHERE video_fts MATCH ?'
+        ]
+        params = weights + [match]
+
+        if categories:
+            sql.append(f'AND v.category_id IN ({", ".join("?" * len(categories))})')
+            params.extend(str(category) for category in categories)
+        start, end = date_range if date_range else (None, None)
+        if start:
+            sql.append('AND v.published_at >= ?')
+            params.append(start.isoformat() if isinstance(start, date) else str(start))
+        if end:
+            # 종료일 당일까지 포함 (ISO 문자열 비교)
+            if isinstance(end, date):
+                end = (end + timedelta(days=1)).isoformat()
+            sql.append('AND v.published_at < ?')
+            params.append(str(end))
+
+        sql.append('ORDER BY search_score DESC LIMIT ?')
+        params.append(int(limit or config.SEARCH_RESULTS_LIMIT))
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(' '.join(sql), params).fetchall()
+        return pd.DataFrame(rows, columns=list(VIDEO_COLUMNS) + ['search_score'])
+
+    def __len__(self):
+        """색인된 동영상 수"""
+        with closing(self._connect()) as connection:
+            return connection.execute('SELECT COUNT(*) FROM videos').fetchone()[0]
@@ -6,16 +6,22 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
-from typing import Optional
+from typing import Optional, Union
 from wordcloud import WordCloud
 
+import config
+from utils.font_registry import configure_matplotlib, plotly_font_family
+from utils.wordcloud_svg import wordcloud_to_svg
+from utils.figure_cache import cached_figure
+from utils.chart_reduction import histogram_bins, sample_points
+
 class Visualizer:
     """시각화 도구 클래스"""
     
     def __init__(self):
         """시각화 도구 초기화"""
-        # 폰트 설정
-        self.font_family = 'Malgun Gothic, Arial, sans-serif'
+        # 폰트 설정 (프로세스 공용 폰트 레지스트리)
+        self.font_family = plotly_font_family()
         
         # 세션 상태 확인 및 초기화
         if 'is_dark_mode' not in st.session_state:
@@ -25,9 +31,8 @@ class Visualizer:
         self.is_dark_mode = st.session_state.get('is_dark_mode', False)
         self._update_theme_properties()
         
-        # Matplotlib 설정
-        plt.rcParams['font.family'] = self.font_family
-        plt.rcParams['axes.unicode_minus'] = False
+        # Matplotlib 설정 (한글 폰트 등록은 프로세스당 한 번)
+        configure_matplotlib()
         
     def _update_theme_properties(self):
         """테마에 따른 속성 업데이트"""
@@ -51,6 +56,14 @@ class Visualizer:
         }
         return sizes.get(size_type, 12)
 
+    def _use_webgl(self, n_elements):
+        """요소(점·선분) 수가 임계값을 넘으면 WebGL 렌더링"""
+        return n_elements > config.WEBGL_POINT_THRESHOLD
+    
+    def _scatter_trace(self, n_elements):
+        """요소 수에 맞는 산점도 트레이스 클래스 (WebGL이면 go.Scattergl)"""
+        return go.Scattergl if self._use_webgl(n_elements) else go.Scatter
+
     def get_current_theme(self):
         """현재 테마 상태 반환"""
         return st.session_state.get('is_dark_mode', False)
@@ -92,6 +105,14 @@ class Visualizer:
                 'color_sequence': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
             }
 
+    @staticmethod
+    def _format_score(value):
+        """차트 표시용 점수 문자열 (정수는 천 단위 구분, 실수 점수는 반올림해서 표시)"""
+        if float(value).is_integer():
+            return f"{int(value):,}"
+        return f"{value:,.2f}" if abs(value) >= 1 else f"{value:.4f}"
+
+    @cached_figure
     def create_keyword_bar_chart(self, keyword_freq, title="키워드 빈도", max_keywords=10, interactive=True):
         """키워드 막대 차트 생성"""
         try:
@@ -124,7 +145,7 @@ class Visualizer:
                 colors.append(color)
             
             # 포맷된 텍스트 생성
-            formatted_frequencies = [f"{freq:,}" for freq in frequencies]
+            formatted_frequencies = [self._format_score(freq) for freq in frequencies]
             
             # 막대 차트 생성
             fig = go.Figure(data=[
@@ -186,6 +207,7 @@ class Visualizer:
             st.error(f"막대 차트 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_keyword_pie_chart(self, keyword_freq, title="키워드 분포", max_keywords=8, interactive=True):
         """키워드 파이 차트 생성"""
         try:
@@ -308,9 +330,18 @@ class Visualizer:
         except Exception as e:
             st.error(f"메트릭 카드 생성 중 오류 발생: {str(e)}")
 
-    def create_wordcloud_plot(self, wordcloud: WordCloud) -> Optional[Figure]:
-        """워드클라우드 Matplotlib 플롯"""
+    def create_wordcloud_plot(self, wordcloud: WordCloud, output: str = 'figure') -> Optional[Union[Figure, str]]:
+        """
+        워드클라우드 플롯
+        
+        Args:
+            wordcloud: generate_wordcloud 결과
+            output: 'figure'면 Matplotlib 그림, 'svg'면 위치 지정 텍스트 요소로 된 SVG 문자열 (Matplotlib 생략)
+        """
         try:
+            if output == 'svg':
+                return wordcloud_to_svg(wordcloud)
+            
             fig, ax = plt.subplots(figsize=(10, 5))
             
             # 테마에 맞는 배경색 설정
@@ -328,18 +359,28 @@ class Visualizer:
             return None
 
     # 추가 기본 메소드들을 여기에 계속 추가할 예정
+    @cached_figure
     def create_view_count_distribution(self, df):
-        """조회수 분포 히스토그램"""
+        """조회수 분포 히스토그램 (구간 집계는 서버에서 NumPy로 계산해 데이터 크기와 무관한 전송량)"""
         try:
-            fig = px.histogram(
-                df, 
-                x='view_count', 
-                title='조회수 분포',
-                nbins=30,
-                color_discrete_sequence=[self.get_theme_colors()['accent']]
-            )
+            starts, ends, counts = histogram_bins(df['view_count'])
+            if not len(counts):
+                return None
+            
+            fig = go.Figure(go.Bar(
+                x=(starts + ends) / 2,
+                y=counts,
+                width=ends - starts,
+                customdata=np.column_stack([starts, ends]),
+                marker=dict(color=self.get_theme_colors()['accent']),
+                hovertemplate="조회수 %{customdata[0]:,.0f} ~ %{customdata[1]:,.0f}<br>동영상 수: %{y:,}<extra></extra>"
+            ))
             
             fig.update_layout(
+                title='조회수 분포',
+                xaxis_title='view_count',
+                yaxis_title='count',
+                bargap=0,
                 template=self.get_theme_colors()['plotly_template'],
                 height=400
             )
@@ -349,6 +390,7 @@ class Visualizer:
             st.error(f"조회수 분포 차트 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_engagement_scatter(self, df):
         """좋아요 대비 댓글 산점도 생성"""
         try:
@@ -365,14 +407,21 @@ class Visualizer:
             if df_clean.empty:
                 return None
             
+            # 점 예산을 넘으면 카테고리별 층화 표본으로 축소
+            df_plot = sample_points(df_clean)
+            title = "좋아요 vs 댓글 수 분포"
+            if len(df_plot) < len(df_clean):
+                title += f" (표본 {len(df_plot):,}/{len(df_clean):,}개)"
+            
             # 산점도 생성
             fig = px.scatter(
-                df_clean,
+                df_plot,
                 x='like_count',
                 y='comment_count',
                 color='category_id',
                 hover_name='title',
-                title="좋아요 vs 댓글 수 분포",
+                title=title,
+                render_mode='webgl' if self._use_webgl(len(df_plot)) else 'svg',
                 labels={
                     'like_count': '좋아요 수',
                     'comment_count': '댓글 수',
@@ -521,6 +570,7 @@ class Visualizer:
             st.error(f"진행 상황 차트 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_animated_bar_chart(self, keyword_freq, title="애니메이션 키워드 차트", max_keywords=15):
         """애니메이션 막대 차트 생성"""
         try:
@@ -598,6 +648,7 @@ class Visualizer:
             st.error(f"애니메이션 차트 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_keyword_treemap(self, keyword_freq, max_keywords=20):
         """키워드 트리맵 생성"""
         try:
@@ -659,6 +710,7 @@ class Visualizer:
             st.error(f"트리맵 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_category_analysis(self, df):
         """카테고리 분석 차트 생성"""
         try:
@@ -751,6 +803,7 @@ class Visualizer:
             st.error(f"카운터 차트 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_3d_scatter_plot(self, df, title="3D 성과 분석"):
         """3D 산점도 생성 (조회수, 좋아요, 댓글)"""
         try:
@@ -767,8 +820,13 @@ class Visualizer:
             if df_clean.empty:
                 return None
             
+            # 점 예산을 넘으면 카테고리별 층화 표본으로 축소 (조회수 상위 동영상은 항상 포함)
+            n_total = len(df_clean)
+            df_clean = sample_points(df_clean, config.CHART_3D_MAX_POINTS).copy()
+            if len(df_clean) < n_total:
+                title = f"{title} (표본 {len(df_clean):,}/{n_total:,}개)"
+            
             # 카테고리 이름 매핑
-            import config
             df_clean['category_name'] = df_clean['category_id'].map(
                 lambda x: config.CATEGORY_MAPPING.get(x, f"카테고리 {x}")
             )
@@ -844,6 +902,7 @@ class Visualizer:
             st.error(f"3D 산점도 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_trend_timeline(self, df):
         """시간별 트렌드 타임라인 생성"""
         try:
@@ -927,6 +986,7 @@ class Visualizer:
             st.error(f"타임라인 차트 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_correlation_heatmap(self, df):
         """상관관계 히트맵 생성"""
         try:
@@ -1008,6 +1068,7 @@ class Visualizer:
             st.error(f"상관관계 히트맵 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_channel_comparison_chart(self, channel_stats, metric='총_조회수', title="채널 비교"):
         """채널 비교 막대 차트 생성"""
         try:
@@ -1083,6 +1144,7 @@ class Visualizer:
 
 
 
+    @cached_figure
     def create_channel_category_distribution(self, channel_videos, title="채널별 카테고리 분포"):
         """채널별 카테고리 분포 차트 생성"""
         try:
@@ -1152,6 +1214,7 @@ class Visualizer:
 
 
 
+    @cached_figure
     def create_keyword_network_graph(self, network_data, title="키워드 네트워크"):
         """키워드 네트워크 그래프 생성"""
         try:
@@ -1178,15 +1241,16 @@ class Visualizer:
                 y = radius * math.sin(angle)
                 node_positions[node['id']] = (x, y)
             
-            # 엣지 트레이스 생성
-            edge_x = []
-            edge_y = []
-            
-            for edge in edges:
-                x0, y0 = node_positions[edge['source']]
-                x1, y1 = node_positions[edge['target']]
-                edge_x.extend([x0, x1, None])
-                edge_y.extend([y0, y1, None])
+            # 엣지 트레이스 생성 (모든 엣지를 NaN 구분자로 이은 트레이스 하나)
+            node_index = {node_id: i for i, node_id in enumerate(node_positions)}
+            positions = np.array(list(node_positions.values()), dtype=float)
+            sources = np.array([node_index[edge['source']] for edge in edges])
+            targets = np.array([node_index[edge['target']] for edge in edges])
+            segments = np.full((len(edges), 3, 2), np.nan)
+            segments[:, 0] = positions[sources]
+            segments[:, 1] = positions[targets]
+            edge_x = segments[:, :, 0].ravel()
+            edge_y = segments[:, :, 1].ravel()
             
             # 노드 트레이스 생성
             node_x = []
@@ -1206,8 +1270,8 @@ class Visualizer:
             # 네트워크 그래프 생성
             fig = go.Figure()
             
-            # 엣지 추가
-            fig.add_trace(go.Scatter(
+            # 엣지 추가 (엣지·노드가 많으면 WebGL 트레이스)
+            fig.add_trace(self._scatter_trace(len(edges))(
                 x=edge_x, y=edge_y,
                 line=dict(width=1, color=theme_colors['border']),
                 hoverinfo='none',
@@ -1216,7 +1280,7 @@ class Visualizer:
             ))
             
             # 노드 추가
-            fig.add_trace(go.Scatter(
+            fig.add_trace(self._scatter_trace(len(nodes))(
                 x=node_x, y=node_y,
                 mode='markers+text',
                 marker=dict(
@@ -1265,6 +1329,7 @@ class Visualizer:
             st.error(f"키워드 네트워크 그래프 생성 중 오류 발생: {str(e)}")
             return None
 
+    @cached_figure
     def create_keyword_cluster_chart(self, clusters, title="키워드 클러스터"):
         """키워드 클러스터 차트 생성"""
         try:
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+
+def frequency_hash(keywords_freq):
+    """빈도표 내용 해시 (같은 키워드·빈도·순서면 같은 값)"""
+    payload = json.dumps(list(keywords_freq.items()), ensure_ascii=False, default=float)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class WordcloudRenderCache:
+    """
+    워드클라우드 렌더링 결과(이미지 바이트) LRU 캐시
+
+    키는 (빈도표 해시, 너비, 높이, 배경색, 컬러맵, 형식)이며 프로세스 안의 모든 세션이 공유합니다.
+    큰 캔버스는 prerender로 백그라운드 스레드 하나에서 미리 그려 둘 수 있습니다.
+    """
+
+    def __init__(self, max_entries=None):
+        """
+        Args:
+            max_entries (int): 보관할 최대 이미지 수 (기본값: config.WORDCLOUD_CACHE_SIZE)
+        """
+        self.max_entries = max_entries or config.WORDCLOUD_CACHE_SIZE
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @staticmethod
+    def make_key(keywords_freq, width, height, background_color, colormap, image_format='png'):
+        """캐시 키 생성"""
+        return (frequency_hash(keywords_freq), int(width), int(height), background_color, colormap, image_format)
+
+    def get(self, key):
+        """캐시된 이미지 (없으면 None)"""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        """이미지 저장 (가장 오래 쓰지 않은 항목부터 제거)"""
+        if image is None:
+            return
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """모든 이미지 삭제 (진행 중인 백그라운드 렌더링은 끝나면 다시 저장됨)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_render(self, key, render):
+        """
+        캐시된 이미지를 반환하고, 없으면 렌더링 후 저장
+
+        같은 키를 백그라운드에서 그리는 중이면 새로 그리지 않고 그 결과를 기다립니다.
+
+        Args:
+            key (tuple): make_key 결과
+            render (callable): 이미지 바이트를 반환하는 함수
+
+        Returns:
+            bytes: 이미지 (렌더링 실패 시 None)
+        """
+        image = self.get(key)
+        if image is not None:
+            return image
+
+        with self._lock:
+            future = self._pending.get(key)
+        if future is not None:
+            return future.result()
+
+        image = render()
+        self.put(key, image)
+        return image
+
+    def prerender(self, key, render):
+        """
+        백그라운드 스레드에서 미리 렌더링 (이미 있거나 진행 중이면 무시)
+
+        Returns:
+            bool: 이미지가 이미 준비되어 있으면 True
+        """
+        with self._lock:
+            if key in self._entries:
+                return True
+            if key in self._pending:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='wordcloud')
+            future = self._executor.submit(self._render_pending, key, render)
+            self._pending[key] = future
+        return False
+
+    def _render_pending(self, key, render):
+        """백그라운드 렌더링 작업 - 결과를 캐시에 넣고 진행 목록에서 제거"""
+        image = None
+        try:
+            image = render()
+            self.put(key, image)
+        except Exception as e:
+            print(f"워드클라우드 백그라운드 렌더링 실패: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        return image
+
+
+# 프로세스 공용 캐시 (모든 세션의 TextProcessor가 공유)
+render_cache = WordcloudRenderCache()
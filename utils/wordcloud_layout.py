@@ -0,0 +1,176 @@
+from functools import lru_cache
+from operator import itemgetter
+from random import Random
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import config
+
+
+@lru_cache(maxsize=256)
+def load_font(font_path, font_size):
+    """크기별 폰트 객체 (프로세스 공용)"""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@lru_cache(maxsize=config.WORDCLOUD_GLYPH_CACHE_SIZE)
+def glyph_mask(font_path, word, font_size, orientation=None):
+    """
+    단어를 (0, 0)에 그렸을 때 칠해지는 픽셀 마스크 - (폰트, 단어, 크기, 방향)별로 한 번만 렌더링
+
+    WordCloud.to_image와 같은 방식(기본 앵커, TransposedFont)으로 그리므로
+    배치 결과를 그대로 라이브러리로 렌더링해도 마스크와 같은 픽셀이 칠해집니다.
+
+    Returns:
+        np.ndarray: (높이 × 너비) 불리언 배열
+    """
+    font = ImageFont.TransposedFont(load_font(font_path, font_size), orientation=orientation)
+    right, bottom = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), word, font=font)[2:]
+    image = Image.new('L', (max(int(right), 1), max(int(bottom), 1)))
+    ImageDraw.Draw(image).text((0, 0), word, fill=255, font=font)
+    mask = np.asarray(image) > 0
+    mask.flags.writeable = False
+    return mask
+
+
+class OccupancyGrid:
+    """
+    캔버스 점유 격자 - 픽셀 점유 배열과 셀 단위로 줄인 적분 이미지(누적합)
+
+    빈 자리 검색은 셀 격자의 적분 이미지에서 상자 크기 창의 합을 모든 위치에 대해
+    한 번에(NumPy 배열 연산) 계산하고, 합이 0인 위치 중 하나를 무작위로 고릅니다.
+    """
+
+    def __init__(self, height, width, cell=None):
+        """
+        Args:
+            height, width (int): 캔버스 크기 (픽셀)
+            cell (int): 격자 셀 크기 (픽셀, 기본값: config.WORDCLOUD_LAYOUT_CELL)
+        """
+        self.height, self.width = height, width
+        self.cell = max(int(cell or config.WORDCLOUD_LAYOUT_CELL), 1)
+        self.rows = -(-height // self.cell)
+        self.cols = -(-width // self.cell)
+        self.pixels = np.zeros((self.rows * self.cell, self.cols * self.cell), dtype=bool)
+        # 캔버스 밖(셀 크기로 올림한 가장자리)은 점유된 것으로 처리
+        self.pixels[height:, :] = True
+        self.pixels[:, width:] = True
+        self.cells = self._reduce(self.pixels)
+        self.integral = self._integrate(self.cells)
+
+    def _reduce(self, pixels):
+        """픽셀 배열을 셀 단위로 축소 (셀 안에 점유 픽셀이 하나라도 있으면 점유)"""
+        rows, cols = pixels.shape[0] // self.cell, pixels.shape[1] // self.cell
+        return pixels.reshape(rows, self.cell, cols, self.cell).any(axis=(1, 3))
+
+    @staticmethod
+    def _integrate(cells):
+        """셀 격자의 적분 이미지 (앞쪽에 0 행·열을 붙인 2차원 누적합)"""
+        integral = np.zeros((cells.shape[0] + 1, cells.shape[1] + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(cells, axis=0, dtype=np.int32), axis=1, out=integral[1:, 1:])
+        return integral
+
+    def sample_position(self, box_height, box_width, random_state):
+        """
+        상자(픽셀)가 들어갈 빈 자리 중 하나를 무작위로 선택
+
+        Returns:
+            tuple: 상자 왼쪽 위 (행, 열) 픽셀 좌표 (빈 자리가 없으면 None)
+        """
+        rows = -(-box_height // self.cell)
+        cols = -(-box_width // self.cell)
+        if rows > self.rows or cols > self.cols:
+            return None
+        integral = self.integral
+        window = (integral[rows:, cols:] - integral[:-rows, cols:]
+                  - integral[rows:, :-cols] + integral[:-rows, :-cols])
+        free = np.flatnonzero(window == 0)
+        if not len(free):
+            return None
+        row, col = divmod(int(free[random_state.randint(0, len(free) - 1)]), window.shape[1])
+        return row * self.cell, col * self.cell
+
+    def place(self, mask, row, col):
+        """마스크 픽셀을 점유로 표시하고 해당 셀 구간의 적분 이미지 갱신"""
+        height, width = mask.shape
+        self.pixels[row:row + height, col:col + width] |= mask[:self.pixels.shape[0] - row,
+                                                               :self.pixels.shape[1] - col]
+        top, left = row // self.cell, col // self.cell
+        bottom = -(-(row + height) // self.cell)
+        right = -(-(col + width) // self.cell)
+        block = self.pixels[top * self.cell:bottom * self.cell, left * self.cell:right * self.cell]
+        self.cells[top:bottom, left:right] = self._reduce(block)
+        # 바뀐 셀보다 아래·오른쪽 구간만 누적합 재계산
+        self.integral[top + 1:, left + 1:] = (
+            np.cumsum(np.cumsum(self.cells[top:, left:], axis=0, dtype=np.int32), axis=1, dtype=np.int32)
+            + self.integral[top:top + 1, left + 1:]
+            + self.integral[top + 1:, left:left + 1]
+            - self.integral[top, left]
+        )
+
+
+def generate_layout(wordcloud, frequencies):
+    """
+    WordCloud.generate_from_frequencies와 같은 규칙으로 단어를 배치하고 wordcloud.layout_을 채움
+
+    글꼴 크기 결정(relative_scaling), 방향 선택(prefer_horizontal), 자리가 없을 때 회전 후
+    font_step만큼 축소하는 순서는 라이브러리와 같고, 빈 자리 검색과 점유 갱신만
+    OccupancyGrid로 대체합니다. 결과는 to_image / to_array / recolor에 그대로 쓸 수 있습니다.
+
+    Args:
+        wordcloud (WordCloud): 설정을 마친 WordCloud (mask·repeat·max_font_size=None 미지원)
+        frequencies (dict): {단어: 빈도}
+
+    Returns:
+        WordCloud: layout_과 words_가 채워진 같은 객체
+    """
+    frequencies = sorted(frequencies.items(), key=itemgetter(1), reverse=True)[:wordcloud.max_words]
+    if not frequencies:
+        raise ValueError("워드클라우드를 그릴 단어가 없습니다.")
+    max_frequency = float(frequencies[0][1])
+    frequencies = [(word, freq / max_frequency) for word, freq in frequencies]
+    wordcloud.words_ = dict(frequencies)
+
+    random_state = wordcloud.random_state if wordcloud.random_state is not None else Random()
+    grid = OccupancyGrid(wordcloud.height, wordcloud.width)
+    margin = wordcloud.margin
+    font_path = wordcloud.font_path
+    font_size = wordcloud.max_font_size
+    last_freq = 1.
+    layout = []
+
+    for word, freq in frequencies:
+        if freq == 0:
+            continue
+        rs = wordcloud.relative_scaling
+        if rs != 0:
+            font_size = int(round((rs * (freq / float(last_freq)) + (1 - rs)) * font_size))
+        orientation = None if random_state.random() < wordcloud.prefer_horizontal else Image.ROTATE_90
+        tried_other_orientation = False
+        position = None
+        while font_size >= wordcloud.min_font_size:
+            mask = glyph_mask(font_path, word, font_size, orientation)
+            position = grid.sample_position(mask.shape[0] + margin, mask.shape[1] + margin, random_state)
+            if position is not None:
+                break
+            if not tried_other_orientation and wordcloud.prefer_horizontal < 1:
+                orientation = Image.ROTATE_90
+                tried_other_orientation = True
+            else:
+                font_size -= wordcloud.font_step
+                orientation = None
+
+        if position is None:
+            # 더 이상 배치할 자리가 없음
+            break
+
+        x, y = position[0] + margin // 2, position[1] + margin // 2
+        grid.place(mask, x, y)
+        color = wordcloud.color_func(word, font_size=font_size, position=(x, y), orientation=orientation,
+                                     random_state=random_state, font_path=font_path)
+        layout.append(((word, freq), font_size, (x, y), orientation, color))
+        last_freq = freq
+
+    wordcloud.layout_ = layout
+    return wordcloud
@@ -0,0 +1,65 @@
+from xml.sax.saxutils import escape, quoteattr
+
+from PIL import Image
+
+from utils.font_registry import PLOTLY_FALLBACK_FAMILIES
+from utils.wordcloud_layout import load_font
+
+
+def _number(value):
+    """SVG 좌표 문자열 (소수 첫째 자리까지, 불필요한 0 제거)"""
+    return f"{value:.1f}".rstrip('0').rstrip('.')
+
+
+def wordcloud_to_svg(wordcloud, font_family=None):
+    """
+    배치가 끝난 WordCloud를 위치 지정 <text> 요소로 이루어진 SVG 문자열로 변환
+
+    래스터 이미지나 Matplotlib 그림 없이 layout_만으로 만들므로 용량이 작고 확대해도 선명합니다.
+    좌표 계산은 WordCloud.to_svg와 같고(배치에 쓴 폰트의 메트릭 기준), 단어는 XML 이스케이프하며
+    viewBox를 지정해 표시 영역 너비에 맞춰 늘어나도록 합니다. 브라우저에 배치 폰트가 없으면
+    font-family의 대체 글꼴로 그려지므로 글자 폭이 조금 다를 수 있습니다.
+
+    Args:
+        wordcloud (WordCloud): generate_wordcloud 결과 (layout_이 있어야 함)
+        font_family (str): CSS font-family 값 (기본값: 배치 폰트 이름 + 한글 대체 글꼴)
+
+    Returns:
+        str: SVG 문서
+    """
+    scale = wordcloud.scale
+    width, height = wordcloud.width * scale, wordcloud.height * scale
+    font_path = wordcloud.font_path
+
+    if font_family is None:
+        family = load_font(font_path, 12).getname()[0]
+        font_family = ', '.join(
+            f"'{name}'" if ' ' in name else name
+            for name in dict.fromkeys([family] + PLOTLY_FALLBACK_FAMILIES)
+        )
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family={quoteattr(font_family)}>'
+    ]
+    if wordcloud.background_color is not None:
+        parts.append(f'<rect width="100%" height="100%" fill={quoteattr(str(wordcloud.background_color))}/>')
+
+    for (word, _), font_size, (y, x), orientation, color in wordcloud.layout_:
+        x *= scale
+        y *= scale
+        size = int(font_size * scale)
+        font = load_font(font_path, size)
+        (size_x, _), (offset_x, offset_y) = font.font.getsize(word)
+        ascent, _ = font.getmetrics()
+        min_x = -offset_x
+        max_x = size_x - offset_x
+        max_y = ascent - offset_y
+        if orientation == Image.ROTATE_90:
+            transform = f'translate({_number(x + max_y)},{_number(y + max_x - min_x)}) rotate(-90)'
+        else:
+            transform = f'translate({_number(x + min_x)},{_number(y + max_y)})'
+        parts.append(f'<text transform="{transform}" font-size="{size}" fill={quoteattr(color)}>{escape(word)}</text>')
+
+    parts.append('</svg>')
+    return ''.join(parts)